@@ -0,0 +1,114 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Measure parameter sweeps of a small circuit, evaluated either by calling the compiled program
+once per parameter vector or in a single call via ``QJIT.batch``. The compilation of the batched
+program is measured separately from its runtime. Each sweep size is measured in a fresh process.
+
+Example:
+
+    $ python3 microbenchmarks/batch_sweep.py --npoints 100 1000 10000 --nparams 4
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import multiprocessing
+import sys
+from argparse import ArgumentParser
+from json import dump as json_dump
+from time import perf_counter
+
+
+def build_program(nparams: int):
+    """Build a ``qjit`` circuit with one rotation per parameter."""
+    import pennylane as qml
+
+    from catalyst import qjit
+
+    @qjit(persistent_context=True)
+    @qml.qnode(qml.device("lightning.qubit", wires=nparams))
+    def circuit(params):
+        for i in range(nparams):
+            qml.RX(params[i], wires=i)
+        for i in range(nparams - 1):
+            qml.CNOT(wires=[i, i + 1])
+        return qml.expval(qml.PauliZ(nparams - 1))
+
+    return circuit
+
+
+def measure(npoints: int, nparams: int) -> dict:
+    """Measure a sweep over random parameter vectors in the current process."""
+    import numpy as np
+
+    circuit = build_program(nparams)
+    points = np.random.default_rng(0).uniform(0, np.pi, (npoints, nparams))
+    circuit(points[0])
+
+    start = perf_counter()
+    looped = [circuit(point) for point in points]
+    loop_sec = perf_counter() - start
+
+    start = perf_counter()
+    circuit.batch(points)
+    batch_compile_sec = perf_counter() - start
+
+    start = perf_counter()
+    batched = circuit.batch(points)
+    batch_sec = perf_counter() - start
+
+    assert np.allclose(looped, batched)
+    return {
+        "npoints": npoints,
+        "nparams": nparams,
+        "loop_sec": loop_sec,
+        "batch_compile_sec": batch_compile_sec,
+        "batch_sec": batch_sec,
+    }
+
+
+def main():
+    """Run the measurements and report them as a table or as JSON."""
+    # fmt: off
+    ap = ArgumentParser(prog="python3 microbenchmarks/batch_sweep.py")
+    ap.add_argument("--npoints", type=int, nargs="+", default=[100, 1000, 10000],
+                    help="Numbers of parameter vectors per sweep (default - 100 1000 10000)")
+    ap.add_argument("--nparams", type=int, default=4,
+                    help="Number of parameters and wires of the circuit (default - 4)")
+    ap.add_argument("-o", "--output", type=str, default=None, metavar="FILE.json",
+                    help="Output *.json filename (default - print a table)")
+    # fmt: on
+    a = ap.parse_args()
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for npoints in a.npoints:
+        with ctx.Pool(1) as pool:
+            results.append(pool.apply(measure, (npoints, a.nparams)))
+
+    if a.output is not None:
+        with open(a.output, "w", encoding="utf-8") as f:
+            json_dump(results, f, indent=4)
+        return
+
+    print(f"{'npoints':>8} {'loop [s]':>9} {'compile [s]':>12} {'batch [s]':>10} {'speedup':>8}")
+    for r in results:
+        speedup = r["loop_sec"] / r["batch_sec"]
+        print(
+            f"{r['npoints']:>8} {r['loop_sec']:>9.3f} {r['batch_compile_sec']:>12.3f} "
+            f"{r['batch_sec']:>10.3f} {speedup:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Measure the Python overhead of calling compiled programs, for a growing number of arguments.
+The conversion of the arguments to memref descriptors is measured separately, via the generic
+conversion and via the marshalling plan of the compiled function, along with the complete call of
+the ``qjit`` object. Each configuration is measured in a fresh process.
+
+Example:
+
+    $ python3 microbenchmarks/call_overhead.py --nargs 1 4 16 --rank 1
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import multiprocessing
+import sys
+from argparse import ArgumentParser
+from json import dump as json_dump
+from time import perf_counter
+
+
+def build_program(nargs: int, rank: int):
+    """Build a trivial ``qjit`` program taking a list of arrays, along with its arguments, such
+    that the runtime of the program itself is negligible."""
+    import jax.numpy as jnp
+    import numpy as np
+
+    from catalyst import qjit
+
+    @qjit(persistent_context=True)
+    def program(arrays):
+        return jnp.sum(jnp.stack([jnp.sum(array) for array in arrays]))
+
+    args = ([np.ones((4,) * rank) for _ in range(nargs)],)
+    return program, args
+
+
+def time_per_call(fn, nrun: int) -> float:
+    """Measure the best time per call of a function, in seconds."""
+    timings = []
+    for _ in range(5):
+        start = perf_counter()
+        for _ in range(nrun):
+            fn()
+        timings.append((perf_counter() - start) / nrun)
+    return min(timings)
+
+
+def measure(nargs: int, rank: int, nrun: int) -> dict:
+    """Measure the overhead of calling a program in the current process."""
+    import numpy as np
+
+    program, args = build_program(nargs, rank)
+    program(*args)
+
+    compiled_fn = program.compiled_function
+    arrays = [np.asarray(array) for array in args[0]]
+    plan = compiled_fn.marshalling_plan
+
+    return {
+        "nargs": nargs,
+        "rank": rank,
+        "generic_marshal_sec": time_per_call(
+            lambda: compiled_fn.args_to_memref_descs(compiled_fn.restype, args), nrun
+        ),
+        "plan_marshal_sec": time_per_call(lambda: plan.fill(arrays), nrun),
+        "call_sec": time_per_call(lambda: program(*args), nrun),
+    }
+
+
+def main():
+    """Run the measurements and report them as a table or as JSON."""
+    # fmt: off
+    ap = ArgumentParser(prog="python3 microbenchmarks/call_overhead.py")
+    ap.add_argument("--nargs", type=int, nargs="+", default=[1, 4, 16, 64],
+                    help="Numbers of array arguments to measure (default - 1 4 16 64)")
+    ap.add_argument("--rank", type=int, default=1,
+                    help="Rank of the array arguments (default - 1)")
+    ap.add_argument("-r", "--nrun", type=int, default=1000, metavar="INT",
+                    help="Number of calls per timing (default - 1000)")
+    ap.add_argument("-o", "--output", type=str, default=None, metavar="FILE.json",
+                    help="Output *.json filename (default - print a table)")
+    # fmt: on
+    a = ap.parse_args()
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for nargs in a.nargs:
+        with ctx.Pool(1) as pool:
+            results.append(pool.apply(measure, (nargs, a.rank, a.nrun)))
+
+    if a.output is not None:
+        with open(a.output, "w", encoding="utf-8") as f:
+            json_dump(results, f, indent=4)
+        return
+
+    print(f"{'nargs':>6} {'generic [us]':>13} {'plan [us]':>10} {'call [us]':>10}")
+    for r in results:
+        generic_us, plan_us = r["generic_marshal_sec"] * 1e6, r["plan_marshal_sec"] * 1e6
+        print(f"{r['nargs']:>6} {generic_us:>13.2f} {plan_us:>10.2f} {r['call_sec'] * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Measure the startup time of the ``catalyst`` package via ``python -X importtime``. Each
+statement is run in a fresh interpreter, such that no module is imported ahead of the measurement.
+Besides the total import time, the cumulative time of the heaviest dependencies is reported.
+
+Example:
+
+    $ python3 microbenchmarks/import_time.py --scenarios package load qjit
+"""
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+from json import dump as json_dump
+
+SCENARIOS = {
+    "package": "import catalyst",
+    "load": "import catalyst; catalyst.load",
+    "qjit": "from catalyst import qjit",
+}
+
+PACKAGES = ["catalyst", "jax", "jaxlib", "pennylane", "malt", "mlir_quantum"]
+
+
+def parse_import_times(report: str) -> dict:
+    """Parse the report of ``-X importtime`` into the total time and the cumulative time of the
+    top-level packages, in seconds."""
+    total_us = 0
+    packages_us = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        module = name.strip()
+        # Nested imports are indented below the module importing them.
+        if name == f" {module}":
+            total_us += int(cumulative)
+        if module in PACKAGES and module not in packages_us:
+            packages_us[module] = int(cumulative)
+
+    return {
+        "total_sec": total_us / 1e6,
+        "packages_sec": {module: us / 1e6 for module, us in packages_us.items()},
+    }
+
+
+def measure(scenario: str) -> dict:
+    """Measure the import time of a scenario in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCENARIOS[scenario]],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {"scenario": scenario, **parse_import_times(output.stderr)}
+
+
+def main():
+    """Run the measurements and report them as a table or as JSON."""
+    # fmt: off
+    ap = ArgumentParser(prog="python3 microbenchmarks/import_time.py")
+    ap.add_argument("--scenarios", type=str, nargs="+", choices=list(SCENARIOS),
+                    default=list(SCENARIOS), help="Statements to measure (default - all)")
+    ap.add_argument("-n", "--niter", type=int, default=5, metavar="INT",
+                    help="Number of trials per statement (default - 5)")
+    ap.add_argument("-o", "--output", type=str, default=None, metavar="FILE.json",
+                    help="Output *.json filename (default - print a table)")
+    # fmt: on
+    a = ap.parse_args()
+
+    results = [measure(scenario) for scenario in a.scenarios for _ in range(a.niter)]
+
+    if a.output is not None:
+        with open(a.output, "w", encoding="utf-8") as f:
+            json_dump(results, f, indent=4)
+        return
+
+    print(f"{'scenario':>10} {'total [ms]':>11}" + "".join(f" {p + ' [ms]':>17}" for p in PACKAGES))
+    for scenario in a.scenarios:
+        runs = [r for r in results if r["scenario"] == scenario]
+        # The fastest trial is the least disturbed by the file system cache and other processes.
+        best = min(runs, key=lambda r: r["total_sec"])
+        row = f"{scenario:>10} {best['total_sec'] * 1000:>11.1f}"
+        for package in PACKAGES:
+            sec = best["packages_sec"].get(package)
+            row += f" {'-':>17}" if sec is None else f" {sec * 1000:>17.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
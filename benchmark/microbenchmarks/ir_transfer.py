@@ -0,0 +1,146 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Measure the cost of handing MLIR modules to the compiler driver as text versus bytecode, for
+programs of increasing IR size. Each configuration is measured in a fresh process, such that the
+peak memory reported reflects the compilation only.
+
+Example:
+
+    $ python3 microbenchmarks/ir_transfer.py --kind constant --sizes 1000 100000 1000000
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import multiprocessing
+import resource
+import sys
+from argparse import ArgumentParser
+from json import dump as json_dump
+from time import perf_counter
+
+# The transfer pipeline runs a single cheap pass, which isolates the print/parse round trip.
+TRANSFER_PIPELINES = [("transfer", ["canonicalize"])]
+
+
+def build_module(kind: str, size: int):
+    """Build an MLIR module whose IR size grows with ``size``."""
+    import jax.numpy as jnp
+    import numpy as np
+    import pennylane as qml
+
+    from catalyst import qjit
+
+    if kind == "constant":
+        # Large dense constants, as found in programs using ``QubitUnitary``.
+        constant = np.random.default_rng(42).random(size)
+
+        @qjit(target="mlir")
+        @qml.qnode(qml.device("lightning.qubit", wires=1))
+        def program(x: float):
+            qml.RX(x * jnp.sum(jnp.asarray(constant)), wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+    elif kind == "unrolled":
+        # Straight-line code, as produced by unrolled Python loops.
+        @qjit(target="mlir")
+        @qml.qnode(qml.device("lightning.qubit", wires=1))
+        def program(x: float):
+            for i in range(size // 10):
+                qml.RX(x * i, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+    else:
+        raise ValueError(f"Unknown kind of program '{kind}'")
+
+    return program.mlir_module
+
+
+def measure(kind: str, size: int, fmt: str, stage: str) -> dict:
+    """Measure the serialization and compiler driver time of a module in the current process."""
+    from catalyst.compiler import CompileOptions, Compiler
+    from catalyst.utils.filesystem import WorkspaceManager
+
+    module = build_module(kind, size)
+    module_name = str(module.operation.attributes["sym_name"]).replace('"', "")
+    if stage == "transfer":
+        options = CompileOptions(pipelines=TRANSFER_PIPELINES, lower_to_llvm=False)
+    else:
+        options = CompileOptions()
+    workspace = WorkspaceManager.get_or_create_workspace("ir_transfer")
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = perf_counter()
+    ir = module.operation.get_asm(binary=fmt == "bytecode", assume_verified=True)
+    serialized = perf_counter()
+    Compiler(options).run_from_ir(ir, module_name, workspace)
+    end = perf_counter()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {
+        "kind": kind,
+        "size": size,
+        "format": fmt,
+        "stage": stage,
+        "ir_bytes": len(ir),
+        "serialize_sec": serialized - start,
+        "driver_sec": end - serialized,
+        "total_sec": end - start,
+        "peak_rss_increase_kb": rss_after - rss_before,
+    }
+
+
+def main():
+    """Run the measurements and report them as a table or as JSON."""
+    # fmt: off
+    ap = ArgumentParser(prog="python3 microbenchmarks/ir_transfer.py")
+    ap.add_argument("--kind", choices=["constant", "unrolled"], default="constant",
+                    help="Kind of program to grow (default - constant)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000, 1000000],
+                    help="Program sizes to measure")
+    ap.add_argument("--stage", choices=["transfer", "full"], default="transfer",
+                    help="Measure only the print/parse round trip or the full compilation "
+                    "(default - transfer)")
+    ap.add_argument("-n", "--niter", type=int, default=3, metavar="INT",
+                    help="Number of measurement trials (default - 3)")
+    ap.add_argument("-o", "--output", type=str, default=None, metavar="FILE.json",
+                    help="Output *.json filename (default - print a table)")
+    # fmt: on
+    a = ap.parse_args()
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for size in a.sizes:
+        for fmt in ["text", "bytecode"]:
+            for _ in range(a.niter):
+                with ctx.Pool(1) as pool:
+                    results.append(pool.apply(measure, (a.kind, size, fmt, a.stage)))
+
+    if a.output is not None:
+        with open(a.output, "w", encoding="utf-8") as f:
+            json_dump(results, f, indent=4)
+        return
+
+    print(f"{'size':>10} {'format':>9} {'IR bytes':>12} {'total [s]':>10} {'peak RSS [MB]':>14}")
+    for size in a.sizes:
+        for fmt in ["text", "bytecode"]:
+            runs = [r for r in results if r["size"] == size and r["format"] == fmt]
+            best = min(runs, key=lambda r: r["total_sec"])
+            print(
+                f"{size:>10} {fmt:>9} {best['ir_bytes']:>12} {best['total_sec']:>10.4f} "
+                f"{best['peak_rss_increase_kb'] / 1024:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
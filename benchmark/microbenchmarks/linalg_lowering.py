@@ -0,0 +1,137 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Compare the lowerings of linear algebra operations selected via ``qjit(linalg_lowering=...)``
+on classical-heavy programs. Each configuration is compiled in a fresh process, such that no
+compiler state is shared between the measurements.
+
+Example:
+
+    $ python3 microbenchmarks/linalg_lowering.py --kind kernel --sizes 64 256 1024
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import multiprocessing
+import sys
+from argparse import ArgumentParser
+from json import dump as json_dump
+from time import perf_counter
+
+LOWERINGS = ["loops", "vectorize", "parallel"]
+
+
+def build_program(kind: str, size: int, linalg_lowering: str, target_cpu: str):
+    """Build a ``qjit`` program for the given lowering, along with its arguments."""
+    import jax.numpy as jnp
+    import numpy as np
+
+    from catalyst import qjit
+
+    rng = np.random.default_rng(42)
+
+    if kind == "kernel":
+        # Gaussian kernel matrix of a data set, as used by quantum kernel methods.
+        @qjit(linalg_lowering=linalg_lowering, target_cpu=target_cpu)
+        def program(x):
+            sq_norms = jnp.sum(x * x, axis=1)
+            sq_dists = sq_norms[:, None] + sq_norms[None, :] - 2 * x @ x.T
+            return jnp.exp(-0.5 * sq_dists)
+
+        args = (rng.random((size, 16)),)
+
+    elif kind == "coefficients":
+        # Elementwise processing and reduction of Hamiltonian coefficients.
+        @qjit(linalg_lowering=linalg_lowering, target_cpu=target_cpu)
+        def program(coeffs, params):
+            scaled = jnp.cos(params) * coeffs + jnp.sin(params) ** 2
+            return jnp.sum(jnp.abs(scaled)), scaled / jnp.linalg.norm(scaled)
+
+        args = (rng.random(size * size), rng.random(size * size))
+
+    else:
+        raise ValueError(f"Unknown kind of program '{kind}'")
+
+    return program, args
+
+
+def measure(kind: str, size: int, linalg_lowering: str, target_cpu: str, nrun: int) -> dict:
+    """Measure the compile time and the runtime of a program in the current process."""
+    program, args = build_program(kind, size, linalg_lowering, target_cpu)
+
+    start = perf_counter()
+    program.jit_compile(args)
+    compiled = perf_counter()
+
+    runtimes = []
+    for _ in range(nrun):
+        run_start = perf_counter()
+        program(*args)
+        runtimes.append(perf_counter() - run_start)
+
+    return {
+        "kind": kind,
+        "size": size,
+        "linalg_lowering": linalg_lowering,
+        "target_cpu": target_cpu,
+        "compile_sec": compiled - start,
+        "run_sec": min(runtimes),
+    }
+
+
+def main():
+    """Run the measurements and report them as a table or as JSON."""
+    # fmt: off
+    ap = ArgumentParser(prog="python3 microbenchmarks/linalg_lowering.py")
+    ap.add_argument("--kind", choices=["kernel", "coefficients"], default="kernel",
+                    help="Kind of program to compile (default - kernel)")
+    ap.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024],
+                    help="Problem sizes to measure")
+    ap.add_argument("--lowerings", type=str, nargs="+", choices=LOWERINGS, default=LOWERINGS,
+                    help="Lowerings to measure (default - all)")
+    ap.add_argument("--target-cpu", type=str, default=None,
+                    help="CPU to generate code for, e.g. 'native' (default - generic CPU)")
+    ap.add_argument("-n", "--niter", type=int, default=3, metavar="INT",
+                    help="Number of compilation trials (default - 3)")
+    ap.add_argument("-r", "--nrun", type=int, default=20, metavar="INT",
+                    help="Number of runs per compilation trial (default - 20)")
+    ap.add_argument("-o", "--output", type=str, default=None, metavar="FILE.json",
+                    help="Output *.json filename (default - print a table)")
+    # fmt: on
+    a = ap.parse_args()
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for size in a.sizes:
+        for lowering in a.lowerings:
+            for _ in range(a.niter):
+                with ctx.Pool(1) as pool:
+                    args = (a.kind, size, lowering, a.target_cpu, a.nrun)
+                    results.append(pool.apply(measure, args))
+
+    if a.output is not None:
+        with open(a.output, "w", encoding="utf-8") as f:
+            json_dump(results, f, indent=4)
+        return
+
+    print(f"{'size':>6} {'lowering':>10} {'compile [s]':>12} {'run [ms]':>10}")
+    for size in a.sizes:
+        for lowering in a.lowerings:
+            runs = [r for r in results if r["size"] == size and r["linalg_lowering"] == lowering]
+            compile_sec = min(r["compile_sec"] for r in runs)
+            run_sec = min(r["run_sec"] for r in runs)
+            print(f"{size:>6} {lowering:>10} {compile_sec:>12.4f} {run_sec * 1000:>10.4f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Measure the compile time and runtime trade-off of the ``qjit`` optimization levels. Each
+configuration is compiled in a fresh process, such that no compiler state is shared between the
+measurements.
+
+Example:
+
+    $ python3 microbenchmarks/opt_levels.py --kind classical --size 256 --target-cpu native
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import multiprocessing
+import sys
+from argparse import ArgumentParser
+from json import dump as json_dump
+from time import perf_counter
+
+OPT_LEVELS = [0, 1, 2, 3]
+
+
+def build_program(kind: str, size: int, opt_level: int, target_cpu: str):
+    """Build a ``qjit`` program for the given optimization level, along with its arguments."""
+    import jax.numpy as jnp
+    import numpy as np
+    import pennylane as qml
+
+    from catalyst import for_loop, qjit
+
+    if kind == "classical":
+        # Heavy classical pre- and post-processing around a small circuit.
+        @qml.qnode(qml.device("lightning.qubit", wires=2))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        @qjit(opt_level=opt_level, target_cpu=target_cpu)
+        def program(x, m):
+            y = jnp.tanh(m @ m.T) @ m
+            return circuit(jnp.sum(y) * x) * jnp.exp(-jnp.abs(y)).mean()
+
+        rng = np.random.default_rng(42)
+        args = (0.5, rng.random((size, size)))
+
+    elif kind == "circuit":
+        # Circuit dominated program with a loop over layers.
+        @qjit(opt_level=opt_level, target_cpu=target_cpu)
+        @qml.qnode(qml.device("lightning.qubit", wires=4))
+        def program(x):
+            @for_loop(0, size, 1)
+            def layer(i):
+                qml.RX(x * i, wires=i % 4)
+                qml.CNOT(wires=[i % 4, (i + 1) % 4])
+
+            layer()
+            return qml.expval(qml.PauliZ(0))
+
+        args = (0.5,)
+
+    else:
+        raise ValueError(f"Unknown kind of program '{kind}'")
+
+    return program, args
+
+
+def measure(kind: str, size: int, opt_level: int, target_cpu: str, nrun: int) -> dict:
+    """Measure the compile time and the runtime of a program in the current process."""
+    program, args = build_program(kind, size, opt_level, target_cpu)
+
+    start = perf_counter()
+    program.jit_compile(args)
+    compiled = perf_counter()
+
+    runtimes = []
+    for _ in range(nrun):
+        run_start = perf_counter()
+        program(*args)
+        runtimes.append(perf_counter() - run_start)
+
+    return {
+        "kind": kind,
+        "size": size,
+        "opt_level": opt_level,
+        "target_cpu": target_cpu,
+        "compile_sec": compiled - start,
+        "run_sec": min(runtimes),
+    }
+
+
+def main():
+    """Run the measurements and report them as a table or as JSON."""
+    # fmt: off
+    ap = ArgumentParser(prog="python3 microbenchmarks/opt_levels.py")
+    ap.add_argument("--kind", choices=["classical", "circuit"], default="classical",
+                    help="Kind of program to compile (default - classical)")
+    ap.add_argument("--size", type=int, default=256,
+                    help="Size of the program: matrix dimension or number of layers "
+                    "(default - 256)")
+    ap.add_argument("--opt-levels", type=int, nargs="+", default=OPT_LEVELS,
+                    help="Optimization levels to measure (default - all)")
+    ap.add_argument("--target-cpu", type=str, default=None,
+                    help="CPU to generate code for, e.g. 'native' (default - generic CPU)")
+    ap.add_argument("-n", "--niter", type=int, default=3, metavar="INT",
+                    help="Number of compilation trials (default - 3)")
+    ap.add_argument("-r", "--nrun", type=int, default=20, metavar="INT",
+                    help="Number of runs per compilation trial (default - 20)")
+    ap.add_argument("-o", "--output", type=str, default=None, metavar="FILE.json",
+                    help="Output *.json filename (default - print a table)")
+    # fmt: on
+    a = ap.parse_args()
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for opt_level in a.opt_levels:
+        for _ in range(a.niter):
+            with ctx.Pool(1) as pool:
+                args = (a.kind, a.size, opt_level, a.target_cpu, a.nrun)
+                results.append(pool.apply(measure, args))
+
+    if a.output is not None:
+        with open(a.output, "w", encoding="utf-8") as f:
+            json_dump(results, f, indent=4)
+        return
+
+    print(f"{'opt_level':>9} {'compile [s]':>12} {'run [ms]':>10}")
+    for opt_level in a.opt_levels:
+        runs = [r for r in results if r["opt_level"] == opt_level]
+        compile_sec = min(r["compile_sec"] for r in runs)
+        run_sec = min(r["run_sec"] for r in runs)
+        print(f"{opt_level:>9} {compile_sec:>12.4f} {run_sec * 1000:>10.4f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
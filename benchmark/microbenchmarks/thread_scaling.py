@@ -0,0 +1,109 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Measure the throughput of a compiled circuit invoked concurrently from a growing number of
+threads. Compiled programs are executed with the GIL released, such that independent invocations
+run in parallel on separate device instances. Each number of threads is measured in a fresh
+process.
+
+Example:
+
+    $ python3 microbenchmarks/thread_scaling.py --nthreads 1 2 4 8 --nqubits 16
+"""
+
+# pylint: disable=import-outside-toplevel
+
+import multiprocessing
+import sys
+from argparse import ArgumentParser
+from json import dump as json_dump
+from time import perf_counter
+
+
+def build_program(nqubits: int):
+    """Build a ``qjit`` circuit whose simulation dominates the overhead of its invocation."""
+    import pennylane as qml
+
+    from catalyst import qjit
+
+    @qjit(persistent_context=True)
+    @qml.qnode(qml.device("lightning.qubit", wires=nqubits))
+    def circuit(x):
+        for i in range(nqubits):
+            qml.RX(x, wires=i)
+        for i in range(nqubits - 1):
+            qml.CNOT(wires=[i, i + 1])
+        return qml.expval(qml.PauliZ(nqubits - 1))
+
+    return circuit
+
+
+def measure(nthreads: int, nqubits: int, ncalls: int) -> dict:
+    """Measure the number of calls per second from a pool of threads in the current process."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    circuit = build_program(nqubits)
+    circuit(0.1)
+
+    with ThreadPoolExecutor(nthreads) as executor:
+        # Create the devices of all threads ahead of the measurement.
+        list(executor.map(circuit, [0.1] * nthreads))
+
+        start = perf_counter()
+        list(executor.map(circuit, [0.1 + i / ncalls for i in range(ncalls)]))
+        elapsed_sec = perf_counter() - start
+
+    return {
+        "nthreads": nthreads,
+        "nqubits": nqubits,
+        "ncalls": ncalls,
+        "elapsed_sec": elapsed_sec,
+        "calls_per_sec": ncalls / elapsed_sec,
+    }
+
+
+def main():
+    """Run the measurements and report them as a table or as JSON."""
+    # fmt: off
+    ap = ArgumentParser(prog="python3 microbenchmarks/thread_scaling.py")
+    ap.add_argument("--nthreads", type=int, nargs="+", default=[1, 2, 4, 8],
+                    help="Numbers of threads to measure (default - 1 2 4 8)")
+    ap.add_argument("--nqubits", type=int, default=16,
+                    help="Number of qubits of the circuit (default - 16)")
+    ap.add_argument("-n", "--ncalls", type=int, default=200, metavar="INT",
+                    help="Number of calls per measurement (default - 200)")
+    ap.add_argument("-o", "--output", type=str, default=None, metavar="FILE.json",
+                    help="Output *.json filename (default - print a table)")
+    # fmt: on
+    a = ap.parse_args()
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    for nthreads in a.nthreads:
+        with ctx.Pool(1) as pool:
+            results.append(pool.apply(measure, (nthreads, a.nqubits, a.ncalls)))
+
+    if a.output is not None:
+        with open(a.output, "w", encoding="utf-8") as f:
+            json_dump(results, f, indent=4)
+        return
+
+    baseline = results[0]["calls_per_sec"]
+    print(f"{'nthreads':>9} {'calls/s':>10} {'speedup':>8}")
+    for r in results:
+        speedup = r["calls_per_sec"] / baseline
+        print(f"{r['nthreads']:>9} {r['calls_per_sec']:>10.1f} {speedup:>8.2f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
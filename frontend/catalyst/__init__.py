@@ -17,6 +17,8 @@ This package contains the Catalyst Python interface.
 
 # pylint: disable=wrong-import-position
 
+import importlib
+import os
 import sys
 import types
 from os.path import dirname
@@ -54,8 +56,6 @@ except Exception:  # pylint: disable=broad-exception-caught  # pragma: no cover
     __revision__ = None
 
 if not INSTALLED:
-    import os
-
     default_bindings_path = os.path.join(
         os.path.dirname(__file__), "../../mlir/build/python_packages/quantum"
     )
@@ -82,19 +82,85 @@ sys.modules["mlir_quantum._mlir_libs._quantumDialects.mitigation"] = types.Modul
     "mlir_quantum._mlir_libs._quantumDialects.mitigation"
 )
 
-from catalyst import debug
-from catalyst.api_extensions import *
-from catalyst.api_extensions import __all__ as _api_extension_list
-from catalyst.autograph import *
-from catalyst.autograph import __all__ as _autograph_functions
+
+def _enable_x64():
+    """Enable 64-bit types in JAX, since values created before a program is traced must be
+    consistent with the JAX configuration value. The configuration is updated rather than the
+    environment, which would leak into subprocesses."""
+    import jax  # pylint: disable=import-outside-toplevel
+
+    jax.config.update("jax_enable_x64", True)
+
+
+# Unless JAX is already imported, the flag is set once JAX is loaded by the lazy imports below.
+if "jax" in sys.modules:
+    _enable_x64()
+
 from catalyst.compiler import CompileOptions
-from catalyst.jit import QJIT, qjit
 from catalyst.utils.exceptions import (
     AutoGraphError,
     CompileError,
     DifferentiableCompileError,
 )
 
+# The tracer, the lowering and AutoGraph pull in JAX, PennyLane and the MLIR bindings, hence the
+# public API is only imported once first accessed. This keeps 'import catalyst' cheap for
+# programs that only load precompiled functions.
+_lazy_attributes = {
+    "QJIT": "catalyst.jit",
+    "qjit": "catalyst.jit",
+    "load": "catalyst.saved_functions",
+    "warmup": "catalyst.warmup",
+    "AsyncExecutor": "catalyst.async_execution",
+    "set_async_executor": "catalyst.async_execution",
+    **dict.fromkeys(
+        (
+            "pure_callback",
+            "cond",
+            "for_loop",
+            "while_loop",
+            "grad",
+            "value_and_grad",
+            "jacobian",
+            "vjp",
+            "jvp",
+            "mitigate_with_zne",
+            "vmap",
+            "measure",
+            "adjoint",
+            "ctrl",
+        ),
+        "catalyst.api_extensions",
+    ),
+    **dict.fromkeys(
+        ("autograph_source", "disable_autograph", "run_autograph"), "catalyst.autograph"
+    ),
+}
+
+
+def __getattr__(name):
+    _enable_x64()
+    if name in _lazy_attributes:
+        value = getattr(importlib.import_module(_lazy_attributes[name]), name)
+    else:
+        # Submodules used to be reachable as attributes once the package was imported.
+        submodule = f"{__name__}.{name}"
+        try:
+            value = importlib.import_module(submodule)
+        except ModuleNotFoundError as e:
+            if e.name != submodule:
+                raise
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
+
+    # Subsequent accesses are resolved without going through this hook.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_attributes})
+
+
 autograph_ignore_fallbacks = False
 """bool: Specify whether AutoGraph should avoid raising
 warnings when conversion fails and control flow instead falls back
@@ -176,8 +242,6 @@ while processing the following with AutoGraph:
 
 
 __all__ = (
-    "qjit",
-    "QJIT",
     "autograph_ignore_fallbacks",
     "autograph_strict_conversion",
     "AutoGraphError",
@@ -185,6 +249,5 @@ __all__ = (
     "DifferentiableCompileError",
     "CompileOptions",
     "debug",
-    *_api_extension_list,
-    *_autograph_functions,
+    *_lazy_attributes,
 )
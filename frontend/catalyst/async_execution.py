@@ -0,0 +1,227 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This module contains the execution of compiled functions from asyncio programs, without
+blocking their event loop."""
+
+import asyncio
+import concurrent.futures
+import threading
+import warnings
+import weakref
+
+import pennylane as qml
+
+
+def get_device_types(fn):
+    """Get the names of the devices a compiled function is known to execute on. These are the
+    device of a compiled QNode, and the devices of the QNodes recorded by the trace cache of the
+    function while compiling it. Devices of QNodes which are not recorded there, such as QNodes
+    of functions that are not compiled yet, are not known.
+
+    Args:
+        fn (Callable): the compiled function
+
+    Returns:
+        List[str]: the sorted device names, such as ``"lightning.qubit"``
+    """
+    traces = getattr(fn, "qnode_traces", None)
+    qnodes = list(traces.keys()) if traces is not None else []
+    if isinstance(getattr(fn, "original_function", None), qml.QNode):
+        qnodes.append(fn.original_function)
+
+    device_types = set()
+    for qnode in qnodes:
+        device = qnode.device
+        device_types.add(device.short_name if isinstance(device, qml.Device) else device.name)
+
+    return sorted(device_types)
+
+
+class AsyncExecutor:
+    """Executes compiled functions for asyncio tasks on a pool of threads.
+
+    Compiled programs run with the GIL released, such that the event loop keeps serving other tasks
+    while they execute, and calls from different tasks execute in parallel. The number of calls
+    admitted at a time can be bounded, in total and per device, in which case further calls wait
+    for an admitted call to complete. The limits apply to the calls from each event loop, and the
+    devices of a call are those known from the tracing of the function, see
+    :func:`get_device_types`. Calls of functions whose devices are not known are only bounded by
+    ``max_pending``, for which a warning is emitted if device limits are set.
+
+    Args:
+        max_workers (Optional[int]): the maximum number of threads executing compiled functions.
+            Defaults to the default of :class:`concurrent.futures.ThreadPoolExecutor`.
+        max_pending (Optional[int]): the maximum number of calls admitted at a time, including the
+            calls waiting for a thread. Further calls wait until an admitted call completes, which
+            applies backpressure to the callers. Defaults to ``None`` (unbounded).
+        device_limits (Optional[Dict[str, int]]): the maximum number of calls admitted at a time
+            on each device, indexed by device name, such as ``{"lightning.qubit": 4}``. Calls on
+            devices without a limit are only bounded by ``max_pending``. Defaults to ``None``.
+
+    Raises:
+        ValueError: if a limit is not a positive integer
+    """
+
+    def __init__(self, max_workers=None, max_pending=None, device_limits=None):
+        device_limits = dict(device_limits or {})
+        for name, limit in [("max_pending", max_pending), *device_limits.items()]:
+            if limit is not None and (not isinstance(limit, int) or limit < 1):
+                raise ValueError(f"The limit of '{name}' must be a positive integer, got {limit}.")
+
+        self.pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers, thread_name_prefix="catalyst-async"
+        )
+        self.max_pending = max_pending
+        self.device_limits = device_limits
+        # Semaphores are bound to the event loop they are used in, hence are created per loop.
+        self.semaphores = weakref.WeakKeyDictionary()
+
+    def get_semaphores(self, device_types):
+        """Get the semaphores admitting a call on the given devices in the running event loop.
+
+        Args:
+            device_types (Iterable[str]): the sorted names of the devices of the call
+
+        Returns:
+            List[asyncio.Semaphore]: the semaphores to acquire, in order
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self.semaphores:
+            pending = None if self.max_pending is None else asyncio.Semaphore(self.max_pending)
+            devices = {name: asyncio.Semaphore(limit) for name, limit in self.device_limits.items()}
+            self.semaphores[loop] = (pending, devices)
+
+        # A consistent order of acquisition prevents calls on several devices from deadlocking.
+        pending, devices = self.semaphores[loop]
+        semaphores = [] if pending is None else [pending]
+        semaphores += [devices[name] for name in device_types if name in devices]
+        return semaphores
+
+    async def run(self, fn, *args, **kwargs):
+        """Execute a compiled function on the pool of threads, once the call is admitted.
+
+        Cancelling the awaiting task cancels the call if it has not started executing. A call that
+        is executing cannot be interrupted, in which case it keeps its slots until it completes
+        and its results are discarded.
+
+        Args:
+            fn (Callable): the compiled function
+            *args: the positional arguments of the call
+            **kwargs: the keyword arguments of the call
+
+        Returns:
+            Any: the results of the call
+        """
+        loop = asyncio.get_running_loop()
+
+        device_types = get_device_types(fn)
+        if self.device_limits and not device_types:
+            warnings.warn(
+                f"The devices of {fn} are not known, hence the device limits do not apply to its "
+                "calls.",
+                UserWarning,
+            )
+
+        acquired = []
+        try:
+            for semaphore in self.get_semaphores(device_types):
+                await semaphore.acquire()
+                acquired.append(semaphore)
+            future = self.pool.submit(fn, *args, **kwargs)
+        except BaseException:
+            AsyncExecutor.release(acquired)
+            raise
+
+        def on_done(_):
+            # The loop may be closed while the call completes, in which case the semaphores, which
+            # are bound to it, are discarded along with it.
+            try:
+                loop.call_soon_threadsafe(AsyncExecutor.release, acquired)
+            except RuntimeError:
+                pass
+
+        future.add_done_callback(on_done)
+        return await asyncio.wrap_future(future)
+
+    @staticmethod
+    def release(semaphores):
+        """Release the semaphores admitting a call."""
+        for semaphore in reversed(semaphores):
+            semaphore.release()
+
+    def shutdown(self, wait=True):
+        """Shut down the pool of threads, cancelling the calls that have not started executing.
+
+        Args:
+            wait (bool): whether to wait for the executing calls to complete
+        """
+        self.pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_async_executor():
+    """Get the executor of :meth:`.QJIT.acall`, which is created with the default limits on
+    first use unless set via :func:`~.set_async_executor`.
+
+    Returns:
+        AsyncExecutor: the executor
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = AsyncExecutor()
+        return _executor
+
+
+def set_async_executor(executor):
+    """Set the executor of :meth:`.QJIT.acall`, which determines the number of threads executing
+    compiled functions and bounds the number of concurrent calls, in total and per device.
+
+    The previous executor is returned, and keeps executing the calls it has admitted.
+
+    Args:
+        executor (AsyncExecutor): the executor to use
+
+    Returns:
+        Optional[AsyncExecutor]: the previous executor, if any
+
+    **Example**
+
+    .. code-block:: python
+
+        catalyst.set_async_executor(
+            catalyst.AsyncExecutor(max_pending=64, device_limits={"lightning.qubit": 4})
+        )
+
+        @qjit
+        @qml.qnode(qml.device("lightning.qubit", wires=2))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        async def handle(x):
+            return await circuit.acall(x)
+
+    At most four of the requests served by ``handle`` simulate ``circuit`` at a time, and at most
+    64 of them are admitted, such that further requests wait for earlier ones to complete.
+    """
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        previous, _executor = _executor, executor
+    return previous
@@ -14,13 +14,19 @@
 
 """This module contains classes to manage compiled functions and their underlying resources."""
 
+import concurrent.futures
 import ctypes
+import functools
+import os
+import threading
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Tuple
+from typing import Any, Tuple
 
 import numpy as np
 from jax.interpreters import mlir
-from jax.tree_util import PyTreeDef, tree_flatten, tree_unflatten
+from jax.tree_util import PyTreeDef, tree_flatten, tree_structure, tree_unflatten
 from mlir_quantum.runtime import (
     as_ctype,
     make_nd_memref_descriptor,
@@ -31,15 +37,93 @@ from catalyst.jax_extras import get_implicit_and_explicit_flat_args
 from catalyst.tracing.type_signatures import (
     TypeCompatibility,
     filter_static_args,
+    get_abstract_signature,
     get_decomposed_signature,
+    get_fingerprint,
+    get_promotion_plan,
+    split_static_args,
     typecheck_signatures,
 )
 from catalyst.utils import wrapper  # pylint: disable=no-name-in-module
 from catalyst.utils.c_template import get_template, mlir_type_to_numpy_type
-from catalyst.utils.filesystem import Directory
+from catalyst.utils.exceptions import CompileError
+from catalyst.utils.filesystem import Directory, copy_to_memory_file
 from catalyst.utils.jnp_to_memref import get_ranked_memref_descriptor
 
 
+class RuntimeContextManager:
+    """Singleton object that tracks the state of the runtime execution context.
+
+    The Catalyst runtime holds a single execution context per process, which owns the device pool
+    and the loaded device libraries. Every invocation of a compiled function holds a reference to
+    the context, which is taken by the ``setup`` function and dropped by the ``teardown`` function
+    of the program, such that concurrent invocations from different threads share the context. It
+    is created by the first of them and destroyed once the last of them returns. By default, the
+    context is thus created and destroyed around every invocation of a compiled function. Shared
+    objects opened in persistent mode instead hold an additional reference, which keeps the context
+    alive across invocations until the last of them is closed. Devices in the pool are then reset
+    and reused by subsequent invocations rather than being reconstructed.
+    """
+
+    # Whether the persistent reference to the execution context is currently held.
+    active = False
+
+    # Shared objects which currently require a persistent execution context.
+    users = weakref.WeakSet()
+
+    # Guards the persistent reference against concurrent invocations. It is reentrant, since the
+    # garbage collection of shared objects may release them while it is held.
+    lock = threading.RLock()
+
+    @staticmethod
+    def register(shared_object_manager):
+        """Register a shared object as a user of the persistent execution context."""
+        with RuntimeContextManager.lock:
+            RuntimeContextManager.users.add(shared_object_manager)
+
+    @staticmethod
+    def acquire(shared_object_manager):
+        """Take the persistent reference to the execution context, if it is not held yet.
+
+        Args:
+            shared_object_manager (SharedObjectManager): an open shared object whose ``setup``
+                function can be used to create the context
+        """
+        with RuntimeContextManager.lock:
+            if not RuntimeContextManager.active:
+                shared_object_manager.setup_context()
+                RuntimeContextManager.active = True
+
+    @staticmethod
+    def reset(shared_object_manager):
+        """Drop the persistent reference to the execution context, such that the context is
+        destroyed once no invocation is using it and re-created by the next one.
+
+        Args:
+            shared_object_manager (SharedObjectManager): an open shared object whose ``teardown``
+                function can be used to destroy the context
+        """
+        with RuntimeContextManager.lock:
+            if RuntimeContextManager.active:
+                shared_object_manager.teardown()
+                RuntimeContextManager.active = False
+
+    @staticmethod
+    def release(shared_object_manager):
+        """Unregister a shared object from the persistent execution context, destroying the context
+        if no other users remain.
+
+        Args:
+            shared_object_manager (SharedObjectManager): an open shared object whose ``teardown``
+                function can be used to destroy the context
+        """
+        with RuntimeContextManager.lock:
+            RuntimeContextManager.users.discard(shared_object_manager)
+            if RuntimeContextManager.users:
+                return
+        RuntimeContextManager.reset(shared_object_manager)
+
+
 class SharedObjectManager:
     """Shared object manager.
 
@@ -48,25 +132,96 @@ class SharedObjectManager:
     Args:
         shared_object_file (str): path to shared object containing compiled function
         func_name (str): name of compiled function
+        persistent (bool): whether to keep the runtime execution context alive between calls
+        in_memory (bool): whether to load the shared object from an in-memory copy, such that the
+            file can be removed once loaded
+        lazy (bool): whether to defer loading the shared object until the first invocation
     """
 
-    def __init__(self, shared_object_file, func_name):
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self, shared_object_file, func_name, persistent=False, in_memory=False, lazy=False
+    ):
+        self.memory_file = copy_to_memory_file(shared_object_file) if in_memory else None
+        if self.memory_file is not None:
+            shared_object_file = f"/proc/self/fd/{self.memory_file}"
         self.shared_object_file = shared_object_file
         self.shared_object = None
         self.func_name = func_name
+        self.persistent = persistent
         self.function = None
         self.setup = None
         self.teardown = None
         self.mem_transfer = None
-        self.open()
+        # Number of invocations in progress or about to start, which defer closing the shared
+        # object until they end.
+        self.running = 0
+        self.close_pending = False
+        # Called once the shared object is closed, such as to remove the file it was loaded from.
+        self.close_callbacks = []
+        # Closed shared objects are not reopened, since their file may no longer exist.
+        self.closed = False
+        self.lock = threading.Lock()
+        if not lazy:
+            self.open()
 
     def open(self):
         """Open the sharead object and load symbols."""
         self.shared_object = ctypes.CDLL(self.shared_object_file)
         self.function, self.setup, self.teardown, self.mem_transfer = self.load_symbols()
+        if self.persistent:
+            RuntimeContextManager.register(self)
 
-    def close(self):
-        """Close the shared object"""
+    def close(self, callback=None):
+        """Close the shared object, once no invocation of its function is in progress.
+
+        Args:
+            callback (Optional[Callable]): a function to call once the shared object is closed
+        """
+        with self.lock:
+            if callback is not None:
+                self.close_callbacks.append(callback)
+            if self.running:
+                self.close_pending = True
+                return
+            self._close()
+
+    def pin(self):
+        """Keep the shared object open for an upcoming invocation, until :meth:`unpin` is called.
+
+        Raises:
+            RuntimeError: if the shared object has been closed
+        """
+        with self.lock:
+            if self.closed:
+                raise RuntimeError(
+                    f"The shared object of '{self.func_name}' has been closed, for instance after "
+                    "its compiled version was evicted from the cache."
+                )
+            self.running += 1
+
+    def unpin(self):
+        """Release the shared object from an invocation, closing it if this was requested while
+        it was in use."""
+        with self.lock:
+            self.running -= 1
+            if self.close_pending and not self.running:
+                self._close()
+
+    def _close(self):
+        """Close the shared object immediately."""
+        callbacks, self.close_callbacks = self.close_callbacks, []
+        try:
+            self._close_shared_object()
+        finally:
+            for callback in callbacks:
+                callback()
+
+    def _close_shared_object(self):
+        if self.function is None:
+            return
+        if self.persistent:
+            RuntimeContextManager.release(self)
         self.function = None
         self.setup = None
         self.teardown = None
@@ -75,6 +230,15 @@ class SharedObjectManager:
         dlclose.argtypes = [ctypes.c_void_p]
         # pylint: disable=protected-access
         dlclose(self.shared_object._handle)
+        self.shared_object = None
+        self.closed = True
+        self._close_memory_file()
+
+    def _close_memory_file(self):
+        """Release the in-memory copy of the shared object, if any."""
+        if self.memory_file is not None:
+            os.close(self.memory_file)
+            self.memory_file = None
 
     def load_symbols(self):
         """Load symbols necessary for for execution of the compiled function.
@@ -105,17 +269,136 @@ class SharedObjectManager:
 
         return function, setup, teardown, mem_transfer
 
-    def __enter__(self):
+    def setup_context(self):
+        """Take a reference to the runtime execution context, which creates the context if no
+        other reference is held."""
         params_to_setup = [b"jitted-function"]
         argc = len(params_to_setup)
         array_of_char_ptrs = (ctypes.c_char_p * len(params_to_setup))()
         array_of_char_ptrs[:] = params_to_setup
         self.setup(ctypes.c_int(argc), array_of_char_ptrs)
+
+    def __enter__(self):
+        self.pin()
+        try:
+            with self.lock:
+                if self.shared_object is None:
+                    self.open()
+        except BaseException:
+            self.unpin()
+            raise
+
+        # A persistent execution context is shared with all compiled functions, regardless of
+        # which shared object created it, as there is only a single context per process.
+        if self.persistent:
+            RuntimeContextManager.acquire(self)
+
+        self.setup_context()
         return self
 
     def __exit__(self, _type, _value, _traceback):
         self.teardown()
 
+        # A failed execution may leave devices in an active state, in which case the persistent
+        # context is dropped and will be re-created once no other invocation is using it. Shared
+        # objects in default mode do not hold the persistent reference, hence leave it in place.
+        if _type is not None and self.persistent:
+            RuntimeContextManager.reset(self)
+
+        self.unpin()
+
+    def __del__(self):
+        if self.persistent and self.function is not None:
+            RuntimeContextManager.release(self)
+        # Mappings of the loaded shared object remain valid once the file descriptor is closed.
+        self._close_memory_file()
+
+
+@functools.lru_cache(maxsize=None)
+def get_memref_descriptor_type(rank):
+    """Get a structure with the memory layout of a ranked memref descriptor. The data pointers are
+    untyped, which is equivalent for the C ABI and allows to assign addresses to them directly.
+
+    Args:
+        rank (int): rank of the memref
+
+    Returns:
+        Type[ctypes.Structure]: the memref descriptor type
+    """
+    fields = [
+        ("allocated", ctypes.c_void_p),
+        ("aligned", ctypes.c_void_p),
+        ("offset", ctypes.c_longlong),
+    ]
+    if rank > 0:
+        fields += [("shape", ctypes.c_longlong * rank), ("strides", ctypes.c_longlong * rank)]
+
+    return type(f"MemRefDescriptor{rank}D", (ctypes.Structure,), {"_fields_": fields})
+
+
+class MarshallingPlan:
+    """Conversion of the flattened arguments of a compiled function to memref descriptors.
+
+    The descriptors and the structure pointing to them are allocated once, when the plan is
+    built for the element types and ranks of the arguments, and are refilled in place with the
+    data pointers, shapes and strides of the arguments on every call.
+
+    Args:
+        layout (Iterable[Tuple[np.dtype, int]]): element type and rank of each flattened argument
+    """
+
+    def __init__(self, layout):
+        self.layout = tuple((np.dtype(dtype), rank) for dtype, rank in layout)
+        self.descriptors = [get_memref_descriptor_type(rank)() for _, rank in self.layout]
+
+        fields = [(f"f{i}", ctypes.POINTER(type(d))) for i, d in enumerate(self.descriptors)]
+        arg_value_type = type("CompiledFunctionArgValue", (ctypes.Structure,), {"_fields_": fields})
+        self.arg_value = arg_value_type(*(ctypes.pointer(d) for d in self.descriptors))
+
+        if self.descriptors:
+            self.arg_value_pointer = ctypes.pointer(self.arg_value)
+        else:
+            self.arg_value_pointer = ctypes.POINTER(ctypes.c_int)()  # This is the null pointer
+
+    @classmethod
+    def from_signature(cls, signature):
+        """Build the plan for the arguments matching a signature.
+
+        Args:
+            signature (Iterable[ShapedArray]): the dynamic argument signature
+
+        Returns:
+            MarshallingPlan: the plan
+        """
+        return cls((aval.dtype, aval.ndim) for aval in tree_flatten(signature)[0])
+
+    def fill(self, arrays):
+        """Refill the descriptors with the provided arrays.
+
+        Args:
+            arrays (List[np.ndarray]): the flattened arguments
+
+        Returns:
+            Dict[int, np.ndarray] | None: the arrays indexed by the address of their data, or
+            ``None`` if the arrays do not match the layout of the plan
+        """
+        if len(arrays) != len(self.layout):
+            return None
+
+        numpy_dict = {}
+        for array, (dtype, rank), descriptor in zip(arrays, self.layout, self.descriptors):
+            if array.dtype != dtype or array.ndim != rank:
+                return None
+            address = array.ctypes.data
+            descriptor.allocated = descriptor.aligned = address
+            if rank:
+                descriptor.shape[:] = array.shape
+                # Numpy strides are expressed in bytes, memref strides in elements.
+                descriptor.strides[:] = [stride // array.itemsize for stride in array.strides]
+            numpy_dict[address] = array
+
+        return numpy_dict
+
 
 class CompiledFunction:
     """Manages the compilation result of a user program. Holds a reference to the binary object and
@@ -126,14 +409,40 @@ class CompiledFunction:
         func_name (str): name of compiled function
         restype (Iterable): MLIR tensor types representing the result of the compiled function
         compile_options (CompileOptions): compilation options used
+        lazy (bool): whether to defer loading the shared object until the first invocation
     """
 
-    def __init__(self, shared_object_file, func_name, restype, compile_options):
-        self.shared_object = SharedObjectManager(shared_object_file, func_name)
+    # pylint: disable=too-many-arguments
+    def __init__(self, shared_object_file, func_name, restype, compile_options, lazy=False):
+        self.shared_object = SharedObjectManager(
+            shared_object_file,
+            func_name,
+            compile_options.persistent_context,
+            compile_options.in_memory_workspace,
+            lazy,
+        )
         self.compile_options = compile_options
         self.return_type_c_abi = None
+        self.marshalling_plan = None
+        self.promotion_plan = None
+        self.result_types = None
+        # Held by the invocation using the preallocated marshalling plan and return value.
+        self.lock = threading.Lock()
         self.func_name = func_name
         self.restype = restype
+        # Paths of the device libraries used by the program, recorded when it is compiled.
+        self.device_libraries = []
+        # Axes of the results following the padded length of each bucketed argument.
+        self.bucket_axes = {}
+
+    def close(self, callback=None):
+        """Release the resources held by the compiled function, including the shared object and,
+        in persistent mode, the runtime execution context. Invocations in progress complete first.
+
+        Args:
+            callback (Optional[Callable]): a function to call once the resources are released
+        """
+        self.shared_object.close(callback)
 
     @staticmethod
     def _exec(shared_object, has_return, numpy_dict, *args):
@@ -305,6 +614,140 @@ class CompiledFunction:
         c_abi_args = [return_value_pointer] + [arg_value_pointer]
         return c_abi_args, numpy_arg_buffer
 
+    def prepare(self, signature):
+        """Build the plans to promote arguments to a signature and to convert them to memref
+        descriptors ahead of the first call. Functions with abstracted axes receive additional
+        implicit arguments, for which the marshalling plan is built on the first call instead.
+
+        Args:
+            signature (Iterable[ShapedArray]): the dynamic argument signature of the function
+        """
+        self.promotion_plan = get_promotion_plan(signature)
+        if self.compile_options.abstracted_axes is None:
+            self.marshalling_plan = MarshallingPlan.from_signature(signature)
+
+    def get_result_types(self):
+        """Get the shape and element type of each result, with dynamic dimensions as negative
+        sizes, and memoize them.
+
+        Returns:
+            List[Tuple[Tuple[int], np.dtype]]: the shape and element type of each result
+        """
+        if self.result_types is None:
+            self.result_types = [
+                (
+                    tuple(mlir.ir.RankedTensorType(mlir_tensor_type).shape),
+                    np.dtype(CompiledFunction.get_etypes(mlir_tensor_type)),
+                )
+                for mlir_tensor_type in self.restype or []
+            ]
+        return self.result_types
+
+    def get_output_buffers(self, args, out=None):
+        """Get the buffers the results are written to. These are the output buffers provided by
+        the caller and, for the remaining results, buffers of donated arguments matching a result
+        in shape and element type.
+
+        Args:
+            args (Iterable): the arguments of the call, including static arguments
+            out (Optional[Iterable[Optional[np.ndarray]]]): an output buffer or ``None`` per result
+
+        Returns:
+            Optional[List[Optional[np.ndarray]]]: the buffer of each result, or ``None`` if no
+            buffers are used
+
+        Raises:
+            CompileError: if the output buffers do not match the results of the function
+        """
+        donate_argnums = self.compile_options.donate_argnums
+        if out is None and not donate_argnums:
+            return None
+
+        result_types = self.get_result_types()
+        buffers = [None] * len(result_types) if out is None else list(out)
+        if len(buffers) != len(result_types):
+            raise CompileError(
+                f"The function has {len(result_types)} results, got {len(buffers)} output buffers."
+            )
+        for buffer, (shape, dtype) in zip(buffers, result_types):
+            if buffer is None:
+                continue
+            if not (isinstance(buffer, np.ndarray) and buffer.flags.writeable):
+                raise CompileError(
+                    f"Output buffers must be writeable NumPy arrays, got {type(buffer)}."
+                )
+            # Dynamic dimensions are only known once the results are computed.
+            sizes = [(size, length) for size, length in zip(shape, buffer.shape) if size >= 0]
+            if (
+                buffer.dtype != dtype
+                or buffer.ndim != len(shape)
+                or any(size != length for size, length in sizes)
+            ):
+                raise CompileError(
+                    f"The output buffer of shape {buffer.shape} and type {buffer.dtype} does not "
+                    f"match the result of shape {shape} and type {dtype}."
+                )
+
+        # Only arrays owned by the caller can be donated, other arguments are left untouched.
+        donated = [
+            leaf
+            for argnum in donate_argnums
+            if argnum < len(args)
+            for leaf in tree_flatten(args[argnum])[0]
+            if isinstance(leaf, np.ndarray) and leaf.flags.writeable
+        ]
+        for i, (shape, dtype) in enumerate(result_types):
+            if buffers[i] is not None:
+                continue
+            for j, leaf in enumerate(donated):
+                if leaf.shape == shape and leaf.dtype == dtype:
+                    buffers[i] = donated.pop(j)
+                    break
+
+        return buffers
+
+    @staticmethod
+    def write_to_buffers(results, buffers):
+        """Copy results into their buffers, which take the place of the results. Results which are
+        their buffer already, such as a donated argument returned unchanged, are not copied.
+
+        Args:
+            results (List[np.ndarray]): the results of the function
+            buffers (List[Optional[np.ndarray]]): the buffer of each result, or ``None``
+
+        Returns:
+            List[np.ndarray]: the results, with the buffers in place of the written results
+
+        Raises:
+            CompileError: if a buffer does not match the shape or element type of its result
+        """
+        # Results may alias the arguments, including the donated ones, or the memory of another
+        # result. These are copied before any buffer is overwritten.
+        results = [
+            (
+                np.array(result)
+                if any(
+                    buffer is not None and j != i and np.may_share_memory(result, buffer)
+                    for j, buffer in enumerate(buffers)
+                )
+                else result
+            )
+            for i, result in enumerate(results)
+        ]
+
+        for i, (result, buffer) in enumerate(zip(results, buffers)):
+            if buffer is None or result is buffer:
+                continue
+            if buffer.shape != result.shape or buffer.dtype != result.dtype:
+                raise CompileError(
+                    f"The output buffer of shape {buffer.shape} and type {buffer.dtype} does not "
+                    f"match the result of shape {result.shape} and type {result.dtype}."
+                )
+            np.copyto(buffer, result, casting="no")
+            results[i] = buffer
+
+        return results
+
     def get_cmain(self, *args):
         """Get a string representing a C program that can be linked against the shared object."""
         _, buffer = self.args_to_memref_descs(self.restype, args)
@@ -312,6 +755,27 @@ class CompiledFunction:
         return get_template(self.func_name, self.restype, *buffer)
 
     def __call__(self, *args, **kwargs):
+        return self.call_into(None, *args, **kwargs)
+
+    def call_into(self, out, /, *args, **kwargs):
+        """Call the compiled function, with its results written into the output buffers and the
+        buffers of donated arguments.
+
+        Args:
+            out (Optional[Iterable[Optional[np.ndarray]]]): an output buffer or ``None`` per
+                flattened result
+            *args: the arguments of the function, including static arguments
+            **kwargs: the keyword arguments of the function
+
+        Returns:
+            the return values computed by the function or None if the function has no results
+
+        Raises:
+            CompileError: if the output buffers do not match the results of the function
+        """
+        # Output buffers are checked ahead of the execution, which cannot be undone.
+        buffers = self.get_output_buffers(args, out)
+
         static_argnums = self.compile_options.static_argnums
         dynamic_args = filter_static_args(args, static_argnums)
 
@@ -321,16 +785,39 @@ class CompiledFunction:
                 abstracted_axes, *dynamic_args, **kwargs
             )
 
-        abi_args, _buffer = self.args_to_memref_descs(self.restype, dynamic_args)
-
-        numpy_dict = {nparr.ctypes.data: nparr for nparr in _buffer}
+        arrays = [np.asarray(arg) for arg in tree_flatten(dynamic_args)[0]]
+
+        # The preallocated plan and return value serve one invocation at a time, concurrent
+        # invocations from other threads allocate their own.
+        exclusive = self.lock.acquire(blocking=False)
+        try:
+            plan = self.marshalling_plan if exclusive else None
+            numpy_dict = plan.fill(arrays) if plan is not None else None
+            if numpy_dict is None:
+                plan = MarshallingPlan((array.dtype, array.ndim) for array in arrays)
+                numpy_dict = plan.fill(arrays)
+                if exclusive:
+                    self.marshalling_plan = plan
+
+            return_value_pointer = ctypes.POINTER(ctypes.c_int)()  # This is the null pointer
+            if self.restype:
+                return_value_pointer = self.restype_to_memref_descs(self.restype)
+                if not exclusive:
+                    return_value_pointer = ctypes.pointer(type(return_value_pointer.contents)())
+
+            result = CompiledFunction._exec(
+                self.shared_object,
+                self.restype,
+                numpy_dict,
+                return_value_pointer,
+                plan.arg_value_pointer,
+            )
+        finally:
+            if exclusive:
+                self.lock.release()
 
-        result = CompiledFunction._exec(
-            self.shared_object,
-            self.restype,
-            numpy_dict,
-            *abi_args,
-        )
+        if buffers is not None and result is not None:
+            result = CompiledFunction.write_to_buffers(result, buffers)
 
         return result
 
@@ -339,7 +826,7 @@ class CompiledFunction:
 class CacheKey:
     """A key by which to identify entries in the compiled function cache.
 
-    The cache only rembers one compiled function for each possible combination of:
+    The cache groups compiled functions by each possible combination of:
      - dynamic argument PyTree metadata
      - static argument values
     """
@@ -366,6 +853,39 @@ class CacheEntry:
     signature: Tuple
     out_treedef: PyTreeDef
     workspace: Directory
+    size: int = 0
+
+
+@dataclass
+class PendingEntry:
+    """A compilation running in the background, for which the compiled function is not yet
+    available. Apart from the future of the compilation, the same metadata as in a
+    :class:`~.CacheEntry` is stored."""
+
+    future: concurrent.futures.Future
+    signature: Tuple
+    out_treedef: PyTreeDef
+    workspace: Any
+    abstracted_axes: Any = None
+
+
+@dataclass
+class CacheInfo:
+    """Statistics of the compiled function cache.
+
+    Args:
+        hits (int): number of lookups that matched a compiled function
+        misses (int): number of lookups that required compilation
+        evictions (int): number of compiled functions removed from the cache
+        entries (int): number of compiled functions currently held by the cache
+        size (int): total size in bytes of the shared objects currently held by the cache
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
 
 
 class CompilationCache:
@@ -380,16 +900,88 @@ class CompilationCache:
     In order to allow some flexibility in the type of arguments provided by the user, a match is
     also produced if the dtype of dynamic arguments can be promoted to the dtype of an existing
     signature via JAX type promotion rules. Additional leniency is provided in the shape of
-    dynamic arguments in accordance with the abstracted axis specification.
+    dynamic arguments in accordance with the abstracted axis specification of each compiled
+    function.
 
-    To avoid excess promotion checks, only one function version is stored at a time for a given
-    combination of PyTreeDefs and static arguments.
+    Several function versions with different signatures can be stored for a given combination of
+    PyTreeDefs and static arguments, in which case a full match is preferred over a match requiring
+    promotion. The shared objects of all cached functions remain loaded, such that switching
+    between versions does not require reloading them. The cache can be bounded in the number of
+    entries and in the total size of their shared objects, beyond which the least recently used
+    entries are evicted: their shared object is unloaded and their temporary workspace is removed.
+
+    Compilations running in the background can be registered with the cache as pending entries.
+    They are inserted into the cache by the first lookup after their completion, and lookups with
+    arguments matching a pending entry wait for its compilation to complete.
+
+    Args:
+        static_argnums (Iterable[int]): indices of static arguments
+        abstracted_axes: the abstracted axes specification of the function
+        max_entries (Optional[int]): maximum number of compiled functions to hold
+        max_bytes (Optional[int]): maximum total size in bytes of the held shared objects
     """
 
-    def __init__(self, static_argnums, abstracted_axes):
+    def __init__(self, static_argnums, abstracted_axes, max_entries=None, max_bytes=None):
         self.static_argnums = static_argnums
         self.abstracted_axes = abstracted_axes
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
         self.cache = {}
+        self.pending = {}
+        # Entries ordered from least to most recently used, indexed by their identity.
+        self.lru = OrderedDict()
+        # The fingerprint, key, compatibility and entry of the last match, see ``get_fingerprint``.
+        self.last_match = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _match(self, args):
+        """Find the best matching cache entry for the provided arguments.
+
+        Returns:
+            TypeCompatibility
+            CacheKey | None
+            CacheEntry | None
+        """
+        if not self.cache:
+            return TypeCompatibility.NEEDS_COMPILATION, None, None
+
+        dynamic_args, static_args = split_static_args(args, self.static_argnums)
+        flat_args, treedef = tree_flatten(dynamic_args)
+
+        # Repeated calls with arguments of the same types skip the abstraction of the arguments
+        # and the signature checks.
+        fingerprint = get_fingerprint(flat_args)
+        if fingerprint is not None and self.last_match is not None:
+            last_fingerprint, key, action, entry = self.last_match
+            if (
+                last_fingerprint == fingerprint
+                and key.treedef == treedef
+                and key.static_args == static_args
+            ):
+                return action, key, entry
+
+        key = CacheKey(treedef, static_args)
+        if key not in self.cache:
+            return TypeCompatibility.NEEDS_COMPILATION, None, None
+
+        runtime_signature = tree_unflatten(treedef, get_abstract_signature(flat_args))
+        action, match = TypeCompatibility.NEEDS_COMPILATION, None
+        for entry in reversed(self.cache[key]):
+            # Entries may have been compiled with their own abstracted axes, see ``auto_abstract``.
+            abstracted_axes = entry.compiled_fn.compile_options.abstracted_axes
+            entry_action = typecheck_signatures(entry.signature, runtime_signature, abstracted_axes)
+            if entry_action == TypeCompatibility.CAN_SKIP_PROMOTION:
+                action, match = entry_action, entry
+                break
+            if entry_action == TypeCompatibility.NEEDS_PROMOTION and match is None:
+                action, match = entry_action, entry
+
+        if fingerprint is not None and match is not None:
+            self.last_match = (fingerprint, key, action, match)
+
+        return action, key, match
 
     def get_function_status_and_key(self, args):
         """Check if the provided arguments match an existing function in the cache. The cache
@@ -405,17 +997,7 @@ class CompilationCache:
             TypeCompatibility
             CacheKey | None
         """
-        if not self.cache:
-            return TypeCompatibility.NEEDS_COMPILATION, None
-
-        flat_runtime_sig, treedef, static_args = get_decomposed_signature(args, self.static_argnums)
-        key = CacheKey(treedef, static_args)
-        if key not in self.cache:
-            return TypeCompatibility.NEEDS_COMPILATION, None
-
-        entry = self.cache[key]
-        runtime_signature = tree_unflatten(treedef, flat_runtime_sig)
-        action = typecheck_signatures(entry.signature, runtime_signature, self.abstracted_axes)
+        action, key, _ = self._match(args)
         return action, key
 
     def lookup(self, args):
@@ -429,18 +1011,42 @@ class CompilationCache:
             CacheEntry | None: the matched cache entry
             bool: whether the matched entry requires argument promotion
         """
-        action, key = self.get_function_status_and_key(args)
+        # Entries of completed compilations are only evicted once the matched entry is marked as
+        # the most recently used, such that the entry about to be used is never evicted.
+        self.collect_pending(args, evict=False)
+        action, _, entry = self._match(args)
 
         if action == TypeCompatibility.NEEDS_COMPILATION:
+            self.misses += 1
+            self.evict()
             return None, None
-        elif action == TypeCompatibility.NEEDS_PROMOTION:
-            return self.cache[key], True
+
+        self.hits += 1
+        self.lru.move_to_end(id(entry))
+        self.evict()
+
+        if action == TypeCompatibility.NEEDS_PROMOTION:
+            return entry, True
         else:
             assert action == TypeCompatibility.CAN_SKIP_PROMOTION
-            return self.cache[key], False
+            return entry, False
+
+    def peek(self, args):
+        """Get the entry (if present) that matches the provided arguments, without collecting
+        pending compilations or counting the lookup in the statistics of the cache.
+
+        Args:
+            args (Iterable): the arguments to match to existing functions
+
+        Returns:
+            CacheEntry | None: the matched cache entry
+        """
+        action, _, entry = self._match(args)
+        return None if action == TypeCompatibility.NEEDS_COMPILATION else entry
 
     def insert(self, fn, args, out_treedef, workspace):
-        """Inserts the provided function into the cache.
+        """Inserts the provided function into the cache, evicting the least recently used entries
+        if the cache exceeds its bounds.
 
         Args:
             fn (CompiledFunction): compilation result
@@ -450,9 +1056,151 @@ class CompilationCache:
         """
         assert isinstance(fn, CompiledFunction)
 
+        key, signature = self._get_key_and_signature(args)
+        self._insert_entry(key, CacheEntry(fn, signature, out_treedef, workspace))
+
+    def restore(self, fn, signature, static_args, out_treedef, workspace):
+        """Inserts a function compiled for a known signature into the cache, such as a function
+        restored from a serialized QJIT object.
+
+        Args:
+            fn (CompiledFunction): compilation result
+            signature (Iterable[ShapedArray]): dynamic argument signature of the function
+            static_args (Tuple[Any]): static argument values the function was compiled for
+            out_treedef (PyTreeDef): the output shape of the function
+            workspace (Directory): directory where compilation artifacts are stored
+        """
+        key = CacheKey(tree_structure(signature), tuple(static_args))
+        self._insert_entry(key, CacheEntry(fn, signature, out_treedef, workspace))
+
+    def _insert_entry(self, key, entry, evict=True):
+        entry.compiled_fn.prepare(entry.signature)
+        # A new entry may match the arguments of the last match better.
+        self.last_match = None
+        try:
+            entry.size = os.path.getsize(entry.compiled_fn.shared_object.shared_object_file)
+        except OSError:
+            entry.size = 0
+
+        self.cache.setdefault(key, []).append(entry)
+        self.lru[id(entry)] = (key, entry)
+
+        if evict:
+            self.evict()
+
+    def _get_key_and_signature(self, args):
         flat_signature, treedef, static_args = get_decomposed_signature(args, self.static_argnums)
-        signature = tree_unflatten(treedef, flat_signature)
+        return CacheKey(treedef, static_args), tree_unflatten(treedef, flat_signature)
 
-        key = CacheKey(treedef, static_args)
-        entry = CacheEntry(fn, signature, out_treedef, workspace)
-        self.cache[key] = entry
+    def insert_pending(self, future, args, out_treedef, workspace, abstracted_axes=None):
+        """Register a compilation running in the background for the provided arguments.
+
+        Args:
+            future (Future[CompiledFunction]): the in-flight compilation
+            args (Iterable): arguments to determine cache key and additional metadata from
+            out_treedef (PyTreeDef): the output shape of the function
+            workspace (Directory): directory where compilation artifacts are stored
+            abstracted_axes (Any): the abstracted axes the function is compiled with
+        """
+        key, signature = self._get_key_and_signature(args)
+        entry = PendingEntry(future, signature, out_treedef, workspace, abstracted_axes)
+        self.pending.setdefault(key, []).append(entry)
+
+    def find_pending(self, args):
+        """Get the in-flight compilation (if present) that matches the provided arguments.
+
+        Args:
+            args (Iterable): the arguments to match to pending compilations
+
+        Returns:
+            PendingEntry | None: the matched pending entry
+        """
+        if not self.pending:
+            return None
+
+        key, runtime_signature = self._get_key_and_signature(args)
+        for entry in self.pending.get(key, ()):
+            # As for cache entries, the abstracted axes of the compilation itself apply.
+            action = typecheck_signatures(entry.signature, runtime_signature, entry.abstracted_axes)
+            if action != TypeCompatibility.NEEDS_COMPILATION:
+                return entry
+
+        return None
+
+    def collect_pending(self, args=None, evict=True):
+        """Insert the functions of completed background compilations into the cache. Failed or
+        cancelled compilations are discarded.
+
+        If the provided arguments match a compilation that is still in flight, wait for it to
+        complete first.
+
+        Args:
+            args (Optional[Iterable]): arguments of an upcoming call
+            evict (bool): whether to evict entries if the cache exceeds its bounds afterwards
+
+        Raises:
+            Exception: the error raised by the awaited compilation, if it failed
+        """
+        if not self.pending:
+            return
+
+        awaited = self.find_pending(args) if args is not None else None
+        if awaited is not None:
+            concurrent.futures.wait([awaited.future])
+
+        for key, pending_entries in list(self.pending.items()):
+            for pending in [p for p in pending_entries if p.future.done()]:
+                pending_entries.remove(pending)
+                if pending.future.cancelled() or pending.future.exception() is not None:
+                    continue
+                entry = CacheEntry(
+                    pending.future.result(),
+                    pending.signature,
+                    pending.out_treedef,
+                    pending.workspace,
+                )
+                self._insert_entry(key, entry, evict=False)
+            if not pending_entries:
+                del self.pending[key]
+
+        if evict:
+            self.evict()
+
+        if awaited is not None and not awaited.future.cancelled():
+            awaited.future.result()
+
+    def evict(self):
+        """Evict the least recently used entries until the cache respects its bounds. The most
+        recently used entry is never evicted."""
+
+        while len(self.lru) > 1 and self._exceeds_bounds():
+            key, entry = self.lru.popitem(last=False)[1]
+            self.last_match = None
+            self.cache[key].remove(entry)
+            if not self.cache[key]:
+                del self.cache[key]
+
+            # Calls which already hold the function defer closing it, and its workspace is only
+            # removed once it is closed.
+            entry.compiled_fn.close(entry.workspace.remove)
+            self.evictions += 1
+
+    def _exceeds_bounds(self):
+        if self.max_entries is not None and len(self.lru) > self.max_entries:
+            return True
+        if self.max_bytes is not None and self.size > self.max_bytes:
+            return True
+        return False
+
+    @property
+    def size(self):
+        """Total size in bytes of the shared objects held by the cache."""
+        return sum(entry.size for _, entry in self.lru.values())
+
+    def info(self):
+        """Get the statistics of the cache.
+
+        Returns:
+            CacheInfo
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self.lru), self.size)
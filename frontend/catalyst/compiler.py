@@ -14,6 +14,7 @@
 """This module contains functions for lowering, compiling, and linking
 MLIR/LLVM representations.
 """
+import functools
 import glob
 import importlib
 import os
@@ -29,8 +30,6 @@ from io import TextIOWrapper
 from os import path
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-from mlir_quantum.compiler_driver import run_compiler_driver
-
 from catalyst.utils.exceptions import CompileError
 from catalyst.utils.filesystem import Directory
 from catalyst.utils.runtime_environment import get_lib_path
@@ -66,6 +65,38 @@ class CompileOptions:
         static_argnums (Optional[Union[int, Iterable[int]]]): indices of static arguments.
             Default is ``None``.
         abstracted_axes (Optional[Any]): store the abstracted_axes value. Defaults to ``None``.
+        persistent_context (Optional[bool]): flag indicating whether the runtime execution context
+            should be kept alive between invocations of the compiled function. Default is ``False``.
+        persistent_cache (Optional[Union[bool, str]]): flag or directory enabling the on-disk
+            compilation cache shared between processes. Default is ``False``.
+        cache_max_entries (Optional[int]): maximum number of compiled function versions held in
+            memory. Default is ``None`` (unbounded).
+        cache_max_bytes (Optional[int]): maximum total size of compiled function versions held in
+            memory. Default is ``None`` (unbounded).
+        in_memory_workspace (Optional[bool]): flag indicating whether to keep compilation artifacts
+            in memory rather than on disk. Has no effect when intermediate results are kept.
+            Default is ``False``.
+        opt_level (Optional[int]): the optimization level from 0 to 3, trading off compilation time
+            against the performance of the compiled program. Default is ``2``.
+        target_cpu (Optional[str]): the CPU to generate code for, such as ``"skylake-avx512"``, or
+            ``"native"`` for the CPU of the host. Default is ``None``, which targets a generic CPU.
+        target_features (Optional[str]): comma-separated target features to enable or disable in
+            addition to the features of the target CPU, such as ``"+avx2,+fma"``. Default is
+            ``None``.
+        linalg_lowering (Optional[str]): the lowering of linear algebra operations, one of
+            ``"loops"`` (scalar loop nests), ``"vectorize"`` (tiled and vectorized loop nests), or
+            ``"parallel"`` (tiled and vectorized loop nests, with the outermost loops executed in
+            parallel). Default is ``"loops"``.
+        stage_cache (Optional[bool]): flag indicating whether to cache the program after each
+            pipeline in memory, such that later compilations of the same program which share the
+            first pipelines resume from the cached program. Default is ``False``.
+        auto_abstract (Optional[int]): number of compilations for arguments that differ only in
+            the lengths of array axes, after which a dynamically-shaped version of the function is
+            compiled with inferred abstracted axes. Default is ``None``, which disables it.
+        shape_buckets (Optional[Dict[int, Dict]]): the rules by which array arguments are padded
+            to bucketed axis lengths, indexed by argument. Default is ``None``.
+        donate_argnums (Optional[Union[int, Iterable[int]]]): indices of arguments whose buffers
+            may be reused for the results. Default is ``None``.
     """
 
     verbose: Optional[bool] = False
@@ -79,15 +110,34 @@ class CompileOptions:
     static_argnums: Optional[Union[int, Iterable[int]]] = None
     abstracted_axes: Optional[Union[Iterable[Iterable[str]], Dict[int, str]]] = None
     lower_to_llvm: Optional[bool] = True
+    persistent_context: Optional[bool] = False
+    persistent_cache: Optional[Union[bool, str]] = False
+    cache_max_entries: Optional[int] = None
+    cache_max_bytes: Optional[int] = None
+    in_memory_workspace: Optional[bool] = False
+    opt_level: Optional[int] = 2
+    target_cpu: Optional[str] = None
+    target_features: Optional[str] = None
+    linalg_lowering: Optional[str] = "loops"
+    stage_cache: Optional[bool] = False
+    auto_abstract: Optional[int] = None
+    shape_buckets: Optional[Dict[int, Dict]] = None
+    donate_argnums: Optional[Union[int, Iterable[int]]] = None
 
     def __post_init__(self):
-        # Make the format of static_argnums easier to handle.
+        # Make the format of static_argnums and donate_argnums easier to handle.
         static_argnums = self.static_argnums
         if static_argnums is None:
             self.static_argnums = ()
         elif isinstance(static_argnums, int):
             self.static_argnums = (static_argnums,)
 
+        donate_argnums = self.donate_argnums
+        if donate_argnums is None:
+            self.donate_argnums = ()
+        elif isinstance(donate_argnums, int):
+            self.donate_argnums = (donate_argnums,)
+
     def __deepcopy__(self, memo):
         """Make a deep copy of all fields of a CompileOptions object except the logfile, which is
         copied directly"""
@@ -104,8 +154,11 @@ class CompileOptions:
         if self.pipelines:
             return self.pipelines
         elif self.async_qnodes:
-            return DEFAULT_ASYNC_PIPELINES  # pragma: nocover
-        return DEFAULT_PIPELINES
+            pipelines = DEFAULT_ASYNC_PIPELINES  # pragma: nocover
+        else:
+            pipelines = DEFAULT_PIPELINES
+        pipelines = get_pipelines_with_linalg_lowering(pipelines, self.linalg_lowering)
+        return get_pipelines_at_opt_level(pipelines, self.opt_level)
 
 
 def run_writing_command(command: List[str], compile_options: Optional[CompileOptions]) -> None:
@@ -240,6 +293,107 @@ DEFAULT_ASYNC_PIPELINES = [
     MLIR_TO_LLVM_ASYNC_PASS,
 ]
 
+# Passes which only improve the generated code, skipped at optimization level 0.
+OPTIONAL_PASSES = {
+    "cse",
+    "func.func(buffer-hoisting)",
+    "func.func(buffer-loop-hoisting)",
+}
+
+# Passes added at optimization level 3, mapped from the pass they follow.
+AGGRESSIVE_PASSES = {
+    "func.func(hlo-legalize-to-linalg)": ["func.func(linalg-fuse-elementwise-ops)"],
+}
+
+# Default lowering of linear algebra operations to scalar loop nests.
+LINALG_LOOPS_LOWERING = ["func.func(convert-linalg-to-loops)"]
+
+# Lowerings of linear algebra operations to loops. The alternatives to the default lowering tile
+# the loop nests for locality and vectorize their innermost loops, in which case vector operations
+# are lowered to LLVM along with memory references.
+LINALG_LOWERINGS = {
+    "loops": LINALG_LOOPS_LOWERING,
+    "vectorize": [
+        "func.func(convert-linalg-to-affine-loops)",
+        "func.func(affine-loop-tile{tile-size=32})",
+        "func.func(affine-super-vectorize{virtual-vector-size=8})",
+        "lower-affine",
+        "convert-vector-to-scf",
+    ],
+    # The outermost parallel loops are distributed over the threads of the async runtime, which is
+    # also used by asynchronous QNodes.
+    "parallel": [
+        "func.func(convert-linalg-to-affine-loops)",
+        "func.func(affine-loop-tile{tile-size=32})",
+        "func.func(affine-parallelize{max-nested=1})",
+        "func.func(affine-super-vectorize{virtual-vector-size=8})",
+        "lower-affine",
+        "async-parallel-for",
+        "async-to-async-runtime",
+        "async-runtime-ref-counting",
+        "async-runtime-ref-counting-opt",
+        "convert-async-to-llvm",
+        "convert-vector-to-scf",
+    ],
+}
+
+
+def get_pipelines_with_linalg_lowering(pipelines, linalg_lowering):
+    """Replace the lowering of linear algebra operations in the default pipelines.
+
+    Args:
+        pipelines (List[Tuple[str, List[str]]]): the pipelines to adjust
+        linalg_lowering (str): the name of the lowering, a key of ``LINALG_LOWERINGS``
+
+    Returns:
+        List[Tuple[str, List[str]]]: the adjusted pipelines
+    """
+    if linalg_lowering == "loops":
+        return pipelines
+
+    adjusted = []
+    for name, passes in pipelines:
+        adjusted_passes = []
+        for pass_name in passes:
+            if pass_name in LINALG_LOOPS_LOWERING:
+                adjusted_passes.extend(LINALG_LOWERINGS[linalg_lowering])
+                continue
+            if pass_name.startswith("finalize-memref-to-llvm"):
+                adjusted_passes.append("convert-vector-to-llvm")
+            adjusted_passes.append(pass_name)
+        adjusted.append((name, adjusted_passes))
+    return adjusted
+
+
+def get_pipelines_at_opt_level(pipelines, opt_level):
+    """Adjust the default pipelines to an optimization level.
+
+    Level 0 skips the optional optimization passes, levels 1 and 2 run the pipelines unchanged,
+    and level 3 adds the aggressive optimization passes. The optimization level of the LLVM stages
+    is adjusted by the compiler driver.
+
+    Args:
+        pipelines (List[Tuple[str, List[str]]]): the pipelines to adjust
+        opt_level (int): the optimization level from 0 to 3
+
+    Returns:
+        List[Tuple[str, List[str]]]: the adjusted pipelines
+    """
+    if opt_level in (1, 2):
+        return pipelines
+
+    adjusted = []
+    for name, passes in pipelines:
+        adjusted_passes = []
+        for pass_name in passes:
+            if opt_level == 0 and pass_name in OPTIONAL_PASSES:
+                continue
+            adjusted_passes.append(pass_name)
+            if opt_level == 3:
+                adjusted_passes.extend(AGGRESSIVE_PASSES.get(pass_name, []))
+        adjusted.append((name, adjusted_passes))
+    return adjusted
+
 
 class LinkerDriver:
     """Compiler used to drive the linking stage.
@@ -262,16 +416,29 @@ class LinkerDriver:
         """Re-compute the path where the libraries exist.
 
         The use case for this is if someone is in a python jupyter notebook and
-        needs to change the environment mid computation.
+        needs to change the environment mid computation. The remaining toolchain
+        discovery only happens once per process for each set of library paths.
         Returns
             (List[str]): The default flag list.
         """
         mlir_lib_path = get_lib_path("llvm", "MLIR_LIB_DIR")
         rt_lib_path = get_lib_path("runtime", "RUNTIME_LIB_DIR")
+        async_qnodes = bool(options.async_qnodes)
+
+        return list(LinkerDriver._get_default_flags(mlir_lib_path, rt_lib_path, async_qnodes))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_default_flags(mlir_lib_path, rt_lib_path, async_qnodes):
+        """Compute the default flags for the given library paths.
+
+        Returns
+            (Tuple[str]): The default flags.
+        """
 
         # Adds RUNTIME_LIB_DIR to the Python system path to allow the catalyst_callback_registry
         # to be importable.
-        sys.path.append(get_lib_path("runtime", "RUNTIME_LIB_DIR"))
+        sys.path.append(rt_lib_path)
         import catalyst_callback_registry as registry  # pylint: disable=import-outside-toplevel
 
         # We use MLIR's C runner utils library in the registry.
@@ -340,12 +507,12 @@ class LinkerDriver:
         # The exception handling mechanism requires linking against
         # __gxx_personality_v0 which is either on -lstdc++ in
         # or -lc++. We choose based on the operating system.
-        if options.async_qnodes and platform.system() == "Linux":  # pragma: nocover
+        if async_qnodes and platform.system() == "Linux":  # pragma: nocover
             system_flags += ["-lstdc++"]
-        elif options.async_qnodes and platform.system() == "Darwin":  # pragma: nocover
+        elif async_qnodes and platform.system() == "Darwin":  # pragma: nocover
             system_flags += ["-lc++"]
 
-        default_flags = [
+        default_flags = (
             "-shared",
             "-rdynamic",
             *system_flags,
@@ -356,7 +523,7 @@ class LinkerDriver:
             f"-l{openblas_lib_name}",  # required for custom_calls lib
             "-lcustom_calls",
             "-lmlir_async_runtime",
-        ]
+        )
         return default_flags
 
     @staticmethod
@@ -377,7 +544,13 @@ class LinkerDriver:
     def _exists(compiler):
         if compiler is None:
             return None
-        return shutil.which(compiler)
+        return LinkerDriver._which(compiler, os.environ.get("PATH"))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _which(compiler, search_path):
+        """Look up an executable, with the result cached for each value of ``PATH``."""
+        return shutil.which(compiler, path=search_path)
 
     @staticmethod
     def _available_compilers(fallback_compilers):
@@ -443,6 +616,70 @@ class LinkerDriver:
         raise CompileError(msg)
 
 
+# Diagnostic of the compiler driver for sources it cannot parse as MLIR.
+MLIR_PARSE_FAILURE = "Failed to parse module as MLIR source"
+
+# Whether the compiler driver parses the bytecode of the frontend, which depends on the versions of
+# MLIR they are built against only. It is determined by the first compilation from bytecode, such
+# that later compilations do not retry a format the driver is known to reject.
+_driver_parses_bytecode = None
+
+
+def get_module_bytecode(mlir_module):
+    """Serialize an MLIR module to bytecode for the compiler driver.
+
+    Bytecode is more compact and faster to produce and to parse than the textual form of the
+    module, in particular for programs with large constants.
+
+    Args:
+        mlir_module: the MLIR module to serialize
+
+    Returns:
+        bytes: the MLIR bytecode of the module
+    """
+    return mlir_module.operation.get_asm(binary=True, assume_verified=True)
+
+
+def get_module_ir(mlir_module):
+    """Serialize an MLIR module for the compiler driver, as bytecode unless the driver is known to
+    be unable to parse the bytecode of the frontend, in which case the textual form is used.
+
+    Args:
+        mlir_module: the MLIR module to serialize
+
+    Returns:
+        bytes | str: the MLIR bytecode or the textual IR of the module
+    """
+    if _driver_parses_bytecode is False:
+        return mlir_module.operation.get_asm(assume_verified=True)
+    return get_module_bytecode(mlir_module)
+
+
+def get_module_text(bytecode):
+    """Convert MLIR bytecode produced by the frontend to the textual form of the module.
+
+    The frontend and the compiler driver are built against different versions of MLIR, whose
+    bytecode encodings of some dialects, such as StableHLO, are not guaranteed to be compatible.
+    The textual form tolerates these differences, hence serves as a fallback for programs whose
+    bytecode the driver cannot parse.
+
+    Args:
+        bytecode (bytes): the MLIR bytecode of a module
+
+    Returns:
+        str: the textual IR of the module
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from jax.interpreters import mlir
+
+    # The module is parsed in a context of the frontend, which produced the bytecode.
+    context = mlir.make_ir_context()
+    context.allow_unregistered_dialects = True
+    with context:
+        module = mlir.ir.Module.parse(bytecode)
+        return module.operation.get_asm(assume_verified=True)
+
+
 class Compiler:
     """Compiles MLIR modules to shared objects by executing the Catalyst compiler driver library."""
 
@@ -450,11 +687,11 @@ class Compiler:
         self.options = options if options is not None else CompileOptions()
         self.last_compiler_output = None
 
-    def run_from_ir(self, ir: str, module_name: str, workspace: Directory):
-        """Compile a shared object from a textual IR (MLIR or LLVM).
+    def run_from_ir(self, ir: Union[str, bytes], module_name: str, workspace: Directory):
+        """Compile a shared object from a textual IR (MLIR or LLVM) or from MLIR bytecode.
 
         Args:
-            ir (str): Textual MLIR to be compiled
+            ir (str | bytes): Textual MLIR or LLVM IR, or MLIR bytecode to be compiled
             module_name (str): Module name to use for naming
             workspace (Directory): directory that holds output files and/or debug dumps.
 
@@ -479,18 +716,26 @@ class Compiler:
         if self.options.verbose:
             print(f"[LIB] Running compiler driver in {workspace}", file=self.options.logfile)
 
+        global _driver_parses_bytecode  # pylint: disable=global-statement
+        if isinstance(ir, bytes) and _driver_parses_bytecode is False:
+            ir = get_module_text(ir)
+
         try:
-            compiler_output = run_compiler_driver(
-                ir,
-                str(workspace),
-                module_name,
-                keep_intermediate=self.options.keep_intermediate,
-                verbose=self.options.verbose,
-                pipelines=self.options.get_pipelines(),
-                lower_to_llvm=lower_to_llvm,
+            compiler_output = self._run_driver(ir, workspace, module_name, lower_to_llvm)
+        except CompileError as e:
+            if not isinstance(ir, bytes) or MLIR_PARSE_FAILURE not in str(e):
+                raise
+            if self.options.verbose:
+                msg = "[LIB] The compiler driver cannot parse the bytecode, retrying with text"
+                print(msg, file=self.options.logfile)
+            compiler_output = self._run_driver(
+                get_module_text(ir), workspace, module_name, lower_to_llvm
             )
-        except RuntimeError as e:
-            raise CompileError(*e.args) from e
+            # Only a module the driver parses as text shows that the bytecode is incompatible.
+            _driver_parses_bytecode = False
+        else:
+            if isinstance(ir, bytes):
+                _driver_parses_bytecode = True
 
         if self.options.verbose:
             for line in compiler_output.get_diagnostic_messages().strip().split("\n"):
@@ -510,6 +755,30 @@ class Compiler:
         self.last_compiler_output = compiler_output
         return output_filename, out_IR, [func_name, ret_type_name]
 
+    def _run_driver(self, ir, workspace, module_name, lower_to_llvm):
+        """Invoke the compiler driver on textual IR or MLIR bytecode."""
+
+        # The compiler driver bindings are only loaded once a program is compiled.
+        # pylint: disable-next=import-outside-toplevel
+        from mlir_quantum.compiler_driver import run_compiler_driver
+
+        try:
+            return run_compiler_driver(
+                ir,
+                str(workspace),
+                module_name,
+                keep_intermediate=self.options.keep_intermediate,
+                verbose=self.options.verbose,
+                pipelines=self.options.get_pipelines(),
+                lower_to_llvm=lower_to_llvm,
+                opt_level=self.options.opt_level,
+                target_cpu=self.options.target_cpu or "",
+                target_features=self.options.target_features or "",
+                stage_cache=self.options.stage_cache,
+            )
+        except RuntimeError as e:
+            raise CompileError(*e.args) from e
+
     def run(self, mlir_module, *args, **kwargs):
         """Compile an MLIR module to a shared object.
 
@@ -526,9 +795,7 @@ class Compiler:
         """
 
         return self.run_from_ir(
-            mlir_module.operation.get_asm(
-                binary=False, print_generic_op_form=False, assume_verified=True
-            ),
+            get_module_ir(mlir_module),
             str(mlir_module.operation.attributes["sym_name"]).replace('"', ""),
             *args,
             **kwargs,
@@ -548,4 +815,11 @@ class Compiler:
             msg += "Are you sure the file exists?"
             raise CompileError(msg)
 
+        # Pipelines skipped by resuming from a cached stage produce no output, hence the outputs
+        # are only recorded when the stage cache is disabled by keeping intermediate results.
+        if self.options.stage_cache and not self.options.keep_intermediate:
+            msg = f"The output of pipeline: {pipeline} is not recorded when the stage cache is "
+            msg += "used. Compile with keep_intermediate=True, which disables the stage cache."
+            raise CompileError(msg)
+
         return self.last_compiler_output.get_pipeline_output(pipeline)
@@ -180,10 +180,11 @@ def time_function(fn, args, kwargs):
 def measure_program_size(results, size_from):
     """Collect program size information by counting the number of newlines in the textual form
     of a given program representation. The representation is assumed to be provided in the
-    instrumented function results at the provided index.
+    instrumented function results at the provided index, where a single result is treated as
+    the first element of a sequence.
 
     Args:
-        results (Sequence): instrumented function results
+        results (Sequence | Any): instrumented function results
         size_from (int | None): result index to use for size measurement
 
     Returns:
@@ -192,6 +193,9 @@ def measure_program_size(results, size_from):
     if size_from is None:
         return None
 
+    if not isinstance(results, tuple):
+        results = (results,)
+
     return str(results[size_from]).count("\n")
 
 
@@ -16,11 +16,17 @@
 compilation of hybrid quantum-classical functions using Catalyst.
 """
 
+import asyncio
+import concurrent.futures
 import copy
 import functools
+import importlib
 import inspect
 import os
+import sys
+import threading
 import warnings
+import weakref
 
 import jax
 import jax.numpy as jnp
@@ -30,19 +36,33 @@ from jax.tree_util import tree_flatten, tree_unflatten
 from malt.core import config as ag_config
 
 import catalyst
+from catalyst.async_execution import get_async_executor
 from catalyst.autograph import ag_primitives, run_autograph
-from catalyst.compiled_functions import CompilationCache, CompiledFunction
-from catalyst.compiler import CompileOptions, Compiler
+from catalyst.compiled_functions import CacheKey, CompilationCache, CompiledFunction
+from catalyst.compiler import LINALG_LOWERINGS, CompileOptions, Compiler, get_module_ir
 from catalyst.debug.instruments import instrument
 from catalyst.jax_tracer import lower_jaxpr_to_mlir, trace_to_jaxpr
+from catalyst.persistent_cache import get_device_libraries, get_persistent_cache
 from catalyst.qfunc import QFunc
+from catalyst.saved_functions import (
+    get_compiled_function_metadata,
+    restore_compiled_function,
+    save_compiled_function,
+)
 from catalyst.tracing.contexts import EvaluationContext
 from catalyst.tracing.type_signatures import (
+    SHAPE_BUCKET_RULE_KEYS,
+    extend_bucketed_argument,
     filter_static_args,
     get_abstract_signature,
+    get_bucketed_result_axes,
+    get_decomposed_signature,
     get_type_annotations,
+    infer_abstracted_axes,
     merge_static_args,
+    pad_to_buckets,
     promote_arguments,
+    slice_from_buckets,
 )
 from catalyst.utils.c_template import mlir_type_to_numpy_type
 from catalyst.utils.exceptions import CompileError
@@ -74,24 +94,46 @@ class QJIT:
     """
 
     def __init__(self, fn, compile_options):
+        self._initialize(fn, compile_options)
+
+        # Static arguments require values, so we cannot AOT compile.
+        if self.user_sig is not None and not self.compile_options.static_argnums:
+            self.aot_compile()
+
+    def _initialize(self, fn, compile_options):
+        """Set up the function for compilation, without compiling it."""
         self.original_function = fn
         self.compile_options = compile_options
         self.compiler = Compiler(compile_options)
+        self.persistent_cache = get_persistent_cache(compile_options.persistent_cache)
         self.fn_cache = CompilationCache(
-            compile_options.static_argnums, compile_options.abstracted_axes
+            compile_options.static_argnums,
+            compile_options.abstracted_axes,
+            compile_options.cache_max_entries,
+            compile_options.cache_max_bytes,
         )
         # Active state of the compiler.
         # TODO: rework ownership of workspace, possibly CompiledFunction
         self.workspace = None
         self.c_sig = None
         self.out_treedef = None
+        # Axes of the results following the padded length of each bucketed argument.
+        self.bucket_axes = {}
         self.compiled_function = None
         self.jaxed_function = None
+        self.batched_function = None
+        # Guards the compilation cache and the active state against concurrent calls. It is
+        # reentrant, since JAX may invoke the function while dispatching to the JAX integration.
+        self.lock = threading.RLock()
         # IRs are only available for the most recently traced function.
         self.jaxpr = None
-        self.mlir = None  # string form (historic presence)
         self.mlir_module = None
+        self._mlir = None  # canonicalized string form and its module, generated on access
         self.qir = None
+        # Traces of the QNodes called by the program, reused when capturing it for new signatures.
+        self.qnode_traces = weakref.WeakKeyDictionary()
+        # Signatures compiled for each cache key, from which dynamic shapes are inferred.
+        self.shape_history = {}
 
         functools.update_wrapper(self, fn)
         self.user_sig = get_type_annotations(fn)
@@ -109,28 +151,194 @@ class QJIT:
         ):
             self.user_function = self.pre_compilation()
 
-        # Static arguments require values, so we cannot AOT compile.
-        if self.user_sig is not None and not self.compile_options.static_argnums:
-            self.aot_compile()
+    def __getstate__(self):
+        """Serialize the function along with the shared objects of its compiled versions, such that
+        it can be sent to other processes without compiling it again. The IRs of the function and
+        a custom ``logfile`` are not preserved."""
+        self.fn_cache.collect_pending()
+
+        versions = []
+        for key, entry in self.fn_cache.lru.values():
+            metadata = get_compiled_function_metadata(
+                entry.compiled_fn,
+                entry.signature,
+                entry.out_treedef,
+                key.static_args,
+                entry.compiled_fn.device_libraries,
+            )
+            with open(entry.compiled_fn.shared_object.shared_object_file, "rb") as f:
+                versions.append((metadata, f.read(), entry.compiled_fn is self.compiled_function))
+
+        # Functions decorated at the module level are only reachable through their QJIT object,
+        # hence they are serialized by reference.
+        try:
+            module = sys.modules.get(self.__module__)
+            by_reference = functools.reduce(getattr, self.__qualname__.split("."), module) is self
+        except AttributeError:
+            by_reference = False
+
+        return {
+            "fn": (self.__module__, self.__qualname__) if by_reference else self.original_function,
+            "by_reference": by_reference,
+            "compile_options": {
+                k: v for k, v in vars(self.compile_options).items() if k != "logfile"
+            },
+            "versions": versions,
+        }
+
+    def __setstate__(self, state):
+        fn = state["fn"]
+        if state["by_reference"]:
+            module_name, qualname = fn
+            module = importlib.import_module(module_name)
+            fn = functools.reduce(getattr, qualname.split("."), module).original_function
+
+        self._initialize(fn, CompileOptions(**state["compile_options"]))
+
+        # The shared objects are only loaded once a compiled version is first called. They are
+        # copied to in-memory files where supported, such that the workspaces written here can be
+        # removed right away instead of accumulating in processes that unpickle many functions.
+        for metadata, shared_object, active in state["versions"]:
+            workspace = self._get_workspace()
+            shared_object_file = os.path.join(str(workspace), f"{metadata['func_name']}.so")
+            with open(shared_object_file, "wb") as f:
+                f.write(shared_object)
+
+            options = {**metadata["compile_options"], "in_memory_workspace": True}
+            compiled_fn, signature, out_treedef, static_args = restore_compiled_function(
+                shared_object_file, {**metadata, "compile_options": options}, lazy=True
+            )
+            if compiled_fn.shared_object.memory_file is not None:
+                workspace.remove()
+            self.fn_cache.restore(compiled_fn, signature, static_args, out_treedef, workspace)
+            if active:
+                self.workspace = workspace
+                self.compiled_function = compiled_fn
+                self.out_treedef = out_treedef
+                self.c_sig = signature
 
     def __call__(self, *args, **kwargs):
+        return self.call_into(None, *args, **kwargs)
+
+    def call_into(self, out, /, *args, **kwargs):
+        """Call the function, writing its results into buffers provided by the caller.
+
+        Args:
+            out (Optional[Any]): a PyTree matching the results of the function, with a writeable
+                NumPy array of the same shape and element type per result, or ``None`` for
+                results that are returned as new arrays
+            *args: the positional arguments of the function
+            **kwargs: the keyword arguments of the function
+
+        Returns:
+            Any: results of the execution arranged into the original function's output PyTrees,
+            with the buffers in place of the results written into them
+
+        Raises:
+            CompileError: if output buffers are provided while tracing, or with ``shape_buckets``
+        """
         # Transparantly call Python function in case of nested QJIT calls.
         if EvaluationContext.is_tracing():
+            if out is not None:
+                raise CompileError("Output buffers are not supported when tracing.")
             return self.user_function(*args, **kwargs)
 
-        requires_promotion = self.jit_compile(args)
+        has_tracers = any(isinstance(arg, jax.core.Tracer) for arg in tree_flatten(args)[0])
+
+        if out is not None and has_tracers:
+            raise CompileError("Output buffers are not supported when tracing with JAX.")
+        if out is not None and self.compile_options.shape_buckets:
+            raise CompileError("Output buffers cannot be combined with 'shape_buckets'.")
+
+        # Pad bucketed arguments, the lengths are needed to slice the results back.
+        shape_buckets, bucket_lengths = self.compile_options.shape_buckets, None
+        if shape_buckets and not has_tracers:
+            args, bucket_lengths = pad_to_buckets(args, shape_buckets)
+
+        # The compiled function is executed outside of the lock, such that concurrent calls from
+        # different threads only serialize on the cache lookup and on compilation. It is pinned
+        # while the lock is held, such that versions evicted by other calls remain loaded.
+        with self.lock:
+            requires_promotion = self.jit_compile(args)
+
+            # If we receive tracers as input, dispatch to the JAX integration.
+            if has_tracers:
+                if self.jaxed_function is None:
+                    self.jaxed_function = JAX_QJIT(self)  # lazy gradient compilation
+                return self.jaxed_function(*args, **kwargs)
+
+            if requires_promotion:
+                dynamic_args = filter_static_args(args, self.compile_options.static_argnums)
+                plan = self.compiled_function.promotion_plan
+                args = promote_arguments(self.c_sig, dynamic_args, plan)
+
+            compiled_function, out_treedef = self.compiled_function, self.out_treedef
+            compiled_function.shared_object.pin()
+
+        try:
+            results = self.run(args, kwargs, out, compiled_function, out_treedef)
+        finally:
+            compiled_function.shared_object.unpin()
+
+        if bucket_lengths is not None:
+            bucket_axes = compiled_function.bucket_axes
+            results = slice_from_buckets(results, shape_buckets, bucket_lengths, bucket_axes)
+
+        return results
 
-        # If we receive tracers as input, dispatch to the JAX integration.
-        if any(isinstance(arg, jax.core.Tracer) for arg in tree_flatten(args)[0]):
-            if self.jaxed_function is None:
-                self.jaxed_function = JAX_QJIT(self)  # lazy gradient compilation
-            return self.jaxed_function(*args, **kwargs)
+    async def acall(self, *args, **kwargs):
+        """Call the function from an asyncio task, without blocking the event loop.
 
-        elif requires_promotion:
-            dynamic_args = filter_static_args(args, self.compile_options.static_argnums)
-            args = promote_arguments(self.c_sig, dynamic_args)
+        The call, including the compilation of the function if required, is executed on the pool
+        of threads of the executor set via :func:`~.set_async_executor`, which bounds the number of
+        concurrent calls in total and per device. The devices of the function are only known once
+        it has been traced, hence the first compilation completes on the pool before the call is
+        admitted. Cancelling the awaiting task cancels the call if it has not started executing.
 
-        return self.run(args, kwargs)
+        Args:
+            *args: the positional arguments of the function
+            **kwargs: the keyword arguments of the function
+
+        Returns:
+            Any: results of the execution arranged into the original function's output PyTrees
+
+        **Example**
+
+        .. code-block:: python
+
+            @qjit
+            @qml.qnode(qml.device("lightning.qubit", wires=1))
+            def circuit(x):
+                qml.RX(x, wires=0)
+                return qml.expval(qml.PauliZ(0))
+
+            async def main():
+                return await asyncio.gather(*(circuit.acall(x) for x in jnp.linspace(0, 1, 10)))
+
+        >>> asyncio.run(main())[0]
+        Array(1., dtype=float64)
+        """
+        EvaluationContext.check_is_not_tracing("Cannot await a function while tracing.")
+
+        executor = get_async_executor()
+        if self.compiled_function is None and self.compile_options.target == "binary":
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(executor.pool, self._compile_for_call, args)
+
+        return await executor.run(self, *args, **kwargs)
+
+    def _compile_for_call(self, args):
+        """Compile the function for a call with the provided arguments, without executing it.
+
+        Args:
+            args (Iterable): the arguments of the call
+        """
+        shape_buckets = self.compile_options.shape_buckets
+        if shape_buckets:
+            args, _ = pad_to_buckets(args, shape_buckets)
+
+        with self.lock:
+            self.jit_compile(args)
 
     def aot_compile(self):
         """Compile Python function on initialization using the type hint signature."""
@@ -144,9 +352,10 @@ class QJIT:
                 (ag_primitives, "module_allowlist", self.patched_module_allowlist),
             ):
                 self.jaxpr, self.out_treedef, self.c_sig = self.capture(self.user_sig or ())
+                self.bucket_axes = self._get_bucket_axes(self.user_sig or ())
 
         if self.compile_options.target in ("mlir", "binary"):
-            self.mlir_module, self.mlir = self.generate_ir()
+            self.mlir_module = self.generate_ir()
 
         if self.compile_options.target in ("binary",):
             self.compiled_function, self.qir = self.compile()
@@ -175,35 +384,245 @@ class QJIT:
             # Cleanup before recompilation:
             #  - recompilation should always happen in new workspace
             #  - compiled functions for jax integration are not yet cached
-            #  - close existing shared library
+            # The existing shared library remains loaded as part of the cache.
             self.workspace = self._get_workspace()
             self.jaxed_function = None
-            if self.compiled_function and self.compiled_function.shared_object:
-                self.compiled_function.shared_object.close()
 
-            # Capture with the patched conversion rules
-            with Patcher(
-                (ag_primitives, "module_allowlist", self.patched_module_allowlist),
-            ):
-                self.jaxpr, self.out_treedef, self.c_sig = self.capture(args)
+            # The options only differ from the function's when a dynamically-shaped version is due.
+            with Patcher((self, "compile_options", self._get_auto_abstract_options(args))):
+                # Capture with the patched conversion rules
+                with Patcher(
+                    (ag_primitives, "module_allowlist", self.patched_module_allowlist),
+                ):
+                    self.jaxpr, self.out_treedef, self.c_sig = self.capture(args)
+                    self.bucket_axes = self._get_bucket_axes(args)
 
-            self.mlir_module, self.mlir = self.generate_ir()
-            self.compiled_function, self.qir = self.compile()
+                self.mlir_module = self.generate_ir()
+                self.compiled_function, self.qir = self.compile()
 
             self.fn_cache.insert(self.compiled_function, args, self.out_treedef, self.workspace)
 
         elif self.compiled_function is not cached_fn.compiled_fn:
-            # Restore active state from cache.
+            # Restore active state from cache, the shared library of cached functions is resident.
             self.workspace = cached_fn.workspace
             self.compiled_function = cached_fn.compiled_fn
             self.out_treedef = cached_fn.out_treedef
             self.c_sig = cached_fn.signature
             self.jaxed_function = None
 
-            self.compiled_function.shared_object.open()
-
         return requires_promotion
 
+    def compile_async(self, *args):
+        """Compile the function for the provided arguments in the background.
+
+        The program is captured and lowered to MLIR on the calling thread, while the compiler
+        driver and the linker run on a worker thread without holding the GIL. Once complete, the
+        compiled function is added to the cache of compiled versions. Calls with matching arguments
+        that occur in the meantime wait for the in-flight compilation instead of compiling the
+        function again.
+
+        Args:
+            *args: the arguments to compile the function for, which may be abstract values such
+                as ``jax.core.ShapedArray`` for non-static arguments
+
+        Returns:
+            concurrent.futures.Future[CompiledFunction]: the in-flight compilation
+
+        **Example**
+
+        .. code-block:: python
+
+            @qjit
+            def f(x):
+                return x * 2
+
+            future = f.compile_async(jax.core.ShapedArray((3,), jnp.float64))
+
+        >>> f(jnp.ones(3))  # waits for the background compilation
+        Array([2., 2., 2.], dtype=float64)
+        """
+        EvaluationContext.check_is_not_tracing("Cannot compile asynchronously while tracing.")
+
+        if self.compile_options.target != "binary":
+            raise CompileError("Asynchronous compilation requires the 'binary' target.")
+
+        # Requests are not counted in the statistics of the cache, which only reflect calls.
+        with self.lock:
+            pending = self.fn_cache.find_pending(args)
+            if pending is not None:
+                return pending.future
+
+            cached_fn = self.fn_cache.peek(args)
+            if cached_fn is not None:
+                future = concurrent.futures.Future()
+                future.set_result(cached_fn.compiled_fn)
+                return future
+
+            job, out_treedef = self.lower(args)
+            compiler = Compiler(job.options)
+
+            future = _get_compilation_executor().submit(lambda: job(compiler)[0])
+            self.fn_cache.insert_pending(
+                future, args, out_treedef, job.workspace, job.options.abstracted_axes
+            )
+        return future
+
+    def lower(self, args):
+        """Capture the function for the provided arguments and lower it to MLIR, in preparation of
+        a background compilation, such as by :meth:`compile_async` or :func:`~.warmup`. The active
+        state is only borrowed to produce the IR, since it must continue to reflect the function in
+        use by calls.
+
+        Args:
+            args (Iterable): arguments to use for program capture
+
+        Returns:
+            CompilationJob: the compilation job of the lowered program
+            PyTreeDef: PyTree metadata of the function output
+        """
+        active_state = (
+            self.workspace,
+            self.jaxpr,
+            self.out_treedef,
+            self.c_sig,
+            self.bucket_axes,
+            self.mlir_module,
+            self._mlir,
+        )
+        try:
+            self.workspace = self._get_workspace()
+
+            # The options only differ from the function's when a dynamically-shaped version is due.
+            with Patcher((self, "compile_options", self._get_auto_abstract_options(args))):
+                # Capture with the patched conversion rules
+                with Patcher(
+                    (ag_primitives, "module_allowlist", self.patched_module_allowlist),
+                ):
+                    self.jaxpr, self.out_treedef, self.c_sig = self.capture(args)
+                    self.bucket_axes = self._get_bucket_axes(args)
+
+                self.mlir_module = self.generate_ir()
+                return self._prepare_compilation(), self.out_treedef
+        finally:
+            (
+                self.workspace,
+                self.jaxpr,
+                self.out_treedef,
+                self.c_sig,
+                self.bucket_axes,
+                self.mlir_module,
+                self._mlir,
+            ) = active_state
+
+    def cache_info(self):
+        """Get statistics of the cache of compiled function versions, including the number of
+        cache hits, misses, and evictions.
+
+        Returns:
+            CacheInfo: the cache statistics
+        """
+        return self.fn_cache.info()
+
+    def save(self, path):
+        """Save the compiled function in use to a directory, from which it can be loaded in any
+        process via :func:`catalyst.load` without tracing or compiling it again.
+
+        The directory holds the shared object of the program, along with its argument signature,
+        output PyTree, result types, compilation options and the device libraries it uses.
+
+        Args:
+            path (str): directory to save the function to, created if necessary
+
+        Raises:
+            CompileError: if the function has not been compiled, or its static arguments or PyTrees
+                cannot be serialized
+        """
+        EvaluationContext.check_is_not_tracing("Cannot save a function while tracing.")
+
+        for key, entry in self.fn_cache.lru.values():
+            if entry.compiled_fn is self.compiled_function:
+                break
+        else:
+            raise CompileError("The function must be compiled before it can be saved.")
+
+        save_compiled_function(
+            path,
+            entry.compiled_fn,
+            entry.signature,
+            entry.out_treedef,
+            key.static_args,
+            entry.compiled_fn.device_libraries,
+        )
+
+    def batch(self, *args, out=None):
+        """Evaluate the function for a batch of arguments in a single call of a compiled program,
+        which loops over the batch natively instead of entering Python for each evaluation.
+
+        Dynamic arguments are stacked along a leading batch axis, while static arguments are shared
+        by all evaluations. The batched program is compiled on first use for each batch size and
+        argument signature, such that sweeps are best split into batches of a fixed size.
+
+        Args:
+            *args: the arguments of the function, with each dynamic argument stacked along a
+                leading axis of the same length
+            out (Optional[Any]): buffers to write the stacked results into, as for
+                :meth:`call_into`
+
+        Returns:
+            Any: the results of the function, each stacked along a leading batch axis
+
+        Raises:
+            CompileError: if the dynamic arguments are not stacked along a common leading axis
+
+        **Example**
+
+        .. code-block:: python
+
+            @qjit
+            @qml.qnode(qml.device("lightning.qubit", wires=1))
+            def circuit(x):
+                qml.RX(x, wires=0)
+                return qml.expval(qml.PauliZ(0))
+
+        >>> circuit.batch(jnp.linspace(0, 1, 5))
+        Array([1.        , 0.96891242, 0.87758256, 0.73168887, 0.54030231], dtype=float64)
+        """
+        static_argnums = self.compile_options.static_argnums
+        leaves = tree_flatten(filter_static_args(args, static_argnums))[0]
+        batch_sizes = {jnp.shape(leaf)[0] if jnp.ndim(leaf) else None for leaf in leaves}
+        if len(batch_sizes) != 1 or None in batch_sizes or 0 in batch_sizes:
+            shapes = [jnp.shape(leaf) for leaf in leaves]
+            raise CompileError(
+                "The dynamic arguments of a batch must be stacked along a leading axis of the same "
+                f"non-zero length, got arguments of shapes {shapes}."
+            )
+
+        def batched_wrapper(*args):
+            # Static arguments are bound, such that only the dynamic arguments are mapped.
+            def mapped_function(*dynamic_args):
+                return self(*merge_static_args(dynamic_args, args, static_argnums))
+
+            return catalyst.vmap(mapped_function)(*filter_static_args(args, static_argnums))
+
+        # Transparently map the Python function in case of nested QJIT calls.
+        if EvaluationContext.is_tracing():
+            if out is not None:
+                raise CompileError("Output buffers are not supported when tracing.")
+            return batched_wrapper(*args)
+
+        with self.lock:
+            if self.batched_function is None:
+                batched_wrapper.__name__ = "batched_" + self.__name__
+
+                # Leading batch axes invalidate the axis-specific options of the function.
+                options = copy.copy(self.compile_options)
+                options.abstracted_axes = None
+                options.auto_abstract = None
+                options.shape_buckets = None
+                self.batched_function = QJIT(batched_wrapper, options)
+
+        return self.batched_function.call_into(out, *args)
+
     # Processing Stages #
 
     @instrument
@@ -239,6 +658,7 @@ class QJIT:
 
         with Patcher(
             (qml.QNode, "__call__", QFunc.__call__),
+            (QFunc, "trace_cache", self.qnode_traces),
         ):
             # TODO: improve PyTree handling
             jaxpr, treedef = trace_to_jaxpr(
@@ -247,12 +667,48 @@ class QJIT:
 
         return jaxpr, treedef, dynamic_sig
 
-    @instrument(size_from=0, has_finegrained=True)
+    def _get_bucket_axes(self, args):
+        """Find the axes of the results to slice back to the original lengths of the bucketed
+        arguments. The function is traced once more for each bucketed argument, extended by one
+        entry along its bucketed axis, and the results whose length follows the argument are
+        identified from the change of their traced shapes.
+
+        Args:
+            args (Iterable): the padded arguments the function was captured for
+
+        Returns:
+            Dict[int, List[Optional[int]]]: the axis of each flattened result to slice, or
+            ``None``, for each bucketed argument
+        """
+        shape_buckets = self.compile_options.shape_buckets or {}
+
+        def get_result_shapes(jaxpr, out_treedef):
+            # Implicit results holding dynamic dimensions precede the results of the function.
+            out_avals = jaxpr.out_avals[len(jaxpr.out_avals) - out_treedef.num_leaves :]
+            return [aval.shape for aval in out_avals]
+
+        shapes = get_result_shapes(self.jaxpr, self.out_treedef)
+        bucket_axes = {}
+        for argnum, rule in shape_buckets.items():
+            if argnum >= len(args):
+                continue
+            extended_args = list(args)
+            extended_args[argnum] = extend_bucketed_argument(args[argnum], rule)
+            jaxpr, out_treedef, _ = self.capture(tuple(extended_args))
+
+            padded = args[argnum][0] if rule.get("mask", False) else args[argnum]
+            size = padded.shape[rule.get("axis", 0)]
+            extended_shapes = get_result_shapes(jaxpr, out_treedef)
+            bucket_axes[argnum] = get_bucketed_result_axes(shapes, extended_shapes, size)
+
+        return bucket_axes
+
+    @instrument(size_from=0)
     def generate_ir(self):
         """Generate Catalyst's intermediate representation (IR) as an MLIR module.
 
         Returns:
-            Tuple[ir.Module, str]: the in-memory MLIR module and its string representation
+            ir.Module: the in-memory MLIR module
         """
 
         mlir_module, ctx = lower_jaxpr_to_mlir(self.jaxpr, self.__name__)
@@ -260,16 +716,35 @@ class QJIT:
         # Inject Runtime Library-specific functions (e.g. setup/teardown).
         inject_functions(mlir_module, ctx)
 
-        # Canonicalize the MLIR since there can be a lot of redundancy coming from JAX.
-        options = copy.deepcopy(self.compile_options)
-        options.pipelines = [("0_canonicalize", ["canonicalize"])]
-        options.lower_to_llvm = False
-        canonicalizer = Compiler(options)
+        return mlir_module
+
+    @property
+    def mlir(self):
+        """str: The canonicalized textual MLIR of the most recently traced function.
+
+        The compiler canonicalizes the program as part of its pipelines, hence the canonicalized
+        text is only produced on first access via a separate compiler driver invocation.
+        """
+        if self.mlir_module is None:
+            return None
 
-        # TODO: the in-memory and textual form are different after this, consider unification
-        _, mlir_string, _ = canonicalizer.run(mlir_module, self.workspace)
+        if self._mlir is None or self._mlir[0] is not self.mlir_module:
+            # Canonicalize the MLIR since there can be a lot of redundancy coming from JAX.
+            options = copy.deepcopy(self.compile_options)
+            options.pipelines = [("0_canonicalize", ["canonicalize"])]
+            options.lower_to_llvm = False
+            options.keep_intermediate = False
+            canonicalizer = Compiler(options)
 
-        return mlir_module, mlir_string
+            # The workspace of a version loaded from an in-memory file is removed once loaded.
+            workspace = self.workspace
+            if workspace is None or not workspace.is_dir():
+                workspace = self._get_workspace()
+
+            _, mlir_string, _ = canonicalizer.run(self.mlir_module, workspace)
+            self._mlir = (self.mlir_module, mlir_string)
+
+        return self._mlir[1]
 
     @instrument(size_from=1, has_finegrained=True)
     def compile(self):
@@ -279,6 +754,18 @@ class QJIT:
             Tuple[CompiledFunction, str]: the compilation result and LLVMIR
         """
 
+        return self._prepare_compilation()(self.compiler)
+
+    def _prepare_compilation(self):
+        """Prepare the compilation of the current MLIR module.
+
+        All information required from the active state is gathered upfront, such that the returned
+        job can be executed on any thread.
+
+        Returns:
+            CompilationJob: the compilation job
+        """
+
         # WARNING: assumption is that the first function is the entry point to the compiled program.
         entry_point_func = self.mlir_module.body.operations[0]
         restype = entry_point_func.type.results
@@ -294,27 +781,81 @@ class QJIT:
         # The MLIR function name is actually a derived type from string which has no
         # `replace` method, so we need to get a regular Python string out of it.
         func_name = str(self.mlir_module.body.operations[0].name).replace('"', "")
-        shared_object, llvm_ir, _ = self.compiler.run(self.mlir_module, self.workspace)
-        compiled_fn = CompiledFunction(shared_object, func_name, restype, self.compile_options)
 
-        return compiled_fn, llvm_ir
+        # The module is serialized on the calling thread, since MLIR Python objects are not meant
+        # to be shared between threads.
+        ir = get_module_ir(self.mlir_module)
+        module_name = str(self.mlir_module.operation.attributes["sym_name"]).replace('"', "")
+
+        # The device libraries are recorded with the compiled version, since the module is replaced
+        # by later compilations and is not preserved when the function is pickled.
+        mlir_text = self.mlir_module.operation.get_asm(assume_verified=True)
+        job = CompilationJob(
+            ir,
+            module_name,
+            func_name,
+            restype,
+            self.workspace,
+            self.compile_options,
+            get_device_libraries(mlir_text),
+            self.bucket_axes,
+        )
+
+        # Intermediate results are not available for cached programs, so the persistent cache is
+        # bypassed when they are requested.
+        if self.persistent_cache is not None and not self.compile_options.keep_intermediate:
+            # The key is computed from the program before canonicalization, which avoids an
+            # additional compiler invocation.
+            cache_key = self.persistent_cache.get_key(mlir_text, self.compile_options)
+            job.cached_entry = self.persistent_cache.lookup(cache_key, self.workspace)
+            if job.cached_entry is None:
+                job.cache_insertion = (
+                    self.persistent_cache,
+                    cache_key,
+                    self.c_sig,
+                    self.out_treedef,
+                )
+
+        return job
 
     @instrument(has_finegrained=True)
-    def run(self, args, kwargs):
+    # pylint: disable=too-many-arguments
+    def run(self, args, kwargs, out=None, compiled_function=None, out_treedef=None):
         """Invoke a previously compiled function with the supplied arguments.
 
         Args:
             args (Iterable): the positional arguments to the compiled function
             kwargs: the keyword arguments to the compiled function
+            out (Optional[Any]): buffers to write the results into, arranged into the output
+                PyTrees with ``None`` for results that are returned as new arrays
+            compiled_function (Optional[CompiledFunction]): the compiled function to invoke,
+                which defaults to the active one
+            out_treedef (Optional[PyTreeDef]): PyTree metadata of the output of the compiled
+                function, which defaults to the active one
 
         Returns:
             Any: results of the execution arranged into the original function's output PyTrees
+
+        Raises:
+            CompileError: if the output buffers do not match the output PyTrees
         """
 
-        results = self.compiled_function(*args, **kwargs)
+        if compiled_function is None:
+            compiled_function, out_treedef = self.compiled_function, self.out_treedef
+
+        flat_out = None
+        if out is not None:
+            try:
+                flat_out = out_treedef.flatten_up_to(out)
+            except (ValueError, TypeError) as e:
+                raise CompileError(
+                    f"The output buffers do not match the structure {out_treedef} of the results."
+                ) from e
+
+        results = compiled_function.call_into(flat_out, *args, **kwargs)
 
         # TODO: Move this to the compiled function object.
-        return tree_unflatten(self.out_treedef, results)
+        return tree_unflatten(out_treedef, results)
 
     # Helper Methods #
 
@@ -328,6 +869,91 @@ class QJIT:
                 "In order for 'autograph_include' to work, 'autograph' must be set to True"
             )
 
+        if self.compile_options.linalg_lowering not in LINALG_LOWERINGS:
+            raise CompileError(
+                f"The linear algebra lowering must be one of {list(LINALG_LOWERINGS)}, "
+                f"got '{self.compile_options.linalg_lowering}'."
+            )
+
+        auto_abstract = self.compile_options.auto_abstract
+        if auto_abstract is not None:
+            if not isinstance(auto_abstract, int) or auto_abstract < 1:
+                raise CompileError(
+                    f"'auto_abstract' must be a positive integer, got {auto_abstract}."
+                )
+            if self.compile_options.abstracted_axes is not None:
+                raise CompileError("'auto_abstract' cannot be combined with 'abstracted_axes'.")
+
+        shape_buckets = self.compile_options.shape_buckets or {}
+        for argnum, rule in shape_buckets.items():
+            if argnum in self.compile_options.static_argnums:
+                raise CompileError(f"Static argument {argnum} cannot be bucketed.")
+            unknown_keys = set(rule) - set(SHAPE_BUCKET_RULE_KEYS)
+            if unknown_keys:
+                raise CompileError(
+                    f"Unknown keys {sorted(unknown_keys)} in the bucketing rule of argument "
+                    f"{argnum}, expected any of {list(SHAPE_BUCKET_RULE_KEYS)}."
+                )
+            buckets = rule.get("buckets")
+            if buckets is not None and list(buckets) != sorted(set(buckets)):
+                raise CompileError(
+                    f"The buckets of argument {argnum} must be increasing, got {buckets}."
+                )
+
+        for argnum in self.compile_options.donate_argnums:
+            if not isinstance(argnum, int) or argnum < 0:
+                raise CompileError(
+                    f"Donated argument indices must be non-negative integers, got {argnum}."
+                )
+            if argnum in self.compile_options.static_argnums:
+                raise CompileError(f"Static argument {argnum} cannot be donated.")
+
+        opt_level = self.compile_options.opt_level
+        if opt_level not in range(4):
+            raise CompileError(f"The optimization level must be 0, 1, 2, or 3, got {opt_level}.")
+
+    def _get_auto_abstract_options(self, args):
+        """Get the options to compile the function with for the provided arguments.
+
+        With ``auto_abstract``, the signatures of the compilations for each combination of PyTrees
+        and static arguments are recorded. Once enough of them differ from the provided arguments
+        only in the lengths of array axes, the returned options abstract the varying axes.
+
+        Args:
+            args (Iterable): arguments the function is about to be compiled for
+
+        Returns:
+            CompileOptions: the options to compile the function with
+        """
+        threshold = self.compile_options.auto_abstract
+        if threshold is None:
+            return self.compile_options
+
+        static_argnums = self.compile_options.static_argnums
+        flat_signature, treedef, static_args = get_decomposed_signature(args, static_argnums)
+        signature = tree_unflatten(treedef, flat_signature)
+        key = CacheKey(treedef, static_args)
+
+        history = self.shape_history.setdefault(key, [])
+        similar = [s for s in history if infer_abstracted_axes([s, signature])[0] is not None]
+        history.append(signature)
+        if len(similar) < threshold:
+            return self.compile_options
+
+        abstracted_axes, reasons = infer_abstracted_axes([*similar, signature])
+        del self.shape_history[key]
+
+        msg = (
+            f"Compiling a dynamically-shaped version of '{self.__name__}' after {len(similar)} "
+            f"compilations for arguments that differ only in axis lengths: {'; '.join(reasons)}. "
+            f"Inferred abstracted_axes={abstracted_axes}."
+        )
+        warnings.warn(msg, UserWarning)
+
+        options = copy.copy(self.compile_options)
+        options.abstracted_axes = abstracted_axes
+        return options
+
     def _verify_static_argnums(self, args):
         for argnum in self.compile_options.static_argnums:
             if argnum < 0 or argnum >= len(args):
@@ -340,7 +966,105 @@ class QJIT:
         workspace_name = self.__name__
         preferred_workspace_dir = os.getcwd() if self.compile_options.keep_intermediate else None
 
-        return WorkspaceManager.get_or_create_workspace(workspace_name, preferred_workspace_dir)
+        return WorkspaceManager.get_or_create_workspace(
+            workspace_name, preferred_workspace_dir, self.compile_options.in_memory_workspace
+        )
+
+
+class CompilationJob:
+    """The compilation of a program lowered to MLIR into a loaded shared object.
+
+    Jobs hold all the information required to complete the compilation, such that they can be run
+    on any thread. The compiler and linker stages are separated from loading the result, which
+    allows them to run in a different process.
+
+    Args:
+        ir (bytes): MLIR bytecode of the program
+        module_name (str): name of the MLIR module
+        func_name (str): name of the entry point function
+        restype (Iterable): MLIR tensor types representing the result of the entry point function
+        workspace (Directory): directory to hold the compilation artifacts
+        options (CompileOptions): compilation options to use
+        device_libraries (Iterable[str]): paths of the device libraries used by the program
+        bucket_axes (Optional[Dict[int, List[Optional[int]]]]): the axis of each flattened result
+            following the padded length of each bucketed argument
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        ir,
+        module_name,
+        func_name,
+        restype,
+        workspace,
+        options,
+        device_libraries=(),
+        bucket_axes=None,
+    ):
+        self.ir = ir
+        self.module_name = module_name
+        self.func_name = func_name
+        self.restype = restype
+        self.workspace = workspace
+        self.options = options
+        self.device_libraries = list(device_libraries)
+        self.bucket_axes = bucket_axes or {}
+        # Entry found in the persistent cache, which makes the compiler stages unnecessary.
+        self.cached_entry = None
+        # Persistent cache, key, signature and output PyTree to insert the result with.
+        self.cache_insertion = None
+
+    def run_compiler(self, compiler=None):
+        """Run the compiler and linker stages.
+
+        Args:
+            compiler (Optional[Compiler]): the compiler instance to run
+
+        Returns:
+            Tuple[str, str]: the filename of the shared object and its LLVMIR
+        """
+        if self.cached_entry is not None:
+            return self.cached_entry.shared_object_file, self.cached_entry.llvm_ir
+
+        compiler = compiler or Compiler(self.options)
+        shared_object, llvm_ir, _ = compiler.run_from_ir(self.ir, self.module_name, self.workspace)
+        return shared_object, llvm_ir
+
+    def load(self, shared_object, llvm_ir):
+        """Load the compiled shared object and store it in the persistent cache if requested.
+
+        Args:
+            shared_object (str): filename of the shared object
+            llvm_ir (str): LLVMIR of the program
+
+        Returns:
+            Tuple[CompiledFunction, str]: the compilation result and LLVMIR
+        """
+        compiled_fn = CompiledFunction(shared_object, self.func_name, self.restype, self.options)
+        compiled_fn.device_libraries = self.device_libraries
+        compiled_fn.bucket_axes = self.bucket_axes
+
+        if self.cache_insertion is not None:
+            cache, key, c_sig, out_treedef = self.cache_insertion
+            cache.insert(
+                key, shared_object, self.func_name, self.restype, llvm_ir, c_sig, out_treedef
+            )
+
+        # A library loaded from an in-memory file no longer depends on the workspace.
+        if compiled_fn.shared_object.memory_file is not None:
+            self.workspace.remove()
+
+        return compiled_fn, llvm_ir
+
+    def __call__(self, compiler=None):
+        return self.load(*self.run_compiler(compiler))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_compilation_executor():
+    """Get the pool of worker threads running background compilations."""
+    return concurrent.futures.ThreadPoolExecutor(thread_name_prefix="catalyst-compile")
 
 
 class JAX_QJIT:
@@ -462,6 +1186,19 @@ def qjit(
     pipelines=None,
     static_argnums=None,
     abstracted_axes=None,
+    persistent_context=False,
+    persistent_cache=False,
+    cache_max_entries=None,
+    cache_max_bytes=None,
+    in_memory_workspace=False,
+    opt_level=2,
+    target_cpu=None,
+    target_features=None,
+    linalg_lowering="loops",
+    stage_cache=False,
+    auto_abstract=None,
+    shape_buckets=None,
+    donate_argnums=None,
 ):  # pylint: disable=too-many-arguments,unused-argument
     """A just-in-time decorator for PennyLane and JAX programs using Catalyst.
 
@@ -505,6 +1242,79 @@ def qjit(
             Function arguments with ``abstracted_axes`` specified will be compiled to ranked tensors
             with dynamic shapes. For more details, please see the Dynamically-shaped Arrays section
             below.
+        persistent_context (bool): If ``True``, the runtime execution context, including the pool
+            of instantiated devices and their loaded libraries, is kept alive between calls of the
+            compiled function instead of being re-created on every call. Devices are reset and
+            reused across calls. The context is released when the compiled function is closed or
+            garbage collected. For more details, please see the Persistent Execution Context
+            section below.
+        persistent_cache (bool or str): If ``True``, compiled programs are stored in an on-disk
+            cache shared between processes, located at ``$CATALYST_CACHE_DIR`` or
+            ``~/.cache/catalyst`` by default. A path can be provided instead to use a custom cache
+            location. Programs found in the cache skip the MLIR, LLVM, and linking stages. The
+            cache size is bounded by ``$CATALYST_CACHE_MAX_SIZE`` bytes (1 GiB by default), beyond
+            which the least recently used entries are evicted.
+        cache_max_entries (Optional[int]): The maximum number of compiled versions of the function,
+            for different argument signatures or static arguments, to keep loaded in memory. When
+            exceeded, the least recently used version is unloaded and its workspace removed.
+            Defaults to ``None``, which keeps all versions. Cache statistics are available via
+            :meth:`~.QJIT.cache_info`.
+        cache_max_bytes (Optional[int]): The maximum total size in bytes of the compiled versions
+            of the function to keep loaded in memory. Defaults to ``None`` (unbounded).
+        in_memory_workspace (bool): If ``True``, compilation artifacts are written to a
+            memory-backed temporary directory (such as ``/dev/shm`` on Linux) instead of the
+            system's temporary directory, and the compiled library is loaded from an anonymous
+            in-memory file, which allows the workspace to be removed as soon as the library is
+            loaded. Ignored when ``keep_intermediate`` is ``True``, in which case intermediate
+            files are written to disk.
+        opt_level (int): The optimization level from 0 to 3, which trades off compilation time
+            against the performance of the compiled program. Level 0 skips optional optimization
+            passes and runs the LLVM stages without optimizations, for fast compilation during
+            development and testing. Level 3 adds aggressive inlining, loop unrolling,
+            vectorization and code generation. Defaults to ``2``. The pipelines run at a given
+            level are available via :meth:`~.CompileOptions.get_pipelines`.
+        target_cpu (Optional[str]): The CPU to generate code for, such as ``"skylake-avx512"``, or
+            ``"native"`` for the CPU of the machine compiling the program. This allows the
+            classical processing of the program to use the vector instructions of the CPU, but the
+            compiled program may not run on other CPUs. Defaults to ``None``, which targets a
+            generic CPU of the host architecture.
+        target_features (Optional[str]): Comma-separated target features to enable or disable in
+            addition to the features of the target CPU, such as ``"+avx2,+fma"``. Defaults to
+            ``None``.
+        linalg_lowering (str): The lowering of linear algebra operations, such as matrix products,
+            reductions, and elementwise operations on arrays. ``"loops"`` (the default) lowers them
+            to scalar loop nests. ``"vectorize"`` tiles the loop nests and vectorizes their
+            innermost loops, which speeds up heavy classical processing on large arrays at the
+            cost of compilation time. ``"parallel"`` additionally executes the outermost loops in
+            parallel on a pool of threads.
+        stage_cache (bool): If ``True``, the compiler keeps the program after each of its pipelines
+            in memory, keyed on the program and the pipelines run so far. Later compilations of
+            the same program, for instance with different final ``pipelines`` or with
+            ``async_qnodes`` toggled, then resume from the output of the last shared pipeline
+            rather than from the start. Ignored when ``keep_intermediate`` is ``True``, which is
+            required to inspect the output of the pipelines.
+        auto_abstract (int): If set, the function is compiled with dynamically-shaped arguments
+            once it has been compiled this many times for arguments that differ only in the
+            lengths of some array axes, such as batches of varying size. The abstracted axes are
+            inferred from the observed shapes and all future calls with matching arguments use the
+            dynamically-shaped version. A warning reports the axes which caused the promotion.
+            Cannot be combined with ``abstracted_axes``. Defaults to ``None``.
+        shape_buckets (Dict[int, Dict]): Pads array arguments along one axis up to the next of a
+            set of bucket sizes, such that a single version is compiled per bucket while keeping
+            statically-shaped code. Maps the index of each bucketed argument to its rule, a
+            dictionary with the optional keys ``"axis"`` (the padded axis, ``0`` by default),
+            ``"buckets"`` (the increasing bucket sizes, the powers of two by default),
+            ``"pad_value"`` (``0`` by default), ``"mask"`` (if ``True``, the function receives a
+            tuple of the padded array and a boolean mask of its valid entries along the axis), and
+            ``"slice_outputs"`` (if ``True``, the default, results whose traced length follows the
+            padded length of the argument are sliced back to the original length). Lengths beyond
+            the largest bucket are not padded. Defaults to ``None``.
+        donate_argnums (int or Sequence[int]): An index or a sequence of indices of arguments
+            whose buffers may be overwritten with the results of the function. Writeable NumPy
+            arrays among these arguments receive the results matching them in shape and element
+            type, instead of new arrays being allocated for the results. The donated arrays must
+            not be used by the caller afterwards. Defaults to ``None``. For more details, please
+            see the Output Buffers section below.
 
     Returns:
         QJIT object.
@@ -812,6 +1622,69 @@ def qjit(
 
         the ``sum_abstracted`` function would only compile once and its definition would be
         reused for subsequent function calls.
+
+    .. details::
+        :title: Persistent execution context
+
+        By default, every call of a compiled function creates a fresh runtime execution context,
+        which loads the device library and instantiates the device, and destroys it again once the
+        call returns. For small circuits that are evaluated many times, for instance inside of an
+        optimization loop, this setup cost can dominate the execution time.
+
+        .. code-block:: python
+
+            @qjit(persistent_context=True)
+            @qml.qnode(qml.device("lightning.qubit", wires=2))
+            def circuit(x):
+                qml.RX(x, wires=0)
+                qml.CNOT(wires=[0, 1])
+                return qml.expval(qml.PauliZ(1))
+
+            for x in jnp.linspace(0, 1, 1000):
+                circuit(x)  # the device is reset, not re-created
+
+            circuit.compiled_function.close()  # release the execution context
+
+        Since the Catalyst runtime holds a single execution context per process, the persistent
+        context is shared among all compiled functions and remains alive until the last compiled
+        function requesting it is closed or garbage collected.
+
+    .. details::
+        :title: Output buffers
+
+        The results of a compiled function can be written into arrays provided by the caller via
+        :meth:`.QJIT.call_into`, which takes a PyTree matching the results of the function with a
+        writeable NumPy array of the same shape and element type per result, or ``None`` for
+        results that are returned as new arrays. The buffers are returned in place of the results,
+        such that loops can reuse the same memory on every iteration.
+
+        .. code-block:: python
+
+            @qjit
+            def step(x):
+                return x * 0.5, jnp.sum(x)
+
+            x, total = np.ones(1000), np.empty(())
+            for _ in range(100):
+                x, total = step.call_into((x, total), x)
+
+        With ``donate_argnums``, the arrays passed as the donated arguments are reused for the
+        results matching them in shape and element type, without providing output buffers:
+
+        .. code-block:: python
+
+            @qjit(donate_argnums=0)
+            def step(x):
+                return x * 0.5
+
+            x = np.ones(1000)
+            y = step(x)  # y is x, which now holds the result
+
+        The results are computed in memory allocated by the runtime and copied into their buffers
+        once the program returns, hence buffers save the allocation of arrays on the caller's
+        side rather than the copy. Results aliasing a buffer, such as an argument returned
+        unchanged, are copied before any buffer is overwritten. Output buffers are not supported
+        when the function is traced by JAX, or combined with ``shape_buckets``.
     """
     kwargs = copy.copy(locals())
     kwargs.pop("fn")
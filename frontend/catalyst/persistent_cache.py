@@ -0,0 +1,331 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This module contains an on-disk cache for compiled programs, which allows compilation results
+to be shared between processes."""
+
+import fcntl
+import hashlib
+import os
+import pathlib
+import pickle
+import platform
+import re
+import shutil
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, List
+
+import jax
+import jaxlib
+from jax.tree_util import tree_flatten, tree_structure, tree_unflatten
+
+import catalyst
+
+DEFAULT_MAX_CACHE_SIZE = 1 << 30  # 1 GiB
+
+
+def get_default_cache_dir():
+    """Get the default location of the persistent compilation cache.
+
+    The location can be set via the ``CATALYST_CACHE_DIR`` environment variable, otherwise it
+    defaults to ``catalyst`` inside of the user cache directory (``$XDG_CACHE_HOME`` or
+    ``~/.cache``).
+    """
+    cache_dir = os.environ.get("CATALYST_CACHE_DIR")
+    if cache_dir:
+        return pathlib.Path(cache_dir)
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return pathlib.Path(cache_home) / "catalyst"
+
+
+def get_default_max_cache_size():
+    """Get the default size limit of the persistent compilation cache in bytes, which can be set
+    via the ``CATALYST_CACHE_MAX_SIZE`` environment variable."""
+    return int(os.environ.get("CATALYST_CACHE_MAX_SIZE", DEFAULT_MAX_CACHE_SIZE))
+
+
+def _file_fingerprint(filename):
+    """Identify the version of a file on disk without reading its contents."""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return (str(filename), None, None)
+    return (str(filename), stat.st_size, stat.st_mtime_ns)
+
+
+def get_device_libraries(mlir):
+    """Extract the paths of all device libraries referenced by a textual MLIR program."""
+    return sorted(set(re.findall(r'quantum\.device\s*\[\s*"([^"]*)"', mlir)))
+
+
+def serialize_signature(signature):
+    """Convert an abstract signature (a PyTree of ShapedArrays) into a picklable form.
+
+    Args:
+        signature (Iterable[ShapedArray]): abstract signature to convert
+
+    Returns:
+        Tuple[Any, List[Tuple]]: a placeholder PyTree and the flat (shape, dtype, weak type) data
+    """
+    flat_signature, treedef = tree_flatten(signature)
+    placeholder = tree_unflatten(treedef, range(len(flat_signature)))
+    flat_data = [(aval.shape, aval.dtype.name, aval.weak_type) for aval in flat_signature]
+    return placeholder, flat_data
+
+
+def deserialize_signature(serialized_signature):
+    """Inverse of :func:`serialize_signature`."""
+    placeholder, flat_data = serialized_signature
+    treedef = tree_structure(placeholder)
+    flat_signature = [
+        jax.core.ShapedArray(shape, dtype, weak_type=weak_type)
+        for shape, dtype, weak_type in flat_data
+    ]
+    return tree_unflatten(treedef, flat_signature)
+
+
+def serialize_treedef(treedef):
+    """Convert a PyTreeDef into a picklable placeholder PyTree."""
+    return tree_unflatten(treedef, range(treedef.num_leaves))
+
+
+def deserialize_treedef(placeholder):
+    """Inverse of :func:`serialize_treedef`."""
+    return tree_structure(placeholder)
+
+
+@dataclass
+class PersistentCacheEntry:
+    """An entry in the persistent compilation cache.
+
+    Besides the linked shared object, the entry holds the metadata required to invoke the compiled
+    function without recompiling it.
+    """
+
+    shared_object_file: str
+    func_name: str
+    restype: List[str]
+    llvm_ir: str
+    signature: Any
+    out_treedef: Any
+
+
+class PersistentCache:
+    """On-disk cache of compiled programs shared between processes.
+
+    Each entry is stored in its own directory, identified by a hash of the canonical MLIR of the
+    program, the compilation options that affect code generation, the Catalyst, JAX, and compiler
+    versions, as well as the device libraries referenced by the program. Entries are published
+    atomically, and concurrent readers and writers are synchronized with a file lock. Once the
+    total size of the cache exceeds its limit, the least recently used entries are evicted.
+
+    Args:
+        path (Optional[str]): directory of the cache, defaults to :func:`get_default_cache_dir`
+        max_size (Optional[int]): size limit of the cache in bytes, defaults to
+            :func:`get_default_max_cache_size`
+    """
+
+    shared_object_name = "lib.so"
+    metadata_name = "metadata.pickle"
+    lock_name = ".lock"
+
+    def __init__(self, path=None, max_size=None):
+        self.path = pathlib.Path(path) if path is not None else get_default_cache_dir()
+        self.max_size = max_size if max_size is not None else get_default_max_cache_size()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_key(mlir, options):
+        """Compute the cache key of a program.
+
+        Args:
+            mlir (str): canonical textual MLIR of the program
+            options (CompileOptions): compilation options used for the program
+
+        Returns:
+            str: hexadecimal digest identifying the compilation result
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from mlir_quantum import compiler_driver
+
+        hasher = hashlib.sha256()
+
+        def update(value):
+            hasher.update(repr(value).encode())
+            hasher.update(b"\0")
+
+        update(catalyst.__version__)
+        update(catalyst.__revision__)
+        update(jaxlib.__version__)
+        update(platform.machine())
+        update(_file_fingerprint(compiler_driver.__file__))
+        update(options.get_pipelines())
+        update(options.lower_to_llvm)
+        update(options.async_qnodes)
+        update(options.opt_level)
+        update(options.target_cpu)
+        update(options.target_features)
+        if options.target_cpu == "native":
+            # Programs compiled for the host CPU must not be shared between different machines.
+            update(compiler_driver.get_host_cpu())
+        for library in get_device_libraries(mlir):
+            update(_file_fingerprint(library))
+        hasher.update(mlir.encode())
+
+        return hasher.hexdigest()
+
+    @contextmanager
+    def _lock(self, exclusive):
+        with open(self.path / self.lock_name, "a", encoding="utf-8") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def lookup(self, key, workspace):
+        """Retrieve a compiled program from the cache.
+
+        The shared object is copied into the provided workspace, such that the cached entry can be
+        evicted independently of its users.
+
+        Args:
+            key (str): the cache key of the program
+            workspace (Directory): directory to place the shared object into
+
+        Returns:
+            PersistentCacheEntry | None: the cache entry, if present and readable
+        """
+        entry_dir = self.path / key
+        with self._lock(exclusive=False):
+            if not entry_dir.is_dir():
+                return None
+
+            try:
+                with open(entry_dir / self.metadata_name, "rb") as metadata_file:
+                    metadata = pickle.load(metadata_file)
+                shared_object_file = os.path.join(str(workspace), f"{metadata['func_name']}.so")
+                shutil.copyfile(entry_dir / self.shared_object_name, shared_object_file)
+                # Mark the entry as recently used.
+                os.utime(entry_dir / self.metadata_name)
+            except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+                return None
+
+        return PersistentCacheEntry(
+            shared_object_file,
+            metadata["func_name"],
+            metadata["restype"],
+            metadata["llvm_ir"],
+            deserialize_signature(metadata["signature"]),
+            deserialize_treedef(metadata["out_treedef"]),
+        )
+
+    # pylint: disable=too-many-arguments
+    def insert(self, key, shared_object_file, func_name, restype, llvm_ir, signature, out_treedef):
+        """Store a compiled program in the cache, then evict entries to respect the size limit.
+
+        Args:
+            key (str): the cache key of the program
+            shared_object_file (str): path to the linked shared object
+            func_name (str): name of the compiled function
+            restype (Iterable): MLIR tensor types representing the result of the compiled function
+            llvm_ir (str): LLVM IR of the compiled program
+            signature (Iterable[ShapedArray]): dynamic argument signature of the compiled function
+            out_treedef (PyTreeDef): PyTree metadata of the function output
+
+        Returns:
+            bool: whether the program was added to the cache
+        """
+        try:
+            metadata = pickle.dumps(
+                {
+                    "func_name": func_name,
+                    "restype": [str(t) for t in restype],
+                    "llvm_ir": llvm_ir,
+                    "signature": serialize_signature(signature),
+                    "out_treedef": serialize_treedef(out_treedef),
+                }
+            )
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Programs with non-serializable PyTree nodes are not cached.
+            return False
+
+        # Build the entry outside of the lock and publish it with an atomic rename.
+        staging_dir = pathlib.Path(tempfile.mkdtemp(prefix=".staging_", dir=self.path))
+        try:
+            shutil.copyfile(shared_object_file, staging_dir / self.shared_object_name)
+            with open(staging_dir / self.metadata_name, "wb") as metadata_file:
+                metadata_file.write(metadata)
+
+            with self._lock(exclusive=True):
+                entry_dir = self.path / key
+                if entry_dir.exists():
+                    return False
+                os.rename(staging_dir, entry_dir)
+                self._evict(keep=key)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        return True
+
+    def _entries(self):
+        """Collect the size and last use time of all entries in the cache."""
+        entries = []
+        for entry_dir in self.path.iterdir():
+            if not entry_dir.is_dir() or entry_dir.name.startswith("."):
+                continue
+            try:
+                size = sum(f.stat().st_size for f in entry_dir.iterdir())
+                last_use = (entry_dir / self.metadata_name).stat().st_mtime_ns
+            except OSError:
+                continue
+            entries.append((last_use, size, entry_dir))
+        return entries
+
+    def _evict(self, keep=None):
+        """Remove the least recently used entries until the cache fits its size limit. Requires
+        the exclusive lock to be held."""
+        entries = sorted(self._entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in entries:
+            if total_size <= self.max_size:
+                break
+            if entry_dir.name == keep:
+                continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total_size -= size
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock(exclusive=True):
+            for _, _, entry_dir in self._entries():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+
+
+def get_persistent_cache(option):
+    """Create the persistent cache requested by the ``persistent_cache`` compilation option.
+
+    Args:
+        option (bool | str | None): ``True`` for the default location, a path for a custom
+            location, and ``False`` or ``None`` to disable the cache
+
+    Returns:
+        PersistentCache | None
+    """
+    if not option:
+        return None
+    return PersistentCache(None if option is True else option)
@@ -19,7 +19,7 @@ the default behaviour and replacing it with a function-like "QNode" primitive.
 """
 
 import pennylane as qml
-from jax.core import eval_jaxpr
+from jax.core import ShapedArray, Tracer, eval_jaxpr
 from jax.tree_util import tree_flatten, tree_unflatten
 
 from catalyst.device import (
@@ -54,6 +54,11 @@ class QFunc:
             the valid gate set for the quantum function
     """
 
+    # Traces of quantum functions, indexed by QNode and then by abstract call signature. This is
+    # set by the QJIT object during program capture, such that recompilations of the enclosing
+    # program (e.g. for new static arguments) reuse the traces of QNodes whose calls are unchanged.
+    trace_cache = None
+
     def __new__(cls):
         raise NotImplementedError()  # pragma: no-cover
 
@@ -64,6 +69,44 @@ class QFunc:
         """Wrapper around extract_backend_info in the runtime module."""
         return extract_backend_info(device, capabilities)
 
+    @staticmethod
+    def get_trace_key(qnode: qml.QNode, args, kwargs):
+        """Get the key identifying the trace of a QNode for the given arguments.
+
+        Traces are only reused for statically-shaped traced arguments and hashable keyword
+        arguments, ``None`` is returned otherwise.
+        """
+        args_flat, in_tree = tree_flatten(args)
+        if not all(isinstance(a, Tracer) and type(a.aval) is ShapedArray for a in args_flat):
+            return None
+
+        key = (
+            in_tree,
+            tuple(a.aval for a in args_flat),
+            tuple(sorted(kwargs.items())),
+            qnode.device,
+            qnode.device.shots,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def trace(self, qjit_device, args, kwargs):
+        """Trace the quantum function of a QNode, reusing a previous trace if available."""
+        assert isinstance(self, qml.QNode)
+
+        cache = QFunc.trace_cache
+        key = QFunc.get_trace_key(self, args, kwargs) if cache is not None else None
+        if key is not None and key in cache.get(self, {}):
+            return cache[self][key]
+
+        traced = trace_quantum_function(self.func, qjit_device, args, kwargs, qnode=self)
+        if key is not None and not any(isinstance(c, Tracer) for c in traced[0].consts):
+            cache.setdefault(self, {})[key] = traced
+        return traced
+
     # pylint: disable=no-member, attribute-defined-outside-init
     def __call__(self, *args, **kwargs):
         assert isinstance(self, qml.QNode)
@@ -85,9 +128,7 @@ class QFunc:
             )
 
         def _eval_quantum(*args):
-            closed_jaxpr, out_type, out_tree = trace_quantum_function(
-                self.func, qjit_device, args, kwargs, qnode=self
-            )
+            closed_jaxpr, out_type, out_tree = QFunc.trace(self, qjit_device, args, kwargs)
             args_expanded = get_implicit_and_explicit_flat_args(None, *args)
             res_expanded = eval_jaxpr(closed_jaxpr.jaxpr, closed_jaxpr.consts, *args_expanded)
             _, out_keep = unzip2(out_type)
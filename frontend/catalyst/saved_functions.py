@@ -0,0 +1,260 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This module contains the saving of compiled functions to disk and their loading, which allows
+compiled programs to be deployed without tracing or compiling them again."""
+
+import os
+import pathlib
+import pickle
+import shutil
+import warnings
+
+from jax.interpreters import mlir
+from jax.tree_util import tree_unflatten
+
+import catalyst
+from catalyst.compiled_functions import CompiledFunction
+from catalyst.compiler import CompileOptions
+from catalyst.persistent_cache import (
+    deserialize_signature,
+    deserialize_treedef,
+    serialize_signature,
+    serialize_treedef,
+)
+from catalyst.tracing.type_signatures import (
+    TypeCompatibility,
+    get_abstract_signature,
+    merge_static_args,
+    pad_to_buckets,
+    promote_arguments,
+    slice_from_buckets,
+    split_static_args,
+    typecheck_signatures,
+)
+from catalyst.utils.exceptions import CompileError
+
+SAVED_FUNCTION_FORMAT = 1
+SHARED_OBJECT_NAME = "lib.so"
+METADATA_NAME = "metadata.pickle"
+
+
+def get_compiled_function_metadata(
+    compiled_fn, signature, out_treedef, static_args, device_libraries=()
+):
+    """Get the metadata required to invoke a compiled function in another process, in a form that
+    can be pickled.
+
+    Args:
+        compiled_fn (CompiledFunction): the compiled function
+        signature (Iterable[ShapedArray]): dynamic argument signature of the compiled function
+        out_treedef (PyTreeDef): PyTree metadata of the function output
+        static_args (Tuple[Any]): values of the static arguments the function was compiled for
+        device_libraries (Iterable[str]): paths of the device libraries used by the program
+
+    Returns:
+        Dict[str, Any]: the metadata of the compiled function
+    """
+    options = {k: v for k, v in vars(compiled_fn.compile_options).items() if k != "logfile"}
+    return {
+        "format": SAVED_FUNCTION_FORMAT,
+        "catalyst_version": catalyst.__version__,
+        "func_name": compiled_fn.func_name,
+        "restype": [str(t) for t in compiled_fn.restype],
+        "signature": serialize_signature(signature),
+        "out_treedef": serialize_treedef(out_treedef),
+        "static_args": static_args,
+        "compile_options": options,
+        "device_libraries": list(device_libraries),
+        "bucket_axes": compiled_fn.bucket_axes,
+    }
+
+
+def restore_compiled_function(shared_object_file, metadata, lazy=False):
+    """Restore a compiled function from its shared object and metadata.
+
+    Args:
+        shared_object_file (str): path to the shared object of the compiled function
+        metadata (Dict[str, Any]): the metadata from :func:`get_compiled_function_metadata`
+        lazy (bool): whether to defer loading the shared object until the first invocation
+
+    Returns:
+        CompiledFunction: the compiled function
+        Iterable[ShapedArray]: dynamic argument signature of the compiled function
+        PyTreeDef: PyTree metadata of the function output
+        Tuple[Any]: values of the static arguments the function was compiled for
+    """
+    # The result types keep their context alive, which is only used to describe the results.
+    with mlir.ir.Context():
+        restype = [mlir.ir.Type.parse(t) for t in metadata["restype"]]
+
+    options = CompileOptions(**metadata["compile_options"])
+    compiled_fn = CompiledFunction(
+        shared_object_file, metadata["func_name"], restype, options, lazy
+    )
+    compiled_fn.device_libraries = list(metadata["device_libraries"])
+    compiled_fn.bucket_axes = metadata["bucket_axes"]
+
+    return (
+        compiled_fn,
+        deserialize_signature(metadata["signature"]),
+        deserialize_treedef(metadata["out_treedef"]),
+        metadata["static_args"],
+    )
+
+
+# pylint: disable=too-many-arguments
+def save_compiled_function(
+    path, compiled_fn, signature, out_treedef, static_args, device_libraries=()
+):
+    """Write a compiled function to a directory, along with the metadata required to invoke it.
+
+    Args:
+        path (str): directory to write the function to, created if necessary
+        compiled_fn (CompiledFunction): the compiled function
+        signature (Iterable[ShapedArray]): dynamic argument signature of the compiled function
+        out_treedef (PyTreeDef): PyTree metadata of the function output
+        static_args (Tuple[Any]): values of the static arguments the function was compiled for
+        device_libraries (Iterable[str]): paths of the device libraries used by the program
+
+    Raises:
+        CompileError: if the static arguments or the PyTrees cannot be serialized
+    """
+    metadata = get_compiled_function_metadata(
+        compiled_fn, signature, out_treedef, static_args, device_libraries
+    )
+    try:
+        metadata = pickle.dumps(metadata)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        raise CompileError(
+            "Cannot save a function with non-serializable static arguments or PyTrees."
+        ) from e
+
+    path = pathlib.Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(compiled_fn.shared_object.shared_object_file, path / SHARED_OBJECT_NAME)
+    with open(path / METADATA_NAME, "wb") as metadata_file:
+        metadata_file.write(metadata)
+
+
+def load(path):
+    """Load a function saved via :meth:`.QJIT.save`.
+
+    The compiled program is loaded directly from its shared object, without tracing or compiling
+    the function. The loaded function accepts arguments matching the signature it was compiled
+    for, including arguments that can be promoted to it, and the same static argument values.
+
+    Args:
+        path (str): directory the function was saved to
+
+    Returns:
+        LoadedFunction: the callable compiled function
+
+    Raises:
+        CompileError: if the directory does not contain a saved function, or if a device library
+            used by the program is not available
+
+    **Example**
+
+    .. code-block:: python
+
+        @qjit
+        @qml.qnode(qml.device("lightning.qubit", wires=1))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit(0.5)
+        circuit.save("circuit")
+
+    In a fresh environment:
+
+    >>> circuit = catalyst.load("circuit")
+    >>> circuit(0.3)
+    Array(0.95533649, dtype=float64)
+    """
+    path = pathlib.Path(path)
+    try:
+        with open(path / METADATA_NAME, "rb") as metadata_file:
+            metadata = pickle.load(metadata_file)
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        raise CompileError(f"No saved function found in '{path}'.") from e
+
+    if metadata.get("format") != SAVED_FUNCTION_FORMAT:
+        raise CompileError(f"Unsupported format of the saved function in '{path}'.")
+
+    if metadata["catalyst_version"] != catalyst.__version__:
+        msg = (
+            f"The function in '{path}' was saved with Catalyst {metadata['catalyst_version']}, "
+            f"but Catalyst {catalyst.__version__} is installed."
+        )
+        warnings.warn(msg, UserWarning)
+
+    missing = [lib for lib in metadata["device_libraries"] if not os.path.exists(lib)]
+    if missing:
+        raise CompileError(f"Device libraries used by the saved function are missing: {missing}")
+
+    return LoadedFunction(*restore_compiled_function(str(path / SHARED_OBJECT_NAME), metadata))
+
+
+class LoadedFunction:
+    """A compiled function loaded from disk via :func:`~.load`.
+
+    Args:
+        compiled_fn (CompiledFunction): the loaded compiled function
+        signature (Iterable[ShapedArray]): dynamic argument signature of the compiled function
+        out_treedef (PyTreeDef): PyTree metadata of the function output
+        static_args (Tuple[Any]): values of the static arguments the function was compiled for
+    """
+
+    def __init__(self, compiled_fn, signature, out_treedef, static_args):
+        self.compiled_function = compiled_fn
+        self.signature = signature
+        self.out_treedef = out_treedef
+        self.static_args = static_args
+        compiled_fn.prepare(signature)
+
+    def __call__(self, *args):
+        options = self.compiled_function.compile_options
+
+        shape_buckets, bucket_lengths = options.shape_buckets, None
+        if shape_buckets:
+            args, bucket_lengths = pad_to_buckets(args, shape_buckets)
+
+        dynamic_args, static_args = split_static_args(args, options.static_argnums)
+        if static_args != self.static_args:
+            raise CompileError(
+                f"The saved function was compiled for the static arguments {self.static_args}, "
+                f"got {static_args}."
+            )
+
+        runtime_signature = get_abstract_signature(dynamic_args)
+        action = typecheck_signatures(self.signature, runtime_signature, options.abstracted_axes)
+        if action == TypeCompatibility.NEEDS_COMPILATION:
+            raise CompileError(
+                f"The arguments with signature {runtime_signature} do not match the signature "
+                f"{self.signature} of the saved function."
+            )
+        if action == TypeCompatibility.NEEDS_PROMOTION:
+            plan = self.compiled_function.promotion_plan
+            dynamic_args = promote_arguments(self.signature, dynamic_args, plan)
+            args = merge_static_args(dynamic_args, args, options.static_argnums)
+
+        results = tree_unflatten(self.out_treedef, self.compiled_function(*args))
+
+        if bucket_lengths is not None:
+            bucket_axes = self.compiled_function.bucket_axes
+            results = slice_from_buckets(results, shape_buckets, bucket_lengths, bucket_axes)
+
+        return results
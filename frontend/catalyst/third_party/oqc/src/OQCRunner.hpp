@@ -125,6 +125,9 @@ struct OQCRunner : public OQCRunnerBase {
 
         RT_FAIL_IF(!Py_IsInitialized(), "The Python interpreter is not initialized");
 
+        // Compiled programs are executed with the GIL released.
+        py::gil_scoped_acquire gil;
+
         auto locals = py::dict("circuit"_a = circuit, "device"_a = device, "kwargs"_a = kwargs,
                                "shots"_a = shots, "msg"_a = "");
 
@@ -22,14 +22,23 @@ import inspect
 from typing import Callable
 
 import jax
+import numpy as np
+from jax._src.array import ArrayImpl
 from jax._src.interpreters.partial_eval import infer_lambda_input_type
 from jax._src.pjit import _flat_axes_specs
 from jax.api_util import shaped_abstractify
 from jax.tree_util import tree_flatten, tree_unflatten
 
 from catalyst.jax_extras import get_aval2
+from catalyst.utils.exceptions import CompileError
 from catalyst.utils.patching import Patcher
 
+# Keys of the rule declared for each bucketed argument, see ``qjit(shape_buckets=...)``.
+SHAPE_BUCKET_RULE_KEYS = ("axis", "buckets", "pad_value", "mask", "slice_outputs")
+
+# Python scalars are fingerprinted by their type, which determines their abstract value.
+_SCALAR_TYPES = (bool, int, float, complex)
+
 
 def get_param_annotations(fn: Callable):
     """Return true all parameters typed-annotations."""
@@ -128,6 +137,35 @@ def merge_static_args(signature, args, static_argnums):
     return tuple(merged_sig)
 
 
+def get_fingerprint(flat_args):
+    """Get a cheap fingerprint of flattened arguments, from which their abstract values can be
+    determined. Equal fingerprints imply equal signatures, such that the fingerprint can be used
+    to check for a previously matched signature without abstracting the arguments.
+
+    Only concrete arrays and Python scalars are fingerprinted, by their element type, shape, and
+    weak type, or by their type respectively.
+
+    Args:
+        flat_args (Iterable): flattened arguments
+
+    Returns:
+        Tuple | None: the fingerprint, or ``None`` if an argument cannot be fingerprinted
+    """
+    fingerprint = []
+    for arg in flat_args:
+        arg_type = type(arg)
+        if arg_type is ArrayImpl:
+            fingerprint.append((arg.dtype, arg.shape, arg.weak_type))
+        elif arg_type is np.ndarray or isinstance(arg, np.generic):
+            fingerprint.append((arg.dtype, arg.shape, False))
+        elif arg_type in _SCALAR_TYPES:
+            fingerprint.append(arg_type)
+        else:
+            return None
+
+    return tuple(fingerprint)
+
+
 def get_decomposed_signature(args, static_argnums):
     """Decompose function arguments into dynamic and static arguments, where the dynamic arguments
     are further processed into abstract values and PyTree metadata. All values returned by this
@@ -149,6 +187,49 @@ def get_decomposed_signature(args, static_argnums):
     return flat_signature, treedef, static_args
 
 
+def infer_abstracted_axes(signatures):
+    """Infer the abstracted axes specification under which the provided signatures are equivalent.
+
+    The signatures must only differ in the lengths of array axes. Each axis whose length varies
+    between the signatures is abstracted, where axes with equal lengths in every signature share a
+    name, such that operations requiring them to match remain valid.
+
+    Args:
+        signatures (Iterable[Iterable[ShapedArray]]): signatures of the dynamic arguments with
+            matching PyTrees
+
+    Returns:
+        Tuple | None: the abstracted axes specification with a dictionary for each array, or
+            ``None`` if the signatures differ in more than axis lengths or not at all
+        List[str]: a description of each abstracted axis
+    """
+    flat_sigs = [tree_flatten(sig)[0] for sig in signatures]
+    treedef = tree_flatten(signatures[0])[1]
+
+    for flat_sig in flat_sigs[1:]:
+        for aval, other in zip(flat_sigs[0], flat_sig):
+            if aval.dtype != other.dtype or aval.ndim != other.ndim:
+                return None, []
+
+    names = {}
+    flat_axes, descriptions = [], []
+    for i, aval in enumerate(flat_sigs[0]):
+        axes = {}
+        for axis in range(aval.ndim):
+            lengths = tuple(flat_sig[i].shape[axis] for flat_sig in flat_sigs)
+            if len(set(lengths)) > 1:
+                axes[axis] = names.setdefault(lengths, f"n{len(names)}")
+                descriptions.append(
+                    f"axis {axis} of array argument {i} took the lengths {list(lengths)}"
+                )
+        flat_axes.append(axes)
+
+    if not names:
+        return None, []
+
+    return tree_unflatten(treedef, flat_axes), descriptions
+
+
 class TypeCompatibility(enum.Enum):
     """Enum class to indicate result of type compatibility analysis between two signatures."""
 
@@ -193,8 +274,8 @@ def typecheck_signatures(compiled_signature, runtime_signature, abstracted_axes=
         (jax._src.interpreters.partial_eval, "get_aval", get_aval2),
     ):
         # TODO: do away with private jax functions
-        axes_specs_compile = _flat_axes_specs(abstracted_axes, *compiled_signature, {})
-        axes_specs_runtime = _flat_axes_specs(abstracted_axes, *runtime_signature, {})
+        axes_specs_compile = _flat_axes_specs(abstracted_axes, *compiled_signature)
+        axes_specs_runtime = _flat_axes_specs(abstracted_axes, *runtime_signature)
         in_type_compiled = infer_lambda_input_type(axes_specs_compile, flat_compiled_sig)
         in_type_runtime = infer_lambda_input_type(axes_specs_runtime, flat_runtime_sig)
 
@@ -216,27 +297,190 @@ def typecheck_signatures(compiled_signature, runtime_signature, abstracted_axes=
     return action
 
 
-def promote_arguments(target_signature, args):
-    """Promote arguments to the provided target signature, preserving PyTrees.
+def get_promotion_plan(target_signature):
+    """Precompute the promotion of arguments to the provided target signature.
+
+    Args:
+        target_signature (Iterable): target signature to promote arguments to
+
+    Returns:
+        PyTreeDef: PyTree metadata of the target signature
+        Tuple[np.dtype]: element types of the flattened target signature
+    """
+    flat_target_sig, target_treedef = tree_flatten(target_signature)
+    assert all(isinstance(c_param, jax.core.ShapedArray) for c_param in flat_target_sig)
+    return target_treedef, tuple(c_param.dtype for c_param in flat_target_sig)
+
+
+def promote_arguments(target_signature, args, plan=None):
+    """Promote arguments to the provided target signature, preserving PyTrees. Arguments whose
+    element type already matches the target signature are left unchanged.
 
     Args:
         target_signature (Iterable): target signature to promote arguments to
         args (Iterable): arguments to promote, must have matching PyTrees with target signature
+        plan (Optional[Tuple]): the promotion plan from :func:`get_promotion_plan` for the target
+            signature, computed if not provided
 
     Returns:
         Iterable: arguments promoted to target signature
     """
-    flat_target_sig, target_treedef = tree_flatten(target_signature)
+    target_treedef, target_dtypes = plan or get_promotion_plan(target_signature)
     flat_args, treedef = tree_flatten(args)
     assert target_treedef == treedef, "Argument PyTrees did not match target signature."
 
-    promoted_args = []
-    for c_param, r_param in zip(flat_target_sig, flat_args):
-        assert isinstance(c_param, jax.core.ShapedArray)
-        r_param = jax.numpy.asarray(r_param)
-        arg_dtype = r_param.dtype
-        promote_to = jax.numpy.promote_types(arg_dtype, c_param.dtype)
-        promoted_arg = jax.numpy.asarray(r_param, dtype=promote_to)
-        promoted_args.append(promoted_arg)
+    # Arguments are only promoted to the target element type if they are compatible, as
+    # established by typecheck_signatures.
+    promoted_args = [
+        arg if getattr(arg, "dtype", None) == dtype else jax.numpy.asarray(arg, dtype=dtype)
+        for arg, dtype in zip(flat_args, target_dtypes)
+    ]
 
     return tree_unflatten(treedef, promoted_args)
+
+
+def get_bucket_size(length, buckets=None):
+    """Get the size of the smallest bucket that holds an axis of the provided length.
+
+    Args:
+        length (int): the length of the axis
+        buckets (Optional[Iterable[int]]): the increasing bucket sizes, or ``None`` for the powers
+            of two
+
+    Returns:
+        int: the bucket size, or the length itself if it exceeds the largest bucket
+    """
+    if buckets is None:
+        return 1 << max(length - 1, 0).bit_length()
+
+    for size in buckets:
+        if size >= length:
+            return size
+
+    return length
+
+
+def pad_to_buckets(args, shape_buckets):
+    """Pad array arguments along an axis up to the size of the next bucket, following the rule
+    declared for each bucketed argument.
+
+    Args:
+        args (Iterable): the positional arguments of a function call
+        shape_buckets (Dict[int, Dict]): the bucketing rule of each bucketed argument index
+
+    Returns:
+        Tuple: the padded arguments, where arguments with a mask are replaced by a tuple of the
+            padded array and a boolean mask of its valid entries along the bucketed axis
+        Dict[int, Tuple[int, int]]: the original and padded lengths of each bucketed argument
+    """
+    args = list(args)
+    lengths = {}
+    for argnum, rule in shape_buckets.items():
+        if argnum >= len(args):
+            raise CompileError(f"Bucketed argument {argnum} is beyond the {len(args)} arguments.")
+
+        arg = np.asarray(args[argnum])
+        axis = rule.get("axis", 0)
+        if axis >= arg.ndim:
+            raise CompileError(
+                f"Bucketed axis {axis} is beyond the {arg.ndim} dimensions of argument {argnum}."
+            )
+
+        length = arg.shape[axis]
+        size = get_bucket_size(length, rule.get("buckets"))
+        if size > length:
+            pad_width = [(0, 0)] * arg.ndim
+            pad_width[axis] = (0, size - length)
+            arg = np.pad(arg, pad_width, constant_values=rule.get("pad_value", 0))
+
+        args[argnum] = (arg, np.arange(size) < length) if rule.get("mask", False) else arg
+        lengths[argnum] = (length, size)
+
+    return tuple(args), lengths
+
+
+def extend_bucketed_argument(arg, rule):
+    """Get the abstract value of a padded argument extended by one entry along its bucketed axis.
+
+    Args:
+        arg (Any): the padded argument, or the tuple of the padded argument and its mask
+        rule (Dict): the bucketing rule of the argument
+
+    Returns:
+        Any: the abstract value of the extended argument, preserving the mask
+    """
+
+    def extend(leaf, axis):
+        aval = leaf if isinstance(leaf, jax.core.ShapedArray) else shaped_abstractify(leaf)
+        shape = list(aval.shape)
+        shape[axis] += 1
+        return aval.update(shape=tuple(shape))
+
+    if rule.get("mask", False):
+        array, mask = arg
+        return extend(array, rule.get("axis", 0)), extend(mask, 0)
+    return extend(arg, rule.get("axis", 0))
+
+
+def get_bucketed_result_axes(shapes, extended_shapes, size):
+    """Find the axis of each result whose length is the padded length of a bucketed argument, from
+    the result shapes traced for the padded argument and for the argument extended by one entry.
+
+    Results whose length only coincides with the padded length, such as results of a constant
+    size, keep their length when the argument is extended and are therefore not matched.
+
+    Args:
+        shapes (Iterable[Tuple[int]]): the shapes of the flattened results for the padded argument
+        extended_shapes (Iterable[Tuple[int]]): the shapes of the flattened results for the
+            extended argument
+        size (int): the padded length of the argument
+
+    Returns:
+        List[Optional[int]]: the axis of each result to slice, or ``None`` for results which do not
+        follow the length of the argument
+    """
+    result_axes = []
+    for shape, extended_shape in zip(shapes, extended_shapes):
+        axes = [
+            axis
+            for axis, (length, extended_length) in enumerate(zip(shape, extended_shape))
+            if length == size and extended_length == size + 1
+        ]
+        result_axes.append(axes[0] if axes else None)
+    return result_axes
+
+
+def slice_from_buckets(results, shape_buckets, lengths, result_axes):
+    """Slice the results of a call with padded arguments back to the original lengths.
+
+    A result is sliced along the axes which follow the padded length of a bucketed argument, as
+    determined when the function is traced, unless the rule of the argument disables the slicing
+    of outputs.
+
+    Args:
+        results (Any): the results of the call
+        shape_buckets (Dict[int, Dict]): the bucketing rule of each bucketed argument index
+        lengths (Dict[int, Tuple[int, int]]): the original and padded lengths of each bucketed
+            argument, as returned by :func:`pad_to_buckets`
+        result_axes (Dict[int, List[Optional[int]]]): the axis of each flattened result to slice
+            for each bucketed argument, as returned by :func:`get_bucketed_result_axes`
+
+    Returns:
+        Any: the sliced results, preserving PyTrees
+    """
+    flat_results, treedef = tree_flatten(results)
+
+    sliced_results = []
+    for i, result in enumerate(flat_results):
+        sliced_axes = set()
+        for argnum, (length, size) in lengths.items():
+            rule = shape_buckets[argnum]
+            axis = result_axes[argnum][i] if argnum in result_axes else None
+            if not rule.get("slice_outputs", True) or length == size or axis is None:
+                continue
+            if axis not in sliced_axes:
+                result = result[(slice(None),) * axis + (slice(0, length),)]
+                sliced_axes.add(axis)
+        sliced_results.append(result)
+
+    return tree_unflatten(treedef, sliced_results)
@@ -15,6 +15,7 @@
 Functions to interface with the filesystem.
 """
 
+import os
 import pathlib
 import shutil
 import sys
@@ -43,7 +44,8 @@ class Directory:
         confirm it.
         """
         if isinstance(self._impl, tempfile.TemporaryDirectory):
-            return True
+            # Temporary directories can be removed eagerly, see ``remove``.
+            return pathlib.Path(self._impl.name).is_dir()
         return self._impl.is_dir()
 
     def cleanup(self):
@@ -54,6 +56,12 @@ class Directory:
             return
         shutil.rmtree(str(self))
 
+    def remove(self):
+        """Remove a temporary directory eagerly, rather than once it is no longer referenced.
+        Other directories are left in place."""
+        if isinstance(self._impl, tempfile.TemporaryDirectory):
+            self._impl.cleanup()
+
 
 class TemporaryDirectorySilent(tempfile.TemporaryDirectory):
     """Derived class from tempfile.TemporaryDirectory
@@ -75,6 +83,40 @@ class TemporaryDirectorySilent(tempfile.TemporaryDirectory):
         tempfile.TemporaryDirectory._rmtree(name, **kwargs)
 
 
+def get_memory_tempdir():
+    """Find a directory backed by memory rather than disk, such as ``/dev/shm`` on Linux.
+
+    Returns:
+        Optional[pathlib.Path]: the memory-backed directory, or None if none is available
+    """
+    shm = pathlib.Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return None  # pragma: nocover
+
+
+def copy_to_memory_file(filename):
+    """Copy a file into an anonymous in-memory file.
+
+    The contents can be accessed through the path ``/proc/self/fd/<fd>`` as long as the returned
+    file descriptor is open, independently of the original file.
+
+    Args:
+        filename (str): the file to copy
+
+    Returns:
+        Optional[int]: file descriptor of the in-memory file, or None if the operating system does
+        not support anonymous in-memory files
+    """
+    if not hasattr(os, "memfd_create"):
+        return None  # pragma: nocover
+
+    fd = os.memfd_create(os.path.basename(filename), os.MFD_CLOEXEC)
+    with open(filename, "rb") as src, open(fd, "wb", closefd=False) as dst:
+        shutil.copyfileobj(src, dst)
+    return fd
+
+
 class WorkspaceManager:
     """Singleton object that manages the output files for the IR.
 
@@ -88,9 +130,11 @@ class WorkspaceManager:
     # Operating System agnostic way of finding out what is the temporary
     # directory. See https://docs.python.org/3.10/library/tempfile.html#tempfile.gettempdir
     tempdir = pathlib.Path(tempfile.gettempdir())
+    # Temporary directory backed by memory, used for in-memory workspaces if available.
+    memory_tempdir = get_memory_tempdir()
 
     @staticmethod
-    def get_or_create_workspace(name, path=None):
+    def get_or_create_workspace(name, path=None, in_memory=False):
         """
         Args:
             name (str): Directory name
@@ -98,19 +142,26 @@ class WorkspaceManager:
                                 If path is None, then it will be a temporary directory
                                 stored in whatever temporary directory is specific to the
                                 operating system.
+            in_memory (bool): If True and path is None, the temporary directory is placed on a
+                              memory-backed filesystem if one is available.
         """
-        path, name = WorkspaceManager._get_preferred_abspath(name, path)
+        path, name = WorkspaceManager._get_preferred_abspath(name, path, in_memory)
         return Directory(WorkspaceManager._get_or_create_directory(path, name))
 
     @staticmethod
-    def _get_preferred_abspath(name, path=None):
-        preferred_path = pathlib.Path(path) if path is not None else WorkspaceManager.tempdir
+    def _get_preferred_abspath(name, path=None, in_memory=False):
+        if path is not None:
+            preferred_path = pathlib.Path(path)
+        elif in_memory and WorkspaceManager.memory_tempdir is not None:
+            preferred_path = WorkspaceManager.memory_tempdir
+        else:
+            preferred_path = WorkspaceManager.tempdir
         preferred_name = pathlib.Path(name)
         return preferred_path, preferred_name
 
     @staticmethod
     def _get_or_create_directory(path, name):
-        if path == WorkspaceManager.tempdir:
+        if path in (WorkspaceManager.tempdir, WorkspaceManager.memory_tempdir):
             # TODO: Once Python 3.12 becomes the least supported version of python, consider
             # setting the fields: delete and delete_on_close.
             # This can likely avoid having all the code below.
@@ -214,7 +214,12 @@ py::list wrap(py::object func, py::tuple py_args, py::object result_desc, py::ob
     auto value1 = py_args.attr("__getitem__")(1);
     void *value1_ptr = *reinterpret_cast<void **>(ctypes.attr("addressof")(value1).cast<size_t>());
 
-    f_ptr(value0_ptr, value1_ptr);
+    {
+        // Release the GIL while the compiled program is running, such that other threads,
+        // including concurrent invocations of compiled programs, can make progress.
+        py::gil_scoped_release release;
+        f_ptr(value0_ptr, value1_ptr);
+    }
     returns = move_returns(value0_ptr, result_desc, transfer, numpy_arrays);
 
     return returns;
@@ -0,0 +1,149 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""This module contains the batch compilation of many QJIT functions in parallel."""
+
+import concurrent.futures
+import copy
+import multiprocessing
+import pathlib
+
+from jax.tree_util import tree_unflatten
+
+from catalyst.compiler import Compiler
+from catalyst.jit import QJIT
+from catalyst.tracing.contexts import EvaluationContext
+from catalyst.tracing.type_signatures import (
+    TypeCompatibility,
+    get_decomposed_signature,
+    typecheck_signatures,
+)
+from catalyst.utils.exceptions import CompileError
+from catalyst.utils.filesystem import Directory
+
+
+def _run_compiler(ir, module_name, workspace, options):
+    """Run the compiler and linker stages of a program in a worker process.
+
+    Returns:
+        Tuple[str, str]: the filename of the shared object and its LLVMIR
+    """
+    shared_object, llvm_ir, _ = Compiler(options).run_from_ir(
+        ir, module_name, Directory(pathlib.Path(workspace))
+    )
+    return shared_object, llvm_ir
+
+
+def warmup(functions, max_workers=None):
+    """Compile many qjit-compiled functions ahead of their first use, in parallel.
+
+    Each function is captured and lowered to MLIR in the calling process, after which the
+    compiler and linker stages of all functions are distributed over a pool of worker processes.
+    The resulting shared objects are loaded into the cache of compiled versions of each function,
+    such that subsequent calls with matching arguments do not trigger compilation. Functions which
+    are already compiled for the provided arguments are skipped, and repeated entries with the
+    same argument signature are compiled once.
+
+    Args:
+        functions (Iterable[Tuple[QJIT, Iterable]]): pairs of qjit-compiled functions and the
+            arguments to compile them for, which may be abstract values such as
+            ``jax.core.ShapedArray`` for non-static arguments
+        max_workers (Optional[int]): the maximum number of worker processes. Defaults to the number
+            of processors on the machine.
+
+    Raises:
+        CompileError: if an entry is not a qjit-compiled function with the ``binary`` target
+
+    **Example**
+
+    .. code-block:: python
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        @qjit
+        @qml.qnode(qml.device("lightning.qubit", wires=1))
+        def g(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        catalyst.warmup([(f, (ShapedArray((3,), jnp.float64),)), (g, (0.5,))], max_workers=2)
+
+    >>> g(0.5)  # does not trigger compilation
+    array(0.87758256)
+    """
+    EvaluationContext.check_is_not_tracing("Cannot warm up functions while tracing.")
+
+    functions = [(fn, tuple(args)) for fn, args in functions]
+    for fn, _ in functions:
+        if not isinstance(fn, QJIT):
+            raise CompileError(f"Expected a qjit-compiled function, got {fn}.")
+        if fn.compile_options.target != "binary":
+            raise CompileError("Warming up functions requires the 'binary' target.")
+
+    # Tracing is not thread-safe and relies on the state of the calling process, hence all
+    # functions are lowered upfront. The lock of each function guards its active state against
+    # concurrent calls.
+    lowered = []
+    signatures = []
+    for fn, args in functions:
+        flat_signature, treedef, static_args = get_decomposed_signature(
+            args, fn.compile_options.static_argnums
+        )
+        key, signature = (treedef, static_args), tree_unflatten(treedef, flat_signature)
+
+        # Entries which the version of an earlier entry will serve, such as entries differing only
+        # in weakly-typed scalars, are compiled once.
+        if any(
+            other is fn
+            and other_key == key
+            and typecheck_signatures(other_signature, signature, job.options.abstracted_axes)
+            != TypeCompatibility.NEEDS_COMPILATION
+            for (other, _, job, _), (other_key, other_signature) in zip(lowered, signatures)
+        ):
+            continue
+
+        with fn.lock:
+            action, _ = fn.fn_cache.get_function_status_and_key(args)
+            if action != TypeCompatibility.NEEDS_COMPILATION or fn.fn_cache.find_pending(args):
+                continue
+            job, out_treedef = fn.lower(args)
+        lowered.append((fn, args, job, out_treedef))
+        signatures.append((key, signature))
+
+    if not lowered:
+        return
+
+    # Worker processes are spawned rather than forked, since the calling process may hold locks of
+    # JAX or compiler threads.
+    mp_context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(max_workers, mp_context=mp_context) as executor:
+        futures = []
+        for _, _, job, _ in lowered:
+            if job.cached_entry is not None:
+                futures.append(None)
+                continue
+            # The log file cannot be transferred to another process.
+            options = copy.copy(job.options)
+            options.logfile = None
+            futures.append(
+                executor.submit(_run_compiler, job.ir, job.module_name, str(job.workspace), options)
+            )
+
+        for (fn, args, job, out_treedef), future in zip(lowered, futures):
+            compiler_output = job.run_compiler() if future is None else future.result()
+            compiled_fn, _ = job.load(*compiler_output)
+            with fn.lock:
+                fn.fn_cache.insert(compiled_fn, args, out_treedef, job.workspace)
@@ -56,9 +56,7 @@ with instrumentation(circuit.__name__, filename=None, detailed=False):
 # COM: Note that finegrained output is produced *before* the high-level output in console mode.
 # CHECK:      [DIAGNOSTICS] > Total pre_compilation
 # CHECK-NEXT: [DIAGNOSTICS] > Total capture
-# COM: Do not check detailed output from the first call to the compiler, e.g. 0_Canonicalize,
-# COM: as we may want to remove that in the future.
-# CHECK:      [DIAGNOSTICS] > Total generate_ir
+# CHECK-NEXT: [DIAGNOSTICS] > Total generate_ir
 # CHECK-NEXT: [DIAGNOSTICS] Running parseMLIRSource
 # CHECK-SAME:   walltime: {{[0-9\.]+}} ms{{\s*}} cputime: {{[0-9\.]+}} ms{{\s*}} programsize: {{[0-9]+}} lines
 # CHECK-NEXT: [DIAGNOSTICS] Running {{[a-zA-Z]+}}Pass
@@ -97,10 +97,7 @@ with open(filename, mode="r", encoding="UTF-8") as f:
 # CHECK-NEXT:       walltime:
 # CHECK-NEXT:       cputime:
 # CHECK-NEXT:       programsize:
-# CHECK-NEXT:       finegrained:
-# COM: Do not check detailed output from the first call to the compiler, e.g. 0_Canonicalize,
-# COM: as we may want to remove that in the future.
-# CHECK:        - compile:
+# CHECK-NEXT:   - compile:
 # CHECK-NEXT:       walltime:
 # CHECK-NEXT:       cputime:
 # CHECK-NEXT:       programsize:
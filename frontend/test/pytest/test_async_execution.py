@@ -0,0 +1,205 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the execution of compiled functions from asyncio programs."""
+
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pennylane as qml
+import pytest
+
+import catalyst
+from catalyst import AsyncExecutor, qjit
+from catalyst.async_execution import get_async_executor, get_device_types
+
+
+class TrackedFunction:
+    """A function standing in for a compiled QNode, which records the peak number of its
+    concurrent calls."""
+
+    def __init__(self, qnode, duration=0.01):
+        self.original_function = qnode
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, x):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.duration)
+        with self.lock:
+            self.running -= 1
+        return x
+
+
+@pytest.fixture(name="qnode")
+def fixture_qnode(backend):
+    """A QNode on the backend device."""
+
+    @qml.qnode(qml.device(backend, wires=1))
+    def circuit(x):
+        qml.RX(x, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    return circuit
+
+
+def test_acall(qnode):
+    """Test that awaited calls produce the same results as blocking calls."""
+
+    circuit = qjit(qnode)
+    xs = np.linspace(0, np.pi, 20)
+
+    async def main():
+        return await asyncio.gather(*(circuit.acall(x) for x in xs))
+
+    results = asyncio.run(main())
+    assert np.allclose(results, [circuit(x) for x in xs])
+    assert get_device_types(circuit) == get_device_types(TrackedFunction(qnode))
+
+
+def test_devices_known_before_admission(qnode):
+    """Test that a function is compiled before its first call is admitted, such that the call is
+    bounded by the limits of its devices."""
+
+    class RecordingExecutor(AsyncExecutor):
+        """An executor which records the devices of the admitted calls."""
+
+        def __init__(self):
+            super().__init__(max_workers=2)
+            self.device_types = []
+
+        def get_semaphores(self, device_types):
+            self.device_types.append(device_types)
+            return super().get_semaphores(device_types)
+
+    circuit = qjit(qnode)
+    executor = RecordingExecutor()
+    previous = catalyst.set_async_executor(executor)
+    try:
+        assert np.allclose(asyncio.run(circuit.acall(0.3)), np.cos(0.3))
+    finally:
+        catalyst.set_async_executor(previous)
+        executor.shutdown()
+
+    assert executor.device_types == [get_device_types(TrackedFunction(qnode))]
+
+
+def test_device_limits(qnode):
+    """Test that the calls executing at a time on a device are bounded."""
+
+    fn = TrackedFunction(qnode)
+    (device_type,) = get_device_types(fn)
+    executor = AsyncExecutor(max_workers=8, device_limits={device_type: 2})
+
+    async def main():
+        return await asyncio.gather(*(executor.run(fn, i) for i in range(16)))
+
+    assert asyncio.run(main()) == list(range(16))
+    assert fn.peak == 2
+    executor.shutdown()
+
+
+def test_unknown_devices():
+    """Test that calls of functions without known devices warn that device limits do not apply."""
+
+    executor = AsyncExecutor(device_limits={"lightning.qubit": 1})
+
+    async def main():
+        return await executor.run(lambda x: x, 1)
+
+    with pytest.warns(UserWarning, match="the device limits do not apply"):
+        assert asyncio.run(main()) == 1
+    executor.shutdown()
+
+
+def test_backpressure(qnode):
+    """Test that calls wait to be admitted once the bound on pending calls is reached."""
+
+    fn = TrackedFunction(qnode)
+    executor = AsyncExecutor(max_workers=8, max_pending=3)
+
+    async def main():
+        tasks = [asyncio.create_task(executor.run(fn, i)) for i in range(12)]
+        await asyncio.sleep(0)
+        (pending, _), *_ = executor.semaphores.values()
+        assert pending.locked()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(main()) == list(range(12))
+    assert fn.peak == 3
+    executor.shutdown()
+
+
+def test_cancellation(qnode):
+    """Test that cancelled calls which have not started are not executed, and that their slots
+    are released."""
+
+    blocked = threading.Event()
+    calls = []
+
+    def blocking(x):
+        blocked.wait()
+        calls.append(x)
+        return x
+
+    fn = TrackedFunction(qnode)
+    executor = AsyncExecutor(max_workers=1, max_pending=2)
+
+    async def main():
+        first = asyncio.create_task(executor.run(blocking, 1))
+        second = asyncio.create_task(executor.run(blocking, 2))
+        await asyncio.sleep(0.01)
+
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+        blocked.set()
+        assert await first == 1
+        # Both slots are available again.
+        return await asyncio.gather(executor.run(blocking, 3), executor.run(fn, 4))
+
+    assert asyncio.run(main()) == [3, 4]
+    assert calls == [1, 3]
+    executor.shutdown()
+
+
+def test_set_async_executor():
+    """Test that the executor of awaited calls can be replaced."""
+
+    executor = AsyncExecutor(max_pending=4)
+    previous = catalyst.set_async_executor(executor)
+    try:
+        assert get_async_executor() is executor
+    finally:
+        catalyst.set_async_executor(previous)
+
+
+def test_invalid_limits():
+    """Test that limits must be positive integers."""
+
+    with pytest.raises(ValueError, match="'max_pending' must be a positive integer"):
+        AsyncExecutor(max_pending=0)
+    with pytest.raises(ValueError, match="'lightning.qubit' must be a positive integer"):
+        AsyncExecutor(device_limits={"lightning.qubit": 1.5})
+
+
+if __name__ == "__main__":
+    pytest.main(["-x", __file__])
@@ -16,6 +16,8 @@
 Unit tests for LinkerDriver class
 """
 
+import importlib
+import io
 import os
 import pathlib
 import platform
@@ -25,12 +27,21 @@ import tempfile
 import warnings
 from os.path import isfile
 
+import jax.numpy as jnp
 import numpy as np
 import pennylane as qml
 import pytest
+from mlir_quantum.compiler_driver import clear_stage_cache
 
 from catalyst import qjit
-from catalyst.compiler import DEFAULT_PIPELINES, CompileOptions, Compiler, LinkerDriver
+from catalyst.compiler import (
+    DEFAULT_PIPELINES,
+    CompileOptions,
+    Compiler,
+    LinkerDriver,
+    get_module_bytecode,
+    get_module_text,
+)
 from catalyst.utils.exceptions import CompileError
 from catalyst.utils.filesystem import Directory
 
@@ -52,6 +63,106 @@ class TestCompilerOptions:
             compilers = LinkerDriver._get_compiler_fallback_order([])
             assert compiler in compilers
 
+    def test_default_flags_are_cached(self, monkeypatch):
+        """Test that the toolchain discovery is only performed once per set of library paths."""
+        options = CompileOptions()
+        flags = LinkerDriver.get_default_flags(options)
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("The toolchain discovery should not be repeated.")
+
+        monkeypatch.setattr(importlib.util, "find_spec", fail)
+        assert LinkerDriver.get_default_flags(options) == flags
+
+        # Changes to the returned flags must not affect the cache.
+        flags.append("-lfoo")
+        assert "-lfoo" not in LinkerDriver.get_default_flags(options)
+
+    def test_pipelines_at_opt_level(self):
+        """Test that the optimization level adjusts the default pipelines only."""
+
+        def get_passes(options):
+            return [p for _, pipeline in options.get_pipelines() for p in pipeline]
+
+        assert CompileOptions().get_pipelines() == DEFAULT_PIPELINES
+        assert CompileOptions(opt_level=1).get_pipelines() == DEFAULT_PIPELINES
+        assert "cse" not in get_passes(CompileOptions(opt_level=0))
+        assert "func.func(linalg-fuse-elementwise-ops)" in get_passes(CompileOptions(opt_level=3))
+
+        custom = [("custom", ["cse"])]
+        assert CompileOptions(pipelines=custom, opt_level=0).get_pipelines() == custom
+
+    @pytest.mark.parametrize("opt_level", [0, 1, 2, 3])
+    def test_opt_level(self, opt_level, backend):
+        """Test that programs compiled at every optimization level produce the same results."""
+
+        def workflow(x, w):
+            @qml.qnode(qml.device(backend, wires=2))
+            def circuit(x):
+                for i in range(4):
+                    qml.RX(x * i, wires=i % 2)
+                qml.CNOT(wires=[0, 1])
+                return qml.expval(qml.PauliZ(1))
+
+            return circuit(x) + (w @ w.T).sum()
+
+        w = np.arange(12.0).reshape(3, 4)
+        expected = np.cos(0.3 * 2) * np.cos(0.3 * 4) + (w @ w.T).sum()
+        assert np.allclose(qjit(opt_level=opt_level)(workflow)(0.3, w), expected)
+
+    @pytest.mark.parametrize("target_cpu", [None, "native"])
+    def test_target_cpu(self, target_cpu):
+        """Test that classical processing compiled for the host CPU produces the same results."""
+
+        @qjit(target_cpu=target_cpu, opt_level=3)
+        def f(m):
+            return jnp.tanh(m @ m.T).sum(axis=0)
+
+        m = np.linspace(0, 1, 64).reshape(8, 8)
+        assert np.allclose(f(m), np.tanh(m @ m.T).sum(axis=0))
+
+    def test_pipelines_with_linalg_lowering(self):
+        """Test that the linear algebra lowering replaces the lowering to scalar loops."""
+
+        def get_passes(options):
+            return [p for _, pipeline in options.get_pipelines() for p in pipeline]
+
+        passes = get_passes(CompileOptions(linalg_lowering="vectorize"))
+        assert "func.func(convert-linalg-to-loops)" not in passes
+        assert "func.func(affine-super-vectorize{virtual-vector-size=8})" in passes
+        assert passes.index("convert-vector-to-llvm") < passes.index(
+            "finalize-memref-to-llvm{use-generic-functions}"
+        )
+        assert "async-parallel-for" in get_passes(CompileOptions(linalg_lowering="parallel"))
+
+    @pytest.mark.parametrize("linalg_lowering", ["loops", "vectorize", "parallel"])
+    def test_linalg_lowering(self, linalg_lowering):
+        """Test that classical processing produces the same results with every lowering."""
+
+        @qjit(linalg_lowering=linalg_lowering)
+        def f(a, b):
+            c = jnp.tanh(a @ b) + jnp.exp(-a.T)
+            return c.sum(axis=1), jnp.max(c)
+
+        a = np.linspace(0, 1, 37 * 37).reshape(37, 37)
+        b = np.linspace(-1, 1, 37 * 37).reshape(37, 37)
+        c = np.tanh(a @ b) + np.exp(-a.T)
+        sums, maximum = f(a, b)
+        assert np.allclose(sums, c.sum(axis=1))
+        assert np.allclose(maximum, np.max(c))
+
+    def test_invalid_linalg_lowering(self):
+        """Test that unknown linear algebra lowerings are rejected."""
+
+        with pytest.raises(CompileError, match="The linear algebra lowering must be one of"):
+            qjit(lambda x: x, linalg_lowering="unknown")
+
+    def test_invalid_opt_level(self):
+        """Test that optimization levels outside of 0 to 3 are rejected."""
+
+        with pytest.raises(CompileError, match="The optimization level must be"):
+            qjit(lambda x: x, opt_level=4)
+
     @pytest.mark.parametrize(
         "logfile,keep_intermediate", [("stdout", True), ("stderr", False), (None, False)]
     )
@@ -287,6 +398,146 @@ class TestCompilerState:
             assert observed_outfilename == expected_outfilename
             assert os.path.exists(observed_outfilename)
 
+    def test_bytecode_and_text_input(self, backend):
+        """Test that the compiler driver produces the same output for textual and bytecode IR."""
+
+        @qjit(target="mlir")
+        @qml.qnode(qml.device(backend, wires=1))
+        def workflow(x: float):
+            qml.RX(x, wires=0)
+            return qml.state()
+
+        module = workflow.mlir_module
+        module_name = str(module.operation.attributes["sym_name"]).replace('"', "")
+        options = CompileOptions(
+            pipelines=[("Canonicalize", ["canonicalize"])], lower_to_llvm=False
+        )
+        text = module.operation.get_asm(binary=False)
+        bytecode = get_module_bytecode(module)
+        assert isinstance(bytecode, bytes)
+
+        with tempfile.TemporaryDirectory() as workspace:
+            workspace = Directory(pathlib.Path(workspace))
+            compiler = Compiler(options)
+            _, text_output, _ = compiler.run_from_ir(text, module_name, workspace)
+            _, bytecode_output, _ = compiler.run_from_ir(bytecode, module_name, workspace)
+
+        assert text_output == bytecode_output
+
+    def test_stablehlo_bytecode(self):
+        """Test that programs made of many StableHLO operations compile from bytecode and that
+        their bytecode converts back to the same textual IR."""
+
+        @qjit
+        def workflow(x, y):
+            z = jnp.dot(x, y.T) + jnp.arange(3.0)
+            z = jnp.where(z > 0, jnp.exp(-z), jnp.sin(z)) @ x
+            z = z.at[0, 1:3].set(jnp.max(y, axis=0)[:2])
+            z = jnp.concatenate([z, jnp.transpose(y.T)[:2]], axis=0)
+            return jnp.sum(z, axis=1), jnp.reshape(z, (-1,))[::2], jnp.sqrt(jnp.sum(z**2))
+
+        x = np.arange(12.0).reshape(3, 4) / 10
+        y = np.cos(np.arange(12.0)).reshape(3, 4)
+        expected = workflow.original_function(jnp.array(x), jnp.array(y))
+        for result, expected_result in zip(workflow(x, y), expected):
+            assert np.allclose(result, expected_result)
+
+        module = workflow.mlir_module
+        text = module.operation.get_asm(assume_verified=True)
+        assert "stablehlo" in text
+        assert get_module_text(get_module_bytecode(module)) == text
+
+    def test_bytecode_fallback_to_text(self, monkeypatch):
+        """Test that programs are compiled from text if the driver cannot parse their bytecode,
+        and that later programs are compiled from text without retrying bytecode."""
+
+        run_driver = Compiler._run_driver  # pylint: disable=protected-access
+        sources = []
+
+        def run_driver_without_bytecode(self, ir, *args):
+            sources.append(type(ir))
+            if isinstance(ir, bytes):
+                raise CompileError("Compilation failed:\nFailed to parse module as MLIR source")
+            return run_driver(self, ir, *args)
+
+        monkeypatch.setattr(Compiler, "_run_driver", run_driver_without_bytecode)
+        monkeypatch.setattr("catalyst.compiler._driver_parses_bytecode", None)
+
+        @qjit
+        def workflow(x):
+            return jnp.sum(jnp.tanh(x) * 2)
+
+        assert np.allclose(workflow(jnp.ones(4)), 8 * np.tanh(1.0))
+        assert sources == [bytes, str]
+
+        assert np.allclose(workflow(jnp.ones(3)), 6 * np.tanh(1.0))
+        assert sources == [bytes, str, str]
+
+    def test_stage_cache(self, backend):
+        """Test that compilations sharing the first pipelines resume from the cached program."""
+
+        @qjit(target="mlir")
+        @qml.qnode(qml.device(backend, wires=1))
+        def workflow(x: float):
+            qml.RX(x, wires=0)
+            return qml.state()
+
+        module = workflow.mlir_module
+        module_name = str(module.operation.attributes["sym_name"]).replace('"', "")
+        ir = get_module_bytecode(module)
+        pipelines_a = [("Shared", ["canonicalize"]), ("TailA", ["cse"])]
+        pipelines_b = [("Shared", ["canonicalize"]), ("TailB", ["symbol-dce"])]
+
+        def compile_ir(pipelines, stage_cache):
+            logfile = io.StringIO()
+            options = CompileOptions(
+                pipelines=pipelines,
+                lower_to_llvm=False,
+                stage_cache=stage_cache,
+                verbose=True,
+                logfile=logfile,
+            )
+            with tempfile.TemporaryDirectory() as workspace:
+                workspace = Directory(pathlib.Path(workspace))
+                _, output, _ = Compiler(options).run_from_ir(ir, module_name, workspace)
+            return output, logfile.getvalue()
+
+        clear_stage_cache()
+        _, log = compile_ir(pipelines_a, stage_cache=True)
+        assert "Resuming compilation" not in log
+
+        output, log = compile_ir(pipelines_b, stage_cache=True)
+        assert "Resuming compilation after pipeline 'Shared'" in log
+        expected, _ = compile_ir(pipelines_b, stage_cache=False)
+        assert output == expected
+
+        _, log = compile_ir(pipelines_b, stage_cache=True)
+        assert "Resuming compilation after pipeline 'TailB'" in log
+        clear_stage_cache()
+
+    def test_stage_cache_pipeline_output(self, backend):
+        """Test that the output of a pipeline cannot be requested when the stage cache is used."""
+
+        @qjit(stage_cache=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def workflow(x: float):
+            qml.RX(x, wires=0)
+            return qml.state()
+
+        workflow(0.5)
+        with pytest.raises(CompileError, match="not recorded when the stage cache is used"):
+            workflow.compiler.get_output_of("HLOLoweringPass")
+
+        @qjit(stage_cache=True, keep_intermediate=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def workflow_intermediate(x: float):
+            qml.RX(x, wires=0)
+            return qml.state()
+
+        workflow_intermediate(0.5)
+        assert workflow_intermediate.compiler.get_output_of("HLOLoweringPass")
+        workflow_intermediate.workspace.cleanup()
+
     def test_pipeline_error(self):
         """Test pipeline error handling."""
 
@@ -18,10 +18,12 @@ import numpy as np
 import pennylane as qml
 import pytest
 from jax import numpy as jnp
+from jax.core import ShapedArray
 from numpy import array_equal
 from numpy.testing import assert_allclose
 
-from catalyst import qjit, while_loop
+from catalyst import CompileError, qjit, while_loop
+from catalyst.tracing.type_signatures import infer_abstracted_axes
 
 DTYPES = [float, int, jnp.float32, jnp.float64, jnp.int8, jnp.int16, "float32", np.float64]
 SHAPES = [3, (2, 3, 1), (), jnp.array([2, 1, 3], dtype=int)]
@@ -398,5 +400,75 @@ def test_array_assignment():
     assert_array_and_dtype_equal(result, expected)
 
 
+def test_auto_abstract():
+    """Test that varying axis lengths lead to a dynamically-shaped version with auto_abstract."""
+
+    @qjit(auto_abstract=2)
+    def total(a, b):
+        return jnp.sum(a * b, axis=0)
+
+    total(jnp.ones((2, 3)), jnp.ones((2, 3)))
+    total(jnp.ones((4, 3)), jnp.ones((4, 3)))
+    assert "tensor<?x3xf64>" not in total.mlir
+
+    with pytest.warns(UserWarning, match="axis 0 of array argument 0 took the lengths"):
+        result = total(jnp.ones((5, 3)), jnp.ones((5, 3)))
+    assert_allclose(result, 5 * jnp.ones(3))
+    assert "tensor<?x3xf64>" in total.mlir, total.mlir
+
+    # Further lengths are handled by the dynamically-shaped version without recompiling.
+    result = total(jnp.ones((7, 3)), jnp.ones((7, 3)))
+    assert_allclose(result, 7 * jnp.ones(3))
+    assert total.cache_info().misses == 3
+    assert total.cache_info().entries == 3
+
+
+def test_auto_abstract_pending():
+    """Test that an in-flight dynamically-shaped compilation is matched by further lengths."""
+
+    @qjit(auto_abstract=2)
+    def total(a):
+        return jnp.sum(a, axis=0)
+
+    total(jnp.ones((2, 3)))
+    total(jnp.ones((4, 3)))
+
+    with pytest.warns(UserWarning, match="axis 0 of array argument 0 took the lengths"):
+        future = total.compile_async(jnp.ones((5, 3)))
+    assert total.compile_async(jnp.ones((7, 3))) is future
+
+    assert_allclose(total(jnp.ones((7, 3))), 7 * jnp.ones(3))
+    assert total.cache_info().entries == 3
+
+
+def test_auto_abstract_inferred_axes():
+    """Test the inference of abstracted axes from signatures differing in axis lengths."""
+
+    signatures = [
+        (ShapedArray((2, 3), float), ShapedArray((2,), float), ShapedArray((), int)),
+        (ShapedArray((4, 3), float), ShapedArray((4,), float), ShapedArray((), int)),
+    ]
+    abstracted_axes, reasons = infer_abstracted_axes(signatures)
+    assert abstracted_axes == ({0: "n0"}, {0: "n0"}, {})
+    assert len(reasons) == 2
+
+    signatures.append((ShapedArray((4, 3), int), ShapedArray((4,), float), ShapedArray((), int)))
+    assert infer_abstracted_axes(signatures) == (None, [])
+
+
+@pytest.mark.parametrize(
+    "options, error",
+    [
+        ({"auto_abstract": 0}, "must be a positive integer"),
+        ({"auto_abstract": 2, "abstracted_axes": {0: "n"}}, "cannot be combined"),
+    ],
+)
+def test_auto_abstract_invalid(options, error):
+    """Test the validation of the auto_abstract option."""
+
+    with pytest.raises(CompileError, match=error):
+        qjit(lambda x: x, **options)
+
+
 if __name__ == "__main__":
     pytest.main(["-x", __file__])
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import multiprocessing
+import os
+import pickle
 import random
 import warnings
 from timeit import default_timer as timer
@@ -23,13 +27,19 @@ import pytest
 from jax import numpy as jnp
 from numpy import pi
 
+import catalyst
 from catalyst import for_loop, grad, measure, qjit
+from catalyst.compiled_functions import RuntimeContextManager
+from catalyst.compiler import Compiler
 from catalyst.jax_primitives import _scalar_abstractify
 from catalyst.tracing.type_signatures import (
     TypeCompatibility,
     get_abstract_signature,
+    get_bucket_size,
+    get_fingerprint,
     typecheck_signatures,
 )
+from catalyst.utils.exceptions import CompileError
 
 
 def f_aot_builder(backend, wires=1, shots=1000):
@@ -68,6 +78,22 @@ def fsample_aot_builder(backend, wires=1, shots=1000):
     return f
 
 
+@qjit
+def square_plus_one(x):
+    """Module-level program for the serialization tests."""
+    return x * x + 1
+
+
+def scale(x, n):
+    """Module-level function for the serialization tests."""
+    return x * n
+
+
+def call_and_count_misses(fn, *args):
+    """Call a QJIT object in a worker process and report its number of compilations."""
+    return fn(*args), fn.cache_info().misses
+
+
 class TestDifferentPrecisions:
     def test_different_precisions(self, backend):
         """Test different precisions."""
@@ -451,6 +477,124 @@ class TestCaching:
         # Duplicate function generation results in a "_0" suffix
         assert not "func.func private @f_0(" in g.mlir
 
+    def test_qnode_traces_are_reused(self, backend, monkeypatch):
+        """Test that recompiling for new static arguments does not trace unchanged QNodes again."""
+
+        @qml.qnode(qml.device(backend, wires=1))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(wires=0))
+
+        @qjit(static_argnums=1)
+        def f(x, n):
+            return circuit(x) * n
+
+        traced = []
+        trace_quantum_function = catalyst.qfunc.trace_quantum_function
+
+        def counting_trace_quantum_function(*args, **kwargs):
+            traced.append(args[0])
+            return trace_quantum_function(*args, **kwargs)
+
+        monkeypatch.setattr(
+            catalyst.qfunc, "trace_quantum_function", counting_trace_quantum_function
+        )
+
+        assert np.allclose(f(0.5, 1), np.cos(0.5))
+        assert np.allclose(f(0.5, 2), 2 * np.cos(0.5))
+        assert np.allclose(f(0.5, 3), 3 * np.cos(0.5))
+        assert len(traced) == 1
+        assert f.cache_info().misses == 3
+
+        # A new signature of the QNode call requires a new trace.
+        assert np.allclose(f(jnp.array(0.5, dtype=jnp.float32), 2), 2 * np.cos(0.5))
+        assert len(traced) == 2
+
+    def test_multiple_versions_are_cached(self):
+        """Test that alternating between signatures does not trigger recompilation."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        f(jnp.array([1, 2]))
+        f(jnp.array([1.0, 2.0, 3.0]))
+        compiled_functions = {id(entry.compiled_fn) for _, entry in f.fn_cache.lru.values()}
+
+        for _ in range(3):
+            assert np.allclose(f(jnp.array([1, 2])), [2, 4])
+            assert np.allclose(f(jnp.array([1.0, 2.0, 3.0])), [2.0, 4.0, 6.0])
+
+        info = f.cache_info()
+        assert info.misses == 2
+        assert info.hits == 6
+        assert info.evictions == 0
+        assert info.entries == 2
+        assert {id(entry.compiled_fn) for _, entry in f.fn_cache.lru.values()} == compiled_functions
+
+    def test_fast_path_signature_check(self, monkeypatch):
+        """Test that repeated calls with arguments of the same types skip the signature checks."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        f(jnp.ones(3))
+
+        checks = []
+        typecheck_signatures = catalyst.compiled_functions.typecheck_signatures
+
+        def counting_typecheck_signatures(*args):
+            checks.append(args)
+            return typecheck_signatures(*args)
+
+        monkeypatch.setattr(
+            catalyst.compiled_functions, "typecheck_signatures", counting_typecheck_signatures
+        )
+
+        assert np.allclose(f(jnp.zeros(3)), 0)
+        assert np.allclose(f(np.arange(3.0)), [0, 2, 4])
+        assert len(checks) == 1
+
+        # Arguments requiring promotion are promoted on the fast path as well.
+        for _ in range(2):
+            assert np.allclose(f(jnp.array([1, 2, 3])), [2, 4, 6])
+        assert len(checks) == 2
+        assert f.cache_info().misses == 1
+
+    def test_fingerprint(self):
+        """Test the fingerprints of arguments used on the fast path of cache lookups."""
+
+        assert get_fingerprint([jnp.ones(2), 1.0]) == get_fingerprint([jnp.zeros(2), 2.0])
+        assert get_fingerprint([jnp.ones(2)]) == get_fingerprint([np.ones(2)])
+        assert get_fingerprint([jnp.asarray(1.0)]) != get_fingerprint([np.asarray(1.0)])
+        assert get_fingerprint([1]) != get_fingerprint([1.0])
+        assert get_fingerprint([jnp.ones(2)]) != get_fingerprint([jnp.ones(3)])
+        assert get_fingerprint([[1.0]]) is None
+
+    def test_eviction(self):
+        """Test that least recently used versions are evicted when the cache is bounded."""
+
+        @qjit(cache_max_entries=1)
+        def f(x):
+            return x * 2
+
+        f(jnp.array([1, 2]))
+        evicted_workspace = str(f.workspace)
+        evicted_function = f.compiled_function
+
+        f(jnp.array([1, 2, 3]))
+        info = f.cache_info()
+        assert info.entries == 1
+        assert info.evictions == 1
+        assert evicted_function.shared_object.function is None
+        assert not os.path.exists(evicted_workspace)
+        with pytest.raises(RuntimeError, match="has been closed"):
+            evicted_function(np.array([1, 2]))
+
+        assert np.allclose(f(jnp.array([1, 2])), [2, 4])
+        assert f.cache_info().misses == 3
+
 
 class TestShots:
     # Shots influences on the sample instruction
@@ -857,6 +1001,30 @@ class TestDefaultAvailableIR:
 
         assert f.mlir
 
+    def test_mlir_is_generated_lazily(self, monkeypatch):
+        """Test that the compiler driver runs only once per compilation, unless the textual MLIR
+        is accessed."""
+
+        runs = []
+        run_from_ir = Compiler.run_from_ir
+
+        def counting_run_from_ir(self, *args, **kwargs):
+            runs.append(self.options.pipelines)
+            return run_from_ir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Compiler, "run_from_ir", counting_run_from_ir)
+
+        @qjit
+        def f(x):
+            return x + 1
+
+        assert f(1) == 2
+        assert len(runs) == 1
+
+        assert "stablehlo.add" in f.mlir
+        assert f.mlir is f.mlir
+        assert len(runs) == 2
+
     def test_qir(self, backend):
         """Test qir."""
 
@@ -941,5 +1109,704 @@ class TestTwoQJITsOneName:
         foo_2.workspace.cleanup()
 
 
+class TestPersistentContext:
+    """Test the persistent runtime execution context mode."""
+
+    def test_results_match_default_mode(self, backend):
+        """Test that repeated calls in persistent mode produce the same results as the default
+        mode."""
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        default_fn = qjit(qml.qnode(qml.device(backend, wires=2))(circuit))
+        persistent_fn = qjit(persistent_context=True)(
+            qml.qnode(qml.device(backend, wires=2))(circuit)
+        )
+
+        for x in np.linspace(0, pi, 10):
+            assert np.allclose(default_fn(x), persistent_fn(x))
+
+        persistent_fn.compiled_function.close()
+
+    def test_context_lifetime(self, backend):
+        """Test that the context is kept alive between calls and released on close."""
+
+        @qjit(persistent_context=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def f(x):
+            qml.RY(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        f(0.1)
+        assert RuntimeContextManager.active
+        f(0.2)
+        assert RuntimeContextManager.active
+
+        f.compiled_function.close()
+        assert not RuntimeContextManager.active
+
+    def test_shared_with_default_mode(self, backend):
+        """Test that a compiled function in default mode does not destroy a persistent context."""
+
+        @qjit(persistent_context=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def f(x):
+            qml.RY(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def g(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        f(0.1)
+        assert np.allclose(g(0.3), np.cos(0.3))
+        assert RuntimeContextManager.active
+        assert np.allclose(f(0.3), np.cos(0.3))
+
+        f.compiled_function.close()
+        assert not RuntimeContextManager.active
+
+    def test_failed_call(self, backend):
+        """Test that a failed call drops the persistent context, which is re-created by the next
+        call."""
+
+        @catalyst.pure_callback
+        def check(x) -> float:
+            if x < 0:
+                raise ValueError("Negative angle.")
+            return x
+
+        @qjit(persistent_context=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def f(x):
+            qml.RY(check(x), wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        f(0.1)
+        with pytest.raises(ValueError, match="Negative angle"):
+            f(-0.1)
+        assert not RuntimeContextManager.active
+
+        assert np.allclose(f(0.3), np.cos(0.3))
+        assert RuntimeContextManager.active
+
+        f.compiled_function.close()
+        assert not RuntimeContextManager.active
+
+    def test_failed_call_in_default_mode(self, backend):
+        """Test that a failed call of a compiled function in default mode does not drop the
+        persistent context of other compiled functions."""
+
+        @catalyst.pure_callback
+        def check(x) -> float:
+            if x < 0:
+                raise ValueError("Negative angle.")
+            return x
+
+        @qjit(persistent_context=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def f(x):
+            qml.RY(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def g(x):
+            qml.RX(check(x), wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        f(0.1)
+        with pytest.raises(ValueError, match="Negative angle"):
+            g(-0.1)
+        assert RuntimeContextManager.active
+        assert np.allclose(f(0.3), np.cos(0.3))
+        assert np.allclose(g(0.3), np.cos(0.3))
+        assert RuntimeContextManager.active
+
+        f.compiled_function.close()
+        assert not RuntimeContextManager.active
+
+
+class TestAsyncCompilation:
+    """Test compilation in the background."""
+
+    def test_call_waits_for_compilation(self, backend):
+        """Test that a call with matching arguments uses the in-flight compilation."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=1))
+        def f(x):
+            qml.RY(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        future = f.compile_async(jax.core.ShapedArray((), jnp.float64))
+        assert f.compile_async(jax.core.ShapedArray((), jnp.float64)) is future
+        assert f.compiled_function is None
+
+        assert np.allclose(f(0.3), np.cos(0.3))
+        assert f.compiled_function is future.result()
+        assert f.cache_info().misses == 0
+
+    def test_cached_signature(self):
+        """Test that requests for compiled signatures return the cached version without counting
+        as a cache hit."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        f(1.0)
+        hits = f.cache_info().hits
+        assert f.compile_async(2.0).result() is f.compiled_function
+        assert f.cache_info().hits == hits
+
+    def test_completed_compilation_keeps_matched_entry(self):
+        """Test that collecting a completed compilation into a full cache does not evict the
+        version matching the call."""
+
+        @qjit(cache_max_entries=1)
+        def f(x):
+            return x * 2
+
+        assert f(1.0) == 2.0
+        f.compile_async(jax.core.ShapedArray((3,), jnp.float64)).result()
+
+        assert f(2.0) == 4.0
+        info = f.cache_info()
+        assert info.misses == 1
+        assert info.entries == 1
+
+    def test_multiple_signatures(self):
+        """Test that several signatures can be compiled concurrently."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        futures = [
+            f.compile_async(jax.core.ShapedArray((), jnp.int64)),
+            f.compile_async(jax.core.ShapedArray((3,), jnp.float64)),
+        ]
+        for future in futures:
+            future.result()
+
+        assert f(2) == 4
+        assert np.allclose(f(jnp.ones(3)), 2 * jnp.ones(3))
+        assert f.cache_info().entries == 2
+        assert f.cache_info().misses == 0
+
+    def test_error_is_raised_on_call(self):
+        """Test that a failed background compilation is re-raised by matching calls."""
+
+        @qjit(pipelines=[("invalid", ["non-existent-pass"])])
+        def f(x):
+            return x * 2
+
+        future = f.compile_async(1.0)
+        with pytest.raises(CompileError, match="Compilation failed"):
+            f(1.0)
+        assert future.exception() is not None
+
+
+@pytest.mark.skipif(not hasattr(os, "memfd_create"), reason="requires anonymous in-memory files")
+class TestInMemoryWorkspace:
+    """Test the compilation in an in-memory workspace."""
+
+    def test_workspace_removed_after_loading(self, backend):
+        """Test that the workspace is removed once the compiled library is loaded from memory."""
+
+        @qjit(in_memory_workspace=True)
+        @qml.qnode(qml.device(backend, wires=1))
+        def f(x):
+            qml.RY(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        assert np.allclose(f(0.3), np.cos(0.3))
+        assert f.compiled_function.shared_object.memory_file is not None
+        assert not os.path.exists(str(f.workspace))
+
+        assert np.allclose(f(jnp.array(0.5)), np.cos(0.5))
+        f.compiled_function.close()
+        assert f.compiled_function.shared_object.memory_file is None
+
+    def test_mlir_after_loading(self):
+        """Test that the canonicalized MLIR is available once the workspace is removed."""
+
+        @qjit(in_memory_workspace=True)
+        def f(x):
+            return x * 2
+
+        assert f(2) == 4
+        assert not f.workspace.is_dir()
+        assert "func.func" in f.mlir
+
+    def test_default_workspace_kept(self):
+        """Test that the temporary workspace outlives the loading of the compiled library without
+        an in-memory workspace."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        assert f(2) == 4
+        assert f.workspace.is_dir()
+        f.workspace.cleanup()
+        assert f.workspace.is_dir()
+
+    def test_keep_intermediate(self, tmp_path, monkeypatch):
+        """Test that intermediate results are still written to disk on demand."""
+
+        monkeypatch.chdir(tmp_path)
+
+        @qjit(in_memory_workspace=True, keep_intermediate=True)
+        def f(x):
+            return x * 2
+
+        assert f(2) == 4
+        assert os.path.isdir(str(f.workspace))
+        assert str(f.workspace).startswith(str(tmp_path))
+        assert any(name.endswith(".mlir") for name in os.listdir(str(f.workspace)))
+
+
+class TestShapeBuckets:
+    """Test the padding of arguments to bucketed axis lengths."""
+
+    @pytest.mark.parametrize(
+        "length, buckets, size",
+        [(1, None, 1), (5, None, 8), (8, None, 8), (5, (4, 10, 20), 10), (25, (4, 10, 20), 25)],
+    )
+    def test_bucket_size(self, length, buckets, size):
+        """Test the selection of the bucket for an axis length."""
+        assert get_bucket_size(length, buckets) == size
+
+    def test_one_version_per_bucket(self):
+        """Test that a single version is compiled per bucket and the results are sliced back."""
+
+        @qjit(shape_buckets={0: {}})
+        def f(x, y):
+            return x * 2, jnp.sum(x) + y
+
+        for n in (5, 6, 7, 8):
+            doubled, total = f(jnp.arange(n, dtype=float), 1.0)
+            assert np.allclose(doubled, 2 * np.arange(n))
+            assert np.allclose(total, np.arange(n).sum() + 1)
+
+        assert f.cache_info().misses == 1
+
+        f(jnp.arange(9, dtype=float), 1.0)
+        assert f.cache_info().misses == 2
+
+    def test_pad_value_and_mask(self):
+        """Test the padding value and the mask of valid entries declared by the rule."""
+
+        @qjit(shape_buckets={0: {"axis": 1, "buckets": (4, 8), "pad_value": -np.inf}})
+        def row_max(x):
+            return jnp.max(x, axis=1)
+
+        @qjit(shape_buckets={0: {"buckets": (4, 8), "mask": True, "slice_outputs": False}})
+        def mean(x_mask):
+            x, mask = x_mask
+            return jnp.sum(jnp.where(mask, x, 0.0)) / jnp.sum(mask)
+
+        assert np.allclose(row_max(-jnp.ones((2, 3))), [-1, -1])
+        assert np.allclose(mean(jnp.array([1.0, 2.0, 3.0, 4.0, 5.0])), 3.0)
+
+    def test_constant_output_of_bucket_size(self):
+        """Test that only the results following the bucketed axis are sliced back, including
+        when a result of a constant size has the padded length."""
+
+        @qjit(shape_buckets={0: {"buckets": (8,)}})
+        def f(x, y):
+            return x + 1, y * 2, jnp.outer(x, y)
+
+        y = jnp.arange(8, dtype=float)
+        shifted, doubled, outer = f(jnp.ones(5), y)
+
+        assert np.allclose(shifted, np.full(5, 2.0))
+        assert np.allclose(doubled, 2 * np.arange(8))
+        assert outer.shape == (5, 8)
+        assert np.allclose(outer, np.outer(np.ones(5), np.arange(8)))
+
+    @pytest.mark.parametrize(
+        "options, error",
+        [
+            ({"shape_buckets": {0: {"size": 4}}}, "Unknown keys"),
+            ({"shape_buckets": {0: {"buckets": (8, 4)}}}, "must be increasing"),
+            ({"shape_buckets": {0: {}}, "static_argnums": 0}, "cannot be bucketed"),
+        ],
+    )
+    def test_invalid_rules(self, options, error):
+        """Test the validation of the bucketing rules."""
+
+        with pytest.raises(CompileError, match=error):
+            qjit(lambda x: x, **options)
+
+
+class TestPickling:
+    """Test the serialization of QJIT objects along with their compiled versions."""
+
+    def test_round_trip_by_reference(self):
+        """Test that module-level programs keep their compiled versions when unpickled."""
+
+        square_plus_one(2.0)
+        restored = pickle.loads(pickle.dumps(square_plus_one))
+
+        assert restored is not square_plus_one
+        assert np.allclose(restored(3.0), 10.0)
+        assert restored.cache_info().misses == 0
+
+    def test_round_trip_static_args(self):
+        """Test that every compiled version is restored, including their static arguments."""
+
+        f = qjit(scale, static_argnums=1)
+        f(1.0, 2)
+        f(1.0, 3)
+        restored = pickle.loads(pickle.dumps(f))
+
+        assert np.allclose(restored(2.0, 2), 4.0)
+        assert np.allclose(restored(2.0, 3), 6.0)
+        assert restored.cache_info().misses == 0
+
+        assert np.allclose(restored(2.0, 4), 8.0)
+        assert restored.cache_info().misses == 1
+
+    @pytest.mark.skipif(not hasattr(os, "memfd_create"), reason="requires in-memory files")
+    def test_round_trip_removes_workspaces(self):
+        """Test that the workspaces written when unpickling are removed once the shared objects
+        are copied to memory."""
+
+        f = qjit(scale, static_argnums=1)
+        f(1.0, 2)
+        f(1.0, 3)
+        restored = pickle.loads(pickle.dumps(f))
+
+        workspaces = [entry.workspace for _, entry in restored.fn_cache.lru.values()]
+        assert len(workspaces) == 2
+        assert not any(workspace.is_dir() for workspace in workspaces)
+        assert np.allclose(restored(2.0, 2), 4.0)
+        assert np.allclose(restored(2.0, 3), 6.0)
+
+    def test_process_pool(self):
+        """Test that compiled programs can be sent to worker processes without recompiling."""
+
+        square_plus_one(2.0)
+        ctx = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(2, mp_context=ctx) as pool:
+            futures = [pool.submit(call_and_count_misses, square_plus_one, x) for x in range(4)]
+            results = [future.result() for future in futures]
+
+        assert np.allclose([result for result, _ in results], [x * x + 1 for x in range(4)])
+        assert all(misses == 0 for _, misses in results)
+
+
+class TestMarshallingPlan:
+    """Test the conversion of arguments to memref descriptors via preallocated plans."""
+
+    def test_plan_is_reused(self):
+        """Test that the plan is built once the function is compiled and reused across calls."""
+
+        @qjit
+        def f(x, y):
+            return x * y[0], y
+
+        f(jnp.ones(3), [2.0, jnp.ones((2, 2))])
+        plan = f.compiled_function.marshalling_plan
+        assert plan is not None
+        assert [rank for _, rank in plan.layout] == [1, 0, 2]
+
+        result, _ = f(jnp.arange(3.0), [3.0, jnp.zeros((2, 2))])
+        assert np.allclose(result, 3 * np.arange(3.0))
+        assert f.compiled_function.marshalling_plan is plan
+
+    def test_strided_arguments(self):
+        """Test that the strides of non-contiguous arguments are preserved."""
+
+        @qjit
+        def f(x):
+            return jnp.sum(x * jnp.arange(x.shape[0] * x.shape[1]).reshape(x.shape))
+
+        x = np.arange(24.0).reshape(4, 6)
+        weights = np.arange(6).reshape(2, 3)
+        assert np.allclose(f(x[::2, 1::2]), np.sum(x[::2, 1::2] * weights))
+        assert np.allclose(f(np.asfortranarray(x[:2, :3])), np.sum(x[:2, :3] * weights))
+
+
+class TestOutputBuffers:
+    """Test writing the results of compiled functions into caller-provided buffers."""
+
+    def test_out_buffers(self):
+        """Test that results are written into the provided buffers, which are returned."""
+
+        @qjit
+        def f(x):
+            return {"scaled": x * 2, "total": jnp.sum(x)}
+
+        scaled, total = np.empty(3), np.empty(())
+        for i in range(3):
+            result = f.call_into({"scaled": scaled, "total": total}, np.full(3, float(i)))
+            assert result["scaled"] is scaled and result["total"] is total
+            assert np.allclose(scaled, 2.0 * i)
+            assert np.allclose(total, 3.0 * i)
+
+        # Results without a buffer are returned as new arrays.
+        result = f.call_into({"scaled": scaled, "total": None}, np.ones(3))
+        assert result["scaled"] is scaled
+        assert np.allclose(result["total"], 3.0)
+
+    def test_out_buffer_mismatch(self):
+        """Test that buffers which do not match the results are rejected."""
+
+        @qjit
+        def f(x):
+            return x * 2, jnp.sum(x)
+
+        with pytest.raises(CompileError, match="does not match the result"):
+            f.call_into((np.empty(4), None), np.ones(3))
+        with pytest.raises(CompileError, match="do not match the structure"):
+            f.call_into([np.empty(3)], np.ones(3))
+        with pytest.raises(CompileError, match="writeable NumPy arrays"):
+            f.call_into((jnp.empty(3), None), np.ones(3))
+
+    def test_strided_out_buffers(self):
+        """Test that results are written into non-contiguous buffers."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        buffer = np.zeros((3, 4))
+        result = f.call_into(buffer[:, ::2], np.ones((3, 2)))
+        assert np.allclose(result, 2.0)
+        assert np.allclose(buffer[:, ::2], 2.0)
+        assert np.allclose(buffer[:, 1::2], 0.0)
+
+    def test_out_parameter(self):
+        """Test that an ``out`` keyword argument is passed to the function rather than taken as
+        output buffers."""
+
+        @qjit
+        def inner(x, out):
+            return x + out
+
+        @qjit
+        def outer(x):
+            return inner(x, out=2 * x)
+
+        assert np.allclose(outer(1.0), 3.0)
+
+    def test_donated_arguments(self):
+        """Test that donated arguments receive the results matching their shape and type."""
+
+        @qjit(donate_argnums=0)
+        def f(x, y):
+            return x + y, jnp.sum(x)
+
+        x, y = np.ones(3), np.ones(3)
+        result, total = f(x, y)
+        assert result is x
+        assert np.allclose(x, 2.0)
+        assert np.allclose(total, 3.0)
+        assert np.allclose(y, 1.0)
+
+    def test_donated_argument_returned(self):
+        """Test that results aliasing a donated argument are copied before it is overwritten."""
+
+        @qjit(donate_argnums=0)
+        def f(x):
+            return x + 1, x
+
+        x = np.ones(3)
+        result, original = f(x)
+        assert result is x
+        assert np.allclose(result, 2.0)
+        assert np.allclose(original, 1.0)
+
+    def test_buffers_reused_across_iterations(self):
+        """Test that the same buffers are returned on every iteration, including when they alias
+        the arguments of the call."""
+
+        @qjit
+        def step(x):
+            return x * 0.5, jnp.sum(x)
+
+        x, total = np.ones(4), np.empty(())
+        buffers = (x, total)
+        for i in range(3):
+            x, total = step.call_into((x, total), x)
+            assert x is buffers[0] and total is buffers[1]
+            assert np.allclose(x, 0.5 ** (i + 1))
+            assert np.allclose(total, 4 * 0.5**i)
+
+    def test_donated_argument_aliasing_result(self):
+        """Test that a donated argument which is also returned keeps its value across
+        iterations."""
+
+        @qjit(donate_argnums=0)
+        def f(x):
+            return x * 0.5, x
+
+        x = original = np.ones(4)
+        for i in range(3):
+            x, previous = f(x)
+            assert x is original
+            assert np.allclose(x, 0.5 ** (i + 1))
+            assert np.allclose(previous, 0.5**i)
+
+    def test_invalid_donation(self):
+        """Test that static arguments cannot be donated."""
+
+        with pytest.raises(CompileError, match="cannot be donated"):
+            qjit(lambda x, n: x * n, static_argnums=1, donate_argnums=1)
+
+
+class TestBatch:
+    """Test evaluating compiled functions for batches of arguments in a single call."""
+
+    def test_batch(self, backend):
+        """Test that batched results match the results of the individual evaluations."""
+
+        @qjit
+        @qml.qnode(qml.device(backend, wires=2))
+        def circuit(x, params):
+            qml.RX(x, wires=0)
+            qml.RY(params["y"], wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1)), qml.probs(wires=[0, 1])
+
+        xs, ys = jnp.linspace(0, 1, 5), jnp.linspace(1, 2, 5)
+        expvals, probs = circuit.batch(xs, {"y": ys})
+        assert expvals.shape == (5,) and probs.shape == (5, 4)
+        for i in range(5):
+            expval, prob = circuit(xs[i], {"y": ys[i]})
+            assert np.allclose(expvals[i], expval)
+            assert np.allclose(probs[i], prob)
+
+    def test_batch_is_compiled_once(self):
+        """Test that batches of the same size reuse the batched program, with static arguments
+        shared by all evaluations."""
+
+        @qjit(static_argnums=1)
+        def f(x, n):
+            return jnp.sum(x) * n
+
+        assert np.allclose(f.batch(np.ones((4, 3)), 2), np.full(4, 6.0))
+        assert np.allclose(f.batch(np.arange(12.0).reshape(4, 3), 2), [6.0, 24.0, 42.0, 60.0])
+        assert f.batched_function.cache_info().misses == 1
+        assert f.compiled_function is None
+
+    def test_batch_out_buffers(self):
+        """Test that stacked results can be written into output buffers."""
+
+        @qjit
+        def f(x):
+            return x * 2
+
+        out = np.empty((3, 2))
+        assert f.batch(np.ones((3, 2)), out=out) is out
+        assert np.allclose(out, 2.0)
+
+    def test_invalid_batch(self):
+        """Test that arguments which are not stacked along a common axis are rejected."""
+
+        @qjit
+        def f(x, y):
+            return x + y
+
+        with pytest.raises(CompileError, match="stacked along a leading axis"):
+            f.batch(np.ones(3), np.ones(4))
+        with pytest.raises(CompileError, match="stacked along a leading axis"):
+            f.batch(np.ones(3), 1.0)
+
+
+class TestConcurrentExecution:
+    """Test invoking compiled functions concurrently from multiple threads."""
+
+    NUM_THREADS = 8
+    NUM_CALLS = 50
+
+    def run_concurrently(self, fn, inputs):
+        """Call a function for every input from a pool of threads, and return the results in the
+        order of the inputs."""
+        with concurrent.futures.ThreadPoolExecutor(self.NUM_THREADS) as executor:
+            return list(executor.map(fn, inputs))
+
+    @pytest.mark.parametrize("persistent_context", [False, True])
+    def test_stress(self, backend, persistent_context):
+        """Test that concurrent invocations of a circuit produce the same results as sequential
+        invocations."""
+
+        @qjit(persistent_context=persistent_context)
+        @qml.qnode(qml.device(backend, wires=2))
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(x / 2, wires=1)
+            return qml.expval(qml.PauliZ(1)), qml.probs(wires=[0, 1])
+
+        xs = np.linspace(0, pi, self.NUM_THREADS * self.NUM_CALLS)
+        expected = [circuit(x) for x in xs]
+        results = self.run_concurrently(circuit, xs)
+
+        for (expval, probs), (expected_expval, expected_probs) in zip(results, expected):
+            assert np.allclose(expval, expected_expval)
+            assert np.allclose(probs, expected_probs)
+
+        circuit.compiled_function.close()
+        assert not RuntimeContextManager.active
+
+    def test_concurrent_signatures(self):
+        """Test that concurrent calls for different signatures invoke the matching versions."""
+
+        @qjit
+        def f(x):
+            return jnp.sum(x), x.shape[0]
+
+        inputs = [np.full(n % 4 + 1, float(n)) for n in range(self.NUM_THREADS * self.NUM_CALLS)]
+        results = self.run_concurrently(f, inputs)
+
+        for x, (total, length) in zip(inputs, results):
+            assert np.allclose(total, np.sum(x))
+            assert length == x.shape[0]
+        assert f.cache_info().misses == 4
+
+    def test_concurrent_evictions(self):
+        """Test that versions evicted by concurrent calls for another signature remain loaded
+        until the calls using them complete."""
+
+        @qjit(cache_max_entries=1)
+        def f(x):
+            return jnp.sum(jnp.sin(x) ** 2 + jnp.cos(x) ** 2), x.shape[0]
+
+        inputs = [np.ones(n % 2 + 1) for n in range(self.NUM_THREADS * self.NUM_CALLS)]
+        results = self.run_concurrently(f, inputs)
+
+        for x, (total, length) in zip(inputs, results):
+            assert np.allclose(total, x.shape[0])
+            assert length == x.shape[0]
+        info = f.cache_info()
+        assert info.entries == 1
+        assert info.evictions == info.misses - 1
+
+    def test_concurrent_callbacks(self):
+        """Test that Python callbacks of programs running concurrently acquire the GIL."""
+
+        @catalyst.pure_callback
+        def square(x) -> float:
+            return x**2
+
+        @qjit
+        def f(x):
+            return square(x) + 1
+
+        xs = np.linspace(0, 1, self.NUM_THREADS * self.NUM_CALLS)
+        results = self.run_concurrently(f, xs)
+        assert np.allclose(results, xs**2 + 1)
+
+
 if __name__ == "__main__":
     pytest.main(["-x", __file__])
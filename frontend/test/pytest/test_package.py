@@ -18,6 +18,8 @@ Unit tests for the Catalyst package in general.
 
 # pylint: disable=import-outside-toplevel
 
+import os
+import subprocess
 import sys
 
 import pytest
@@ -58,5 +60,49 @@ def test_revision_installed(monkeypatch):
     assert len(catalyst.__revision__) > 0
 
 
+def test_lazy_imports():
+    """Test that importing the package does not load the tracer, PennyLane, AutoGraph or the
+    compiler driver, and that the public API is loaded once accessed."""
+    script = (
+        "import sys, catalyst\n"
+        "heavy = ['pennylane', 'malt', 'catalyst.jax_tracer', 'mlir_quantum.compiler_driver']\n"
+        "assert not [m for m in heavy if m in sys.modules], sys.modules.keys()\n"
+        "assert callable(catalyst.qjit) and 'catalyst.jit' in sys.modules\n"
+        "assert catalyst.debug is sys.modules['catalyst.debug']\n"
+        "assert not hasattr(catalyst, 'missing')\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_lazy_imports_enable_x64():
+    """Test that 64-bit types are enabled once the public API is loaded, without leaking the
+    setting into the environment of subprocesses."""
+    script = (
+        "import os, catalyst\n"
+        "assert 'JAX_ENABLE_X64' not in os.environ\n"
+        "catalyst.qjit\n"
+        "import jax\n"
+        "assert jax.config.jax_enable_x64\n"
+        "assert 'JAX_ENABLE_X64' not in os.environ\n"
+    )
+    env = {k: v for k, v in os.environ.items() if k != "JAX_ENABLE_X64"}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
+
+
+def test_lazy_attributes():
+    """Test that the lazily imported attributes cover the public API of their modules."""
+    import catalyst
+    from catalyst import api_extensions, autograph
+
+    lazy_attributes = catalyst._lazy_attributes  # pylint: disable=protected-access
+    for module in (api_extensions, autograph):
+        names = {name for name, path in lazy_attributes.items() if path == module.__name__}
+        assert names == set(module.__all__)
+
+    for name, path in lazy_attributes.items():
+        assert getattr(catalyst, name) is getattr(sys.modules[path], name)
+        assert name in catalyst.__all__
+
+
 if __name__ == "__main__":
     pytest.main(["-x", __file__])
@@ -0,0 +1,120 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the on-disk persistent compilation cache."""
+
+import jax.numpy as jnp
+import numpy as np
+import pennylane as qml
+import pytest
+from jax.core import ShapedArray
+from jax.tree_util import tree_structure
+
+from catalyst import qjit
+from catalyst.compiler import CompileOptions, LinkerDriver
+from catalyst.persistent_cache import (
+    PersistentCache,
+    deserialize_signature,
+    deserialize_treedef,
+    get_device_libraries,
+    serialize_signature,
+    serialize_treedef,
+)
+
+# pylint: disable=missing-function-docstring
+
+
+def circuit_builder(backend, cache_dir):
+    """Build a fresh QJIT object for the same program."""
+
+    @qjit(persistent_cache=str(cache_dir))
+    @qml.qnode(qml.device(backend, wires=2))
+    def circuit(x):
+        qml.RX(x, wires=0)
+        qml.CNOT(wires=[0, 1])
+        return qml.expval(qml.PauliZ(1))
+
+    return circuit
+
+
+class TestPersistentCache:
+    """Test the persistent cache integration with QJIT."""
+
+    def test_cache_hit_skips_compilation(self, backend, tmp_path, monkeypatch):
+        """Test that a second QJIT object for the same program is loaded from the cache."""
+
+        expected = circuit_builder(backend, tmp_path)(0.4)
+        assert len(list(tmp_path.iterdir())) > 0
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("The linker should not run on a cache hit.")
+
+        monkeypatch.setattr(LinkerDriver, "run", fail)
+        result = circuit_builder(backend, tmp_path)(0.4)
+
+        assert np.allclose(result, expected)
+
+    def test_different_options_miss(self, tmp_path):
+        """Test that the cache key depends on the compilation options."""
+
+        mlir = "module @f {}"
+        key = PersistentCache.get_key(mlir, CompileOptions())
+        assert key == PersistentCache.get_key(mlir, CompileOptions())
+        assert key != PersistentCache.get_key(mlir, CompileOptions(async_qnodes=True))
+        assert key != PersistentCache.get_key(mlir, CompileOptions(opt_level=3))
+        assert key != PersistentCache.get_key(mlir, CompileOptions(target_cpu="native"))
+        assert key != PersistentCache.get_key("module @g {}", CompileOptions())
+
+        assert PersistentCache(tmp_path).lookup(key, tmp_path) is None
+
+    def test_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted beyond the size limit."""
+
+        shared_object = tmp_path / "f.so"
+        shared_object.write_bytes(b"\0" * 1024)
+
+        cache = PersistentCache(tmp_path / "cache", max_size=3000)
+        sig = (ShapedArray((), jnp.float64),)
+        treedef = tree_structure(0)
+        for key in ("a", "b", "c"):
+            assert cache.insert(key, str(shared_object), "f", [], "", sig, treedef)
+
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+        assert cache.lookup("a", workspace) is None
+        assert cache.lookup("b", workspace) is not None
+        assert cache.lookup("c", workspace) is not None
+
+        cache.clear()
+        assert cache.lookup("c", workspace) is None
+
+
+class TestSerialization:
+    """Test the serialization of metadata stored in the cache."""
+
+    def test_signature(self):
+        sig = ({"a": ShapedArray((2, 3), jnp.float32)}, ShapedArray((), jnp.int64, weak_type=True))
+        assert deserialize_signature(serialize_signature(sig)) == sig
+
+    def test_treedef(self):
+        treedef = tree_structure(({"a": 1, "b": [2, 3]}, 4))
+        assert deserialize_treedef(serialize_treedef(treedef)) == treedef
+
+    def test_device_libraries(self):
+        mlir = 'quantum.device["/lib/librtd_lightning.so", "LightningSimulator", "{}"]'
+        assert get_device_libraries(mlir) == ["/lib/librtd_lightning.so"]
+
+
+if __name__ == "__main__":
+    pytest.main(["-x", __file__])
@@ -0,0 +1,179 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for saving compiled functions to disk and loading them."""
+
+import json
+import pickle
+import subprocess
+import sys
+
+import jax.numpy as jnp
+import numpy as np
+import pennylane as qml
+import pytest
+
+import catalyst
+from catalyst import CompileError, qjit
+from catalyst.saved_functions import METADATA_NAME
+
+
+@qjit
+@qml.qnode(qml.device("lightning.qubit", wires=1))
+def rx_circuit(x):
+    """Module-level program for the serialization tests."""
+    qml.RX(x, wires=0)
+    return qml.expval(qml.PauliZ(0))
+
+
+def get_saved_device_libraries(path):
+    """Get the device libraries listed in the metadata of a saved function."""
+    with open(path / METADATA_NAME, "rb") as metadata_file:
+        return pickle.load(metadata_file)["device_libraries"]
+
+
+def test_save_and_load(backend, tmp_path):
+    """Test that a loaded function computes the same results as the saved one."""
+
+    @qjit
+    @qml.qnode(qml.device(backend, wires=2))
+    def circuit(x, params):
+        qml.RX(x, wires=0)
+        qml.RY(params["y"], wires=1)
+        qml.CNOT(wires=[0, 1])
+        return {"z": qml.expval(qml.PauliZ(1)), "probs": qml.probs(wires=[0, 1])}
+
+    params = {"y": 0.2}
+    expected = circuit(0.5, params)
+    circuit.save(tmp_path / "circuit")
+
+    loaded = catalyst.load(tmp_path / "circuit")
+    result = loaded(0.5, params)
+    assert result.keys() == expected.keys()
+    assert np.allclose(result["z"], expected["z"])
+    assert np.allclose(result["probs"], expected["probs"])
+
+    # Arguments are promoted to the saved signature.
+    assert np.allclose(loaded(1, {"y": 0})["z"], circuit(1.0, {"y": 0.0})["z"])
+
+
+def test_load_in_fresh_process(tmp_path):
+    """Test that a saved function can be loaded and called in a different process."""
+
+    @qjit
+    def f(x):
+        return jnp.sin(x) * 2
+
+    f(jnp.ones(3))
+    f.save(tmp_path / "f")
+
+    script = (
+        "import numpy as np, catalyst\n"
+        f"f = catalyst.load({str(tmp_path / 'f')!r})\n"
+        "print(np.asarray(f(np.ones(3))).tolist())\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    assert np.allclose(json.loads(output), 2 * np.sin(np.ones(3)))
+
+
+def test_static_arguments(tmp_path):
+    """Test that loaded functions only accept the static arguments they were compiled for."""
+
+    @qjit(static_argnums=1)
+    def f(x, n):
+        return x * n
+
+    f(1.0, 3)
+    f.save(tmp_path / "f")
+    loaded = catalyst.load(tmp_path / "f")
+
+    assert np.allclose(loaded(2.0, 3), 6.0)
+    with pytest.raises(CompileError, match="compiled for the static arguments"):
+        loaded(2.0, 4)
+
+
+def test_signature_mismatch(tmp_path):
+    """Test that loaded functions reject arguments which do not match their signature."""
+
+    @qjit
+    def f(x):
+        return x * 2
+
+    f(jnp.ones(3))
+    f.save(tmp_path / "f")
+
+    with pytest.raises(CompileError, match="do not match the signature"):
+        catalyst.load(tmp_path / "f")(jnp.ones(4))
+
+
+def test_device_libraries_of_active_version(backend, tmp_path):
+    """Test that the device libraries of the version in use are saved after switching versions."""
+
+    @qml.qnode(qml.device(backend, wires=1))
+    def circuit(x):
+        qml.RX(x, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    @qjit(static_argnums=1)
+    def f(x, quantum):
+        return circuit(x) if quantum else x * 2
+
+    f(0.5, True)
+    f.save(tmp_path / "quantum")
+    device_libraries = get_saved_device_libraries(tmp_path / "quantum")
+    assert device_libraries
+
+    f(0.5, False)
+    f(0.5, True)
+    f.save(tmp_path / "restored")
+    assert get_saved_device_libraries(tmp_path / "restored") == device_libraries
+
+
+def test_device_libraries_after_pickling(tmp_path):
+    """Test that the device libraries are saved for functions restored from a pickle."""
+
+    rx_circuit(0.5)
+    rx_circuit.save(tmp_path / "original")
+
+    restored = pickle.loads(pickle.dumps(rx_circuit))
+    restored.save(tmp_path / "restored")
+
+    device_libraries = get_saved_device_libraries(tmp_path / "original")
+    assert device_libraries
+    assert get_saved_device_libraries(tmp_path / "restored") == device_libraries
+    assert np.allclose(catalyst.load(tmp_path / "restored")(0.3), np.cos(0.3))
+
+
+def test_save_uncompiled_function(tmp_path):
+    """Test that functions can only be saved once compiled."""
+
+    @qjit
+    def f(x):
+        return x * 2
+
+    with pytest.raises(CompileError, match="must be compiled before it can be saved"):
+        f.save(tmp_path / "f")
+
+
+def test_load_missing_function(tmp_path):
+    """Test that loading from a directory without a saved function fails."""
+
+    with pytest.raises(CompileError, match="No saved function found"):
+        catalyst.load(tmp_path)
+
+
+if __name__ == "__main__":
+    pytest.main(["-x", __file__])
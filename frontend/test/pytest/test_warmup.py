@@ -0,0 +1,86 @@
+# Copyright 2024 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the parallel warm-up of qjit-compiled functions."""
+
+import jax.numpy as jnp
+import numpy as np
+import pennylane as qml
+import pytest
+from jax.core import ShapedArray
+
+from catalyst import CompileError, qjit, warmup
+
+
+def test_warmup(backend):
+    """Test that warmed up functions are not compiled again on their first call."""
+
+    @qjit
+    def f(x):
+        return x * 2
+
+    @qjit
+    @qml.qnode(qml.device(backend, wires=1))
+    def g(x):
+        qml.RX(x, wires=0)
+        return qml.expval(qml.PauliZ(0))
+
+    warmup([(f, (ShapedArray((3,), jnp.float64),)), (g, (0.5,))], max_workers=2)
+    assert f.cache_info().entries == 1
+    assert g.cache_info().entries == 1
+
+    assert np.allclose(f(jnp.ones(3)), 2 * jnp.ones(3))
+    assert np.allclose(g(0.5), np.cos(0.5))
+    assert f.cache_info().misses == 0
+    assert g.cache_info().misses == 0
+
+
+def test_warmup_skips_compiled_functions():
+    """Test that functions compiled for the provided arguments are not compiled again."""
+
+    @qjit
+    def f(x):
+        return x * 2
+
+    f(1.0)
+    compiled_function = f.compiled_function
+    warmup([(f, (1.0,))])
+
+    assert f.cache_info().entries == 1
+    assert f.compiled_function is compiled_function
+
+
+def test_warmup_repeated_entries():
+    """Test that repeated entries with the same argument signature are compiled once."""
+
+    @qjit
+    def f(x):
+        return x * 2
+
+    warmup([(f, (1.0,)), (f, (2.0,)), (f, (ShapedArray((), jnp.float64),))])
+
+    assert f.cache_info().entries == 1
+    assert np.allclose(f(3.0), 6.0)
+    assert f.cache_info().misses == 0
+
+
+def test_warmup_invalid_function():
+    """Test that only qjit-compiled functions can be warmed up."""
+
+    with pytest.raises(CompileError, match="Expected a qjit-compiled function"):
+        warmup([(lambda x: x, (1.0,))])
+
+
+if __name__ == "__main__":
+    pytest.main(["-x", __file__])
@@ -18,6 +18,7 @@
 #include "mlir/Support/LogicalResult.h"
 #include "llvm/ADT/StringRef.h"
 #include "llvm/IR/Module.h"
+#include "llvm/Target/TargetMachine.h"
 
 #include "CompilerDriver.h"
 
@@ -27,6 +28,13 @@ namespace driver {
 /// Register the translations needed to convert to LLVM IR.
 void registerLLVMTranslations(mlir::DialectRegistry &registry);
 
+/// Get the name and the comma-separated features of the host CPU, as targeted by the "native" CPU.
+std::pair<std::string, std::string> getHostCPU();
+
+/// Create a target machine for the default target triple and the target CPU and features of the
+/// options. Returns null if the target is not available.
+std::unique_ptr<llvm::TargetMachine> createTargetMachine(const CompilerOptions &options);
+
 mlir::LogicalResult compileObjectFile(const CompilerOptions &options,
                                       std::shared_ptr<llvm::Module> module,
                                       llvm::StringRef filename);
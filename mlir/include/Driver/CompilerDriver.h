@@ -61,7 +61,7 @@ struct Pipeline {
 
 /// Optional parameters, for which we provide reasonable default values.
 struct CompilerOptions {
-    /// The textual IR (MLIR or LLVM IR)
+    /// The IR to compile, either textual (MLIR or LLVM IR) or MLIR bytecode
     mlir::StringRef source;
     /// The directory to place outputs (object file and intermediate results)
     mlir::StringRef workspace;
@@ -78,6 +78,16 @@ struct CompilerOptions {
     std::vector<Pipeline> pipelinesCfg;
     /// Whether to assume that the pipelines output is a valid LLVM dialect and lower it to LLVM IR
     bool lowerToLLVM;
+    /// The optimization level, from 0 to 3, of the LLVM optimization and code generation stages
+    size_t optLevel;
+    /// The CPU to generate code for, or "native" for the host CPU. Empty for a generic CPU.
+    std::string targetCPU;
+    /// Comma-separated target features to enable or disable in addition to the CPU features,
+    /// e.g. "+avx2,-fma".
+    std::string targetFeatures;
+    /// If true, the module after each pipeline is cached in memory, such that later compilations
+    /// of the same source sharing the first pipelines resume from the cached module.
+    bool stageCache;
 
     /// Get the destination of the object file at the end of compilation.
     std::string getObjectFile() const
@@ -0,0 +1,71 @@
+// Copyright 2024 Xanadu Quantum Technologies Inc.
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#pragma once
+
+#include <list>
+#include <mutex>
+#include <optional>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+#include "llvm/ADT/ArrayRef.h"
+#include "llvm/ADT/StringRef.h"
+
+#include "CompilerDriver.h"
+
+namespace catalyst {
+namespace driver {
+
+/// Process-wide cache of the MLIR bytecode of modules after each pipeline.
+///
+/// Entries are keyed on the input source and on all pipelines run up to and including a pipeline,
+/// such that a compilation of the same source sharing the first pipelines with an earlier
+/// compilation can resume from the cached module. The least recently used entries are evicted
+/// once the total size of the cache exceeds its limit. The cache is safe to use concurrently.
+class StageCache {
+  public:
+    /// Default limit of the total size of the cached modules in bytes.
+    static constexpr size_t defaultMaxSize = 256 * 1024 * 1024;
+
+    /// Get the cache shared by all invocations of the compiler driver in this process.
+    static StageCache &instance();
+
+    /// Compute the keys of the module after each of the pipelines, when run on the source.
+    static std::vector<std::string> getKeys(llvm::StringRef source,
+                                            llvm::ArrayRef<Pipeline> pipelines);
+
+    /// Get the cached bytecode of a module, if any.
+    std::optional<std::string> lookup(const std::string &key);
+
+    /// Store the bytecode of a module, evicting the least recently used entries if necessary.
+    void insert(const std::string &key, std::string bytecode);
+
+    /// Remove all entries.
+    void clear();
+
+  private:
+    using Entry = std::pair<std::string, std::string>;
+
+    std::mutex mutex;
+    /// Entries ordered from the most to the least recently used.
+    std::list<Entry> entries;
+    std::unordered_map<std::string, std::list<Entry>::iterator> index;
+    size_t size = 0;
+    size_t maxSize = defaultMaxSize;
+};
+
+} // namespace driver
+} // namespace catalyst
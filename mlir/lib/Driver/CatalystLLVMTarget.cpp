@@ -12,6 +12,13 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
+#include <algorithm>
+#include <mutex>
+#include <string>
+#include <tuple>
+#include <utility>
+#include <vector>
+
 #include "mlir/Interfaces/FunctionInterfaces.h"
 #include "mlir/Target/LLVMIR/Dialect/Builtin/BuiltinToLLVMIRTranslation.h"
 #include "mlir/Target/LLVMIR/Dialect/LLVMIR/LLVMToLLVMIRTranslation.h"
@@ -25,6 +32,7 @@
 #include "llvm/Target/TargetMachine.h"
 #include "llvm/Target/TargetOptions.h"
 #include "llvm/TargetParser/Host.h"
+#include "llvm/TargetParser/SubtargetFeature.h"
 
 #include "Driver/CatalystLLVMTarget.h"
 #include "Gradient/IR/GradientDialect.h"
@@ -37,19 +45,41 @@ void catalyst::driver::registerLLVMTranslations(DialectRegistry &registry)
     registerBuiltinDialectTranslation(registry);
 }
 
-LogicalResult catalyst::driver::compileObjectFile(const CompilerOptions &options,
-                                                  std::shared_ptr<llvm::Module> llvmModule,
-                                                  StringRef filename)
+std::pair<std::string, std::string> catalyst::driver::getHostCPU()
+{
+    using namespace llvm;
+
+    SubtargetFeatures features;
+    StringMap<bool> hostFeatures;
+    if (sys::getHostCPUFeatures(hostFeatures)) {
+        // Sort the features, such that the result is stable between processes.
+        std::vector<std::pair<std::string, bool>> sortedFeatures;
+        for (const auto &feature : hostFeatures) {
+            sortedFeatures.emplace_back(feature.first().str(), feature.second);
+        }
+        std::sort(sortedFeatures.begin(), sortedFeatures.end());
+        for (const auto &[name, enabled] : sortedFeatures) {
+            features.AddFeature(name, enabled);
+        }
+    }
+    return {sys::getHostCPUName().str(), features.getString()};
+}
+
+std::unique_ptr<llvm::TargetMachine>
+catalyst::driver::createTargetMachine(const CompilerOptions &options)
 {
     using namespace llvm;
 
     std::string targetTriple = sys::getDefaultTargetTriple();
 
-    InitializeAllTargetInfos();
-    InitializeAllTargets();
-    InitializeAllTargetMCs();
-    InitializeAllAsmParsers();
-    InitializeAllAsmPrinters();
+    static std::once_flag targetInitFlag;
+    std::call_once(targetInitFlag, []() {
+        InitializeAllTargetInfos();
+        InitializeAllTargets();
+        InitializeAllTargetMCs();
+        InitializeAllAsmParsers();
+        InitializeAllAsmPrinters();
+    });
 
     std::string err;
 
@@ -57,19 +87,45 @@ LogicalResult catalyst::driver::compileObjectFile(const CompilerOptions &options
 
     if (!target) {
         CO_MSG(options, Verbosity::Urgent, err);
-        return failure();
+        return nullptr;
     }
 
-    // Target a generic CPU without any additional features, options, or relocation model
-    const char *cpu = "generic";
-    const char *features = "";
+    // Target a generic CPU without any additional features, options, or relocation model, unless
+    // a CPU is requested. Features requested explicitly take precedence over the CPU features.
+    std::string cpu = options.targetCPU.empty() ? "generic" : options.targetCPU;
+    SubtargetFeatures features;
+    if (options.targetCPU == "native") {
+        std::string hostFeatures;
+        std::tie(cpu, hostFeatures) = getHostCPU();
+        features.addFeaturesVector(SubtargetFeatures(hostFeatures).getFeatures());
+    }
+    features.addFeaturesVector(SubtargetFeatures(options.targetFeatures).getFeatures());
+
+    CO_MSG(options, Verbosity::Debug,
+           "Target CPU: '" << cpu << "', features: '" << features.getString() << "'\n");
 
     TargetOptions opt;
-    auto targetMachine =
-        target->createTargetMachine(targetTriple, cpu, features, opt, Reloc::Model::PIC_);
-    targetMachine->setOptLevel(CodeGenOptLevel::None);
+    std::unique_ptr<TargetMachine> targetMachine(target->createTargetMachine(
+        targetTriple, cpu, features.getString(), opt, Reloc::Model::PIC_));
+    // Code generation is only optimized at the highest optimization level, since it significantly
+    // increases compilation time.
+    targetMachine->setOptLevel(options.optLevel >= 3 ? CodeGenOptLevel::Aggressive
+                                                     : CodeGenOptLevel::None);
+    return targetMachine;
+}
+
+LogicalResult catalyst::driver::compileObjectFile(const CompilerOptions &options,
+                                                  std::shared_ptr<llvm::Module> llvmModule,
+                                                  StringRef filename)
+{
+    using namespace llvm;
+
+    auto targetMachine = createTargetMachine(options);
+    if (!targetMachine) {
+        return failure();
+    }
     llvmModule->setDataLayout(targetMachine->createDataLayout());
-    llvmModule->setTargetTriple(targetTriple);
+    llvmModule->setTargetTriple(targetMachine->getTargetTriple().str());
 
     std::error_code errCode;
     raw_fd_ostream dest(filename, errCode, sys::fs::OF_None);
@@ -19,6 +19,7 @@
 #include <iostream>
 #include <list>
 #include <memory>
+#include <mutex>
 #include <optional>
 #include <string>
 #include <string_view>
@@ -26,6 +27,7 @@
 
 #include "mhlo/IR/register.h"
 #include "mhlo/transforms/passes.h"
+#include "mlir/Bytecode/BytecodeWriter.h"
 #include "mlir/IR/DialectRegistry.h"
 #include "mlir/InitAllDialects.h"
 #include "mlir/InitAllExtensions.h"
@@ -44,6 +46,7 @@
 #include "Catalyst/Transforms/Passes.h"
 #include "Driver/CatalystLLVMTarget.h"
 #include "Driver/CompilerDriver.h"
+#include "Driver/StageCache.h"
 #include "Driver/Support.h"
 #include "Gradient/IR/GradientDialect.h"
 #include "Gradient/Transforms/Passes.h"
@@ -353,14 +356,71 @@ LogicalResult inferMLIRReturnTypes(MLIRContext *ctx, llvm::Type *returnType,
     return failure();
 }
 
+/// Get the LLVM optimization level corresponding to the optimization level of the options.
+llvm::OptimizationLevel getOptimizationLevel(const CompilerOptions &options)
+{
+    switch (options.optLevel) {
+    case 0:
+        return llvm::OptimizationLevel::O0;
+    case 1:
+        return llvm::OptimizationLevel::O1;
+    case 2:
+        return llvm::OptimizationLevel::O2;
+    default:
+        return llvm::OptimizationLevel::O3;
+    }
+}
+
+/// Get the tuning options of the LLVM optimization pipelines, following the defaults of clang at
+/// each optimization level.
+llvm::PipelineTuningOptions getPipelineTuningOptions(const CompilerOptions &options)
+{
+    llvm::PipelineTuningOptions PTO;
+    if (options.optLevel <= 1) {
+        PTO.LoopUnrolling = false;
+        PTO.LoopInterleaving = false;
+        PTO.LoopVectorization = false;
+    }
+    else if (options.optLevel >= 3) {
+        PTO.SLPVectorization = true;
+        // Inline more aggressively than the default threshold of -O3 (250).
+        PTO.InlinerThreshold = 500;
+    }
+    return PTO;
+}
+
+/// Create the target machine used by the LLVM optimization stages, which lets the optimizations
+/// take the features of the target CPU into account, for instance when vectorizing. No target
+/// machine is used when targeting a generic CPU.
+LogicalResult getOptimizationTarget(const CompilerOptions &options, llvm::Module &llvmModule,
+                                    std::unique_ptr<llvm::TargetMachine> &targetMachine)
+{
+    if (options.targetCPU.empty() && options.targetFeatures.empty()) {
+        return success();
+    }
+
+    targetMachine = createTargetMachine(options);
+    if (!targetMachine) {
+        return failure();
+    }
+    llvmModule.setDataLayout(targetMachine->createDataLayout());
+    llvmModule.setTargetTriple(targetMachine->getTargetTriple().str());
+    return success();
+}
+
 LogicalResult runLLVMPasses(const CompilerOptions &options,
                             std::shared_ptr<llvm::Module> llvmModule, CompilerOutput &output)
 {
-    // opt -O2
+    // opt -O<optLevel>
     // As seen here:
     // https://llvm.org/docs/NewPassManager.html#just-tell-me-how-to-run-the-default-optimization-pipeline-with-the-new-pass-manager
 
     auto &outputs = output.pipelineOutputs;
+    std::unique_ptr<llvm::TargetMachine> targetMachine;
+    if (failed(getOptimizationTarget(options, *llvmModule, targetMachine))) {
+        return failure();
+    }
+
     // Create the analysis managers.
     llvm::LoopAnalysisManager LAM;
     llvm::FunctionAnalysisManager FAM;
@@ -370,7 +430,7 @@ LogicalResult runLLVMPasses(const CompilerOptions &options,
     // Take a look at the PassBuilder constructor parameters for more
     // customization, e.g. specifying a TargetMachine or various debugging
     // options.
-    llvm::PassBuilder PB;
+    llvm::PassBuilder PB(targetMachine.get(), getPipelineTuningOptions(options));
     // Register all the basic analyses with the managers.
     PB.registerModuleAnalyses(MAM);
     PB.registerCGSCCAnalyses(CGAM);
@@ -379,8 +439,8 @@ LogicalResult runLLVMPasses(const CompilerOptions &options,
     PB.crossRegisterProxies(LAM, FAM, CGAM, MAM);
 
     // Create the pass manager.
-    // This one corresponds to a typical -O2 optimization pipeline.
-    llvm::ModulePassManager MPM = PB.buildPerModuleDefaultPipeline(llvm::OptimizationLevel::O2);
+    // This one corresponds to a typical -O<optLevel> optimization pipeline.
+    llvm::ModulePassManager MPM = PB.buildPerModuleDefaultPipeline(getOptimizationLevel(options));
 
     // Optimize the IR!
     MPM.run(*llvmModule.get(), MAM);
@@ -399,11 +459,16 @@ LogicalResult runEnzymePasses(const CompilerOptions &options,
                               std::shared_ptr<llvm::Module> llvmModule, CompilerOutput &output)
 {
     auto &outputs = output.pipelineOutputs;
+    std::unique_ptr<llvm::TargetMachine> targetMachine;
+    if (failed(getOptimizationTarget(options, *llvmModule, targetMachine))) {
+        return failure();
+    }
+
     // Create the new pass manager builder.
     // Take a look at the PassBuilder constructor parameters for more
     // customization, e.g. specifying a TargetMachine or various debugging
     // options.
-    llvm::PassBuilder PB;
+    llvm::PassBuilder PB(targetMachine.get(), getPipelineTuningOptions(options));
 
     // Create the analysis managers.
     llvm::LoopAnalysisManager LAM;
@@ -422,9 +487,15 @@ LogicalResult runEnzymePasses(const CompilerOptions &options,
     augmentPassBuilder(PB);
 
     // Create the pass manager.
-    // This one corresponds to a typical -O2 optimization pipeline.
-    llvm::ModulePassManager MPM = PB.buildModuleOptimizationPipeline(
-        llvm::OptimizationLevel::O2, llvm::ThinOrFullLTOPhase::None);
+    // This one corresponds to a typical -O<optLevel> optimization pipeline. Enzyme runs as part of
+    // the module optimization pipeline, which is not meant to be built at -O0, hence -O1 is the
+    // lowest level used for this stage.
+    llvm::OptimizationLevel level = getOptimizationLevel(options);
+    if (level == llvm::OptimizationLevel::O0) {
+        level = llvm::OptimizationLevel::O1;
+    }
+    llvm::ModulePassManager MPM =
+        PB.buildModuleOptimizationPipeline(level, llvm::ThinOrFullLTOPhase::None);
 
     // Optimize the IR!
     MPM.run(*llvmModule.get(), MAM);
@@ -439,8 +510,12 @@ LogicalResult runEnzymePasses(const CompilerOptions &options,
     return success();
 }
 
+/// Run the lowering pipelines on the module, skipping the pipelines before ``firstPipeline``
+/// whose output the module already is. If stage keys are provided, the module after each pipeline
+/// is stored in the stage cache.
 LogicalResult runLowering(const CompilerOptions &options, MLIRContext *ctx, ModuleOp moduleOp,
-                          CompilerOutput &output)
+                          CompilerOutput &output, size_t firstPipeline,
+                          const std::vector<std::string> &stageKeys)
 
 {
     auto &outputs = output.pipelineOutputs;
@@ -448,11 +523,14 @@ LogicalResult runLowering(const CompilerOptions &options, MLIRContext *ctx, Modu
 
     // Maps a pass to zero or one pipelines ended by this pass
     // Maps a pass to its owning pipeline
+    // Maps a pass to the index of the pipeline ended by this pass
     std::unordered_map<const Pass *, Pipeline::Name> pipelineTailMarkers;
     std::unordered_map<const Pass *, Pipeline::Name> passPipelineNames;
+    std::unordered_map<const Pass *, size_t> pipelineTailIndices;
 
     // Fill all the pipe-to-pipeline mappings
-    for (const auto &pipeline : options.pipelinesCfg) {
+    for (size_t i = firstPipeline; i < options.pipelinesCfg.size(); i++) {
+        const auto &pipeline = options.pipelinesCfg[i];
         size_t existingPasses = pm.size();
         if (failed(parsePassPipeline(joinPasses(pipeline.passes), pm, options.diagnosticStream))) {
             return failure();
@@ -465,6 +543,7 @@ LogicalResult runLowering(const CompilerOptions &options, MLIRContext *ctx, Modu
             }
             assert(pass != nullptr);
             pipelineTailMarkers[pass] = pipeline.name;
+            pipelineTailIndices[pass] = i;
         }
     }
 
@@ -500,6 +579,18 @@ LogicalResult runLowering(const CompilerOptions &options, MLIRContext *ctx, Modu
             dumpToFile(options, output.nextPipelineDumpFilename(pipelineName),
                        outputs[pipelineName]);
         }
+
+        // Passes nested in the module run on one operation at a time, hence only the output of
+        // module-level passes is complete.
+        if (!stageKeys.empty() && res != pipelineTailMarkers.end() && isa<ModuleOp>(op)) {
+            std::string bytecode;
+            llvm::raw_string_ostream s{bytecode};
+            if (succeeded(writeBytecodeToFile(op, s))) {
+                s.flush();
+                StageCache::instance().insert(stageKeys[pipelineTailIndices[pass]],
+                                              std::move(bytecode));
+            }
+        }
     };
 
     // For each failed pass, print the owner pipeline name into a diagnostic stream.
@@ -533,13 +624,14 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
     using timer = catalyst::utils::Timer;
 
     DialectRegistry registry;
-    static bool initialized = false;
-    if (!initialized) {
+    // Pass registration modifies global registries and must only happen once, even when the
+    // driver is invoked concurrently from multiple threads.
+    static std::once_flag passRegistrationFlag;
+    std::call_once(passRegistrationFlag, []() {
         registerAllPasses();
-    }
-    initialized |= true;
-    registerAllCatalystPasses();
-    mhlo::registerAllMhloPasses();
+        registerAllCatalystPasses();
+        mhlo::registerAllMhloPasses();
+    });
 
     registerAllCatalystDialects(registry);
     registerLLVMTranslations(registry);
@@ -557,7 +649,27 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
 
     llvm::raw_string_ostream outIRStream(output.outIR);
 
-    auto moduleBuffer = llvm::MemoryBuffer::getMemBufferCopy(options.source, options.moduleName);
+    // Resume from the cached module after the longest sequence of leading pipelines, if any.
+    // Intermediate results are only complete if all pipelines run, hence the cache is not used
+    // when they are requested.
+    std::vector<std::string> stageKeys;
+    std::optional<std::string> cachedModule;
+    size_t firstPipeline = 0;
+    if (options.stageCache && !options.keepIntermediate) {
+        stageKeys = StageCache::getKeys(options.source, options.pipelinesCfg);
+        for (size_t i = stageKeys.size(); i > 0 && !cachedModule; i--) {
+            cachedModule = StageCache::instance().lookup(stageKeys[i - 1]);
+            if (cachedModule) {
+                firstPipeline = i;
+                CO_MSG(options, Verbosity::All,
+                       "Resuming compilation after pipeline '"
+                           << options.pipelinesCfg[i - 1].name << "'\n");
+            }
+        }
+    }
+
+    auto moduleBuffer = llvm::MemoryBuffer::getMemBufferCopy(
+        cachedModule ? StringRef(*cachedModule) : options.source, options.moduleName);
     auto sourceMgr = std::make_shared<llvm::SourceMgr>();
     sourceMgr->AddNewSourceBuffer(std::move(moduleBuffer), SMLoc());
     SourceMgrDiagnosticHandler sourceMgrHandler(*sourceMgr, &ctx, options.diagnosticStream);
@@ -568,7 +680,7 @@ LogicalResult QuantumDriverMain(const CompilerOptions &options, CompilerOutput &
 
     if (op) {
         if (failed(timer::timer(runLowering, "runMLIRPasses", /* add_endl */ true, options, &ctx,
-                                *op, output))) {
+                                *op, output, firstPipeline, stageKeys))) {
             CO_MSG(options, Verbosity::Urgent, "Failed to lower MLIR module\n");
             return failure();
         }
@@ -0,0 +1,87 @@
+// Copyright 2024 Xanadu Quantum Technologies Inc.
+
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+
+//     http://www.apache.org/licenses/LICENSE-2.0
+
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "llvm/ADT/StringExtras.h"
+#include "llvm/Support/SHA256.h"
+
+#include "Driver/StageCache.h"
+
+using namespace catalyst::driver;
+
+StageCache &StageCache::instance()
+{
+    static StageCache cache;
+    return cache;
+}
+
+std::vector<std::string> StageCache::getKeys(llvm::StringRef source,
+                                             llvm::ArrayRef<Pipeline> pipelines)
+{
+    // The key of a stage is made of the hash of the source, followed by the names and passes of
+    // all pipelines up to and including the stage. Pipelines are separated by null characters.
+    std::string key = llvm::toHex(llvm::SHA256::hash(llvm::arrayRefFromStringRef(source)));
+
+    std::vector<std::string> keys;
+    for (const auto &pipeline : pipelines) {
+        key.push_back('\0');
+        key += pipeline.name;
+        for (const auto &pass : pipeline.passes) {
+            key.push_back('\0');
+            key += pass;
+        }
+        keys.push_back(key);
+    }
+    return keys;
+}
+
+std::optional<std::string> StageCache::lookup(const std::string &key)
+{
+    std::lock_guard<std::mutex> lock(mutex);
+
+    auto it = index.find(key);
+    if (it == index.end()) {
+        return std::nullopt;
+    }
+    entries.splice(entries.begin(), entries, it->second);
+    return it->second->second;
+}
+
+void StageCache::insert(const std::string &key, std::string bytecode)
+{
+    std::lock_guard<std::mutex> lock(mutex);
+
+    if (bytecode.size() > maxSize || index.count(key)) {
+        return;
+    }
+
+    size += bytecode.size();
+    entries.emplace_front(key, std::move(bytecode));
+    index[key] = entries.begin();
+
+    while (size > maxSize) {
+        const Entry &last = entries.back();
+        size -= last.second.size();
+        index.erase(last.first);
+        entries.pop_back();
+    }
+}
+
+void StageCache::clear()
+{
+    std::lock_guard<std::mutex> lock(mutex);
+
+    entries.clear();
+    index.clear();
+    size = 0;
+}
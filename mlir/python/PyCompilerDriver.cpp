@@ -15,6 +15,7 @@
 #include <csignal>
 #include <iostream>
 #include <string>
+#include <string_view>
 #include <vector>
 
 #include <pybind11/pybind11.h>
@@ -23,7 +24,9 @@
 #include "mlir/IR/BuiltinTypes.h"
 #include "llvm/Support/raw_ostream.h"
 
+#include "Driver/CatalystLLVMTarget.h"
 #include "Driver/CompilerDriver.h"
+#include "Driver/StageCache.h"
 
 namespace py = pybind11;
 using namespace catalyst::driver;
@@ -76,9 +79,10 @@ PYBIND11_MODULE(compiler_driver, m)
 
     m.def(
         "run_compiler_driver",
-        [](const char *source, const char *workspace, const char *moduleName, bool keepIntermediate,
-           bool verbose, py::list pipelines,
-           bool lower_to_llvm) -> std::unique_ptr<CompilerOutput> {
+        [](std::string_view source, const char *workspace, const char *moduleName,
+           bool keepIntermediate, bool verbose, py::list pipelines,
+           bool lower_to_llvm, size_t opt_level, std::string target_cpu,
+           std::string target_features, bool stage_cache) -> std::unique_ptr<CompilerOutput> {
             // Install signal handler to catch user interrupts (e.g. CTRL-C).
             signal(SIGINT,
                    [](int code) { throw std::runtime_error("KeyboardInterrupt (SIGINT)"); });
@@ -88,23 +92,46 @@ PYBIND11_MODULE(compiler_driver, m)
 
             llvm::raw_string_ostream errStream{output->diagnosticMessages};
 
-            CompilerOptions options{.source = source,
+            // The source is either textual IR (str) or MLIR bytecode (bytes), which may contain
+            // null characters and is therefore passed with its explicit size.
+            CompilerOptions options{.source = mlir::StringRef(source.data(), source.size()),
                                     .workspace = workspace,
                                     .moduleName = moduleName,
                                     .diagnosticStream = errStream,
                                     .keepIntermediate = keepIntermediate,
                                     .verbosity = verbose ? Verbosity::All : Verbosity::Urgent,
                                     .pipelinesCfg = parseCompilerSpec(pipelines),
-                                    .lowerToLLVM = lower_to_llvm};
+                                    .lowerToLLVM = lower_to_llvm,
+                                    .optLevel = opt_level,
+                                    .targetCPU = target_cpu,
+                                    .targetFeatures = target_features,
+                                    .stageCache = stage_cache};
 
             errStream.flush();
 
-            if (mlir::failed(QuantumDriverMain(options, *output))) {
+            mlir::LogicalResult result = mlir::failure();
+            {
+                // The compiler driver does not access any Python objects. Releasing the GIL lets
+                // other Python threads run during compilation, including concurrent compilations.
+                py::gil_scoped_release release;
+                result = QuantumDriverMain(options, *output);
+            }
+
+            if (mlir::failed(result)) {
                 throw std::runtime_error("Compilation failed:\n" + output->diagnosticMessages);
             }
             return output;
         },
         py::arg("source"), py::arg("workspace"), py::arg("module_name") = "jit source",
         py::arg("keep_intermediate") = false, py::arg("verbose") = false,
-        py::arg("pipelines") = py::list(), py::arg("lower_to_llvm") = true);
+        py::arg("pipelines") = py::list(), py::arg("lower_to_llvm") = true,
+        py::arg("opt_level") = 2, py::arg("target_cpu") = "", py::arg("target_features") = "",
+        py::arg("stage_cache") = false);
+
+    m.def("get_host_cpu", &getHostCPU,
+          "Get the name and the features of the host CPU, as targeted by the 'native' CPU.");
+
+    m.def(
+        "clear_stage_cache", []() { StageCache::instance().clear(); },
+        "Remove all modules cached after the pipelines of earlier compilations.");
 }
@@ -113,6 +113,9 @@ struct BraketRunner : public OpenQasmRunner {
 
         RT_FAIL_IF(!Py_IsInitialized(), "The Python interpreter is not initialized");
 
+        // Compiled programs are executed with the GIL released.
+        py::gil_scoped_acquire gil;
+
         auto locals = py::dict("circuit"_a = circuit, "braket_device"_a = device,
                                "kwargs"_a = kwargs, "shots"_a = shots, "msg"_a = "");
 
@@ -168,6 +171,9 @@ struct BraketRunner : public OpenQasmRunner {
 
         RT_FAIL_IF(!Py_IsInitialized(), "The Python interpreter is not initialized");
 
+        // Compiled programs are executed with the GIL released.
+        py::gil_scoped_acquire gil;
+
         auto locals =
             py::dict("circuit"_a = circuit, "braket_device"_a = device, "kwargs"_a = kwargs,
                      "shots"_a = shots, "num_qubits"_a = num_qubits, "msg"_a = "");
@@ -235,6 +241,9 @@ struct BraketRunner : public OpenQasmRunner {
 
         RT_FAIL_IF(!Py_IsInitialized(), "The Python interpreter is not initialized");
 
+        // Compiled programs are executed with the GIL released.
+        py::gil_scoped_acquire gil;
+
         auto locals = py::dict("circuit"_a = circuit, "braket_device"_a = device,
                                "kwargs"_a = kwargs, "shots"_a = shots, "msg"_a = "");
 
@@ -298,6 +307,9 @@ struct BraketRunner : public OpenQasmRunner {
 
         RT_FAIL_IF(!Py_IsInitialized(), "The Python interpreter is not initialized");
 
+        // Compiled programs are executed with the GIL released.
+        py::gil_scoped_acquire gil;
+
         auto locals = py::dict("circuit"_a = circuit, "braket_device"_a = device,
                                "kwargs"_a = kwargs, "shots"_a = shots, "msg"_a = "");
 
@@ -354,6 +366,9 @@ struct BraketRunner : public OpenQasmRunner {
 
         RT_FAIL_IF(!Py_IsInitialized(), "The Python interpreter is not initialized");
 
+        // Compiled programs are executed with the GIL released.
+        py::gil_scoped_acquire gil;
+
         auto locals = py::dict("circuit"_a = circuit, "braket_device"_a = device,
                                "kwargs"_a = kwargs, "shots"_a = shots, "msg"_a = "");
 
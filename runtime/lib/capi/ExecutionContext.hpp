@@ -284,8 +284,9 @@ class ExecutionContext final {
 
     [[nodiscard]] auto getOrCreateDevice(std::string_view rtd_lib, std::string_view rtd_name,
                                          std::string_view rtd_kwargs)
-        -> const std::shared_ptr<RTDevice> &
+        -> std::shared_ptr<RTDevice>
     {
+        // Devices are returned by value, since concurrent insertions may reallocate the pool.
         std::lock_guard<std::mutex> lock(pool_mu);
 
         auto device = std::make_shared<RTDevice>(rtd_lib, rtd_name, rtd_kwargs);
@@ -317,13 +318,13 @@ class ExecutionContext final {
     [[nodiscard]] auto getOrCreateDevice(const std::string &rtd_lib,
                                          const std::string &rtd_name = {},
                                          const std::string &rtd_kwargs = {})
-        -> const std::shared_ptr<RTDevice> &
+        -> std::shared_ptr<RTDevice>
     {
         return getOrCreateDevice(std::string_view{rtd_lib}, std::string_view{rtd_name},
                                  std::string_view{rtd_kwargs});
     }
 
-    [[nodiscard]] auto getDevice(size_t device_key) -> const std::shared_ptr<RTDevice> &
+    [[nodiscard]] auto getDevice(size_t device_key) -> std::shared_ptr<RTDevice>
     {
         std::lock_guard<std::mutex> lock(pool_mu);
         RT_FAIL_IF(device_key >= device_pool.size(), "Invalid device_key");
@@ -20,6 +20,7 @@
 #include <stdexcept>
 
 #include <memory>
+#include <mutex>
 #include <ostream>
 #include <string_view>
 
@@ -41,6 +42,17 @@ namespace Catalyst::Runtime {
  */
 static std::unique_ptr<ExecutionContext> CTX = nullptr;
 
+/**
+ * @brief Number of active users of the global execution context, which is shared by the
+ * concurrent invocations of compiled programs from different threads.
+ */
+static size_t CTX_USERS = 0;
+
+/**
+ * @brief Mutex to guard the creation and destruction of the global execution context.
+ */
+static std::mutex CTX_MU;
+
 /**
  * @brief Thread local device pointer with internal linkage.
  */
@@ -234,12 +246,23 @@ void __catalyst__rt__print_tensor(OpaqueMemRefT *c_memref, bool printDescriptor)
 
 void __catalyst__rt__fail_cstr(const char *cstr) { RT_FAIL(cstr); }
 
-void __catalyst__rt__initialize() { CTX = std::make_unique<ExecutionContext>(); }
+void __catalyst__rt__initialize()
+{
+    std::lock_guard<std::mutex> lock(CTX_MU);
+    if (CTX_USERS++ == 0) {
+        CTX = std::make_unique<ExecutionContext>();
+    }
+}
 
 void __catalyst__rt__finalize()
 {
     RTD_PTR = nullptr;
-    CTX.reset(nullptr);
+
+    // The context is only destroyed once no other invocation is using it.
+    std::lock_guard<std::mutex> lock(CTX_MU);
+    if (CTX_USERS > 0 && --CTX_USERS == 0) {
+        CTX.reset(nullptr);
+    }
 }
 
 static int __catalyst__rt__device_init__impl(int8_t *rtd_lib, int8_t *rtd_name, int8_t *rtd_kwargs)